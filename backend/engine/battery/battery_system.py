@@ -164,6 +164,15 @@ class BatterySystem:
 
         return float(abs(actual_power))
 
+    @property
+    def soc(self) -> float:
+        """Current state of charge in [0, 1].
+
+        Cheap alternative to ``get_state()["soc"]`` for per-hour dispatch
+        loops: it neither builds a dict nor re-runs the degradation model.
+        """
+        return self._soc_tracker.get_soc()
+
     def get_state(self) -> Dict[str, float]:
         """Return a snapshot of the current battery state.
 
@@ -16,8 +16,15 @@ Reference:
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+# Beyond this value of k*t, exp(-k*t) < 1e-13 and is treated as zero
+# (steady-state: the bound well has fully equilibrated with the available
+# well over the discharge duration).
+_KT_STEADY_STATE = 30.0
+
 
 class KiBaMModel:
     """Kinetic Battery Model with two-well capacity representation.
@@ -58,6 +65,11 @@ class KiBaMModel:
         At high C-rates the available well depletes before the bound well
         can replenish it, so usable capacity is less than ``q_max``.
 
+        For long discharges (``k * duration > 30``) the transient term
+        ``exp(-k * t)`` is below 1e-13 and is taken as exactly zero, which
+        skips the exponential evaluation without a measurable change in
+        the result.
+
         Parameters
         ----------
         discharge_rate : float
@@ -85,7 +97,11 @@ class KiBaMModel:
         q1_0 = c * q_max
         q2_0 = (1.0 - c) * q_max
 
-        exp_term = np.exp(-k * t)
+        kt = k * t
+        if kt > _KT_STEADY_STATE:
+            exp_term = 0.0
+        else:
+            exp_term = math.exp(-kt)
 
         # Maximum extractable energy (Manwell & McGowan, Eq. 6):
         #   q_available = (q1_0 * exp(-kt) + q2_0 * k*c*t
@@ -6,16 +6,80 @@ Available strategies:
 * **cycle_charging** -- Generator at full capacity when triggered by low SOC.
 * **combined** -- Adaptive switching between load-following and cycle-charging.
 * **optimal** -- LP-based cost minimisation using the HiGHS solver.
+  ``BatteryParams`` / ``GeneratorParams`` / ``GridParams`` are prebuilt
+  alternatives to its config dicts.
+
+The ``*_batch`` variants run a rule-based strategy over many independent
+scenarios in parallel.  Call ``warm_up()`` at process start to compile the
+shared hour-loop kernel before the first request needs it.
+``KERNEL_BACKEND`` reports whether that kernel is numba-compiled
+(``"numba"``) or plain Python (``"python"``).
+
+Strategies are imported lazily on first attribute access (PEP 562) so that
+using one strategy does not pay the import cost of the others.
 """
 
-from .load_following import dispatch_load_following
-from .cycle_charging import dispatch_cycle_charging
-from .combined import dispatch_combined
-from .optimal import dispatch_optimal
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._kernel import KERNEL_BACKEND, warm_up
+    from .batch import (
+        BatchScenarioResult,
+        dispatch_combined_batch,
+        dispatch_cycle_charging_batch,
+        dispatch_load_following_batch,
+    )
+    from .combined import dispatch_combined
+    from .cycle_charging import dispatch_cycle_charging
+    from .load_following import dispatch_load_following
+    from .optimal import BatteryParams, GeneratorParams, GridParams, dispatch_optimal
+
+# Public name -> submodule that defines it.
+_LAZY_IMPORTS: dict[str, str] = {
+    "dispatch_load_following": "load_following",
+    "dispatch_cycle_charging": "cycle_charging",
+    "dispatch_combined": "combined",
+    "dispatch_optimal": "optimal",
+    "BatteryParams": "optimal",
+    "GeneratorParams": "optimal",
+    "GridParams": "optimal",
+    "dispatch_load_following_batch": "batch",
+    "dispatch_cycle_charging_batch": "batch",
+    "dispatch_combined_batch": "batch",
+    "BatchScenarioResult": "batch",
+    "warm_up": "_kernel",
+    "KERNEL_BACKEND": "_kernel",
+}
 
 __all__ = [
     "dispatch_load_following",
     "dispatch_cycle_charging",
     "dispatch_combined",
     "dispatch_optimal",
+    "BatteryParams",
+    "GeneratorParams",
+    "GridParams",
+    "dispatch_load_following_batch",
+    "dispatch_cycle_charging_batch",
+    "dispatch_combined_batch",
+    "BatchScenarioResult",
+    "warm_up",
+    "KERNEL_BACKEND",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
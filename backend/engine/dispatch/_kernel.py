@@ -0,0 +1,870 @@
+"""Compiled hour-loop kernel shared by the rule-based dispatch strategies.
+
+The public strategies (:func:`dispatch_load_following`,
+:func:`dispatch_cycle_charging`, :func:`dispatch_combined`) operate on
+:class:`BatterySystem`, :class:`DieselGenerator` and
+:class:`GridConnection` objects.  Calling their methods once or twice per
+hour for 8760 hours is dominated by interpreter overhead, so the hour loop
+lives here instead, working purely on scalar floats and NumPy arrays:
+
+1. ``_pack_*`` copies component parameters and state into flat arrays.
+2. :func:`_dispatch_kernel` runs the whole year, specialised by
+   :func:`_specialised_kernel` for the components actually present.
+3. ``_store_*`` writes the final state back onto the component objects so
+   that accumulators (throughput, fuel, import totals, ...) match what the
+   object-based loop would have produced.
+
+The scalar helpers mirror :meth:`KiBaMModel.max_charge_power`,
+:meth:`SOCTracker.step`, :meth:`DieselGenerator.simulate_hour` and
+:meth:`GridConnection.import_power` / ``export_power`` operation for
+operation, so results are bit-identical to the object methods.
+
+All three strategies enter through :func:`_dispatch_core`, which selects
+the strategy with an integer so that one kernel serves every public API.
+
+When ``numba`` is installed the kernel is JIT-compiled (and cached on
+disk); otherwise the same code runs as plain Python.  ``KERNEL_BACKEND``
+records which one is active (``"numba"`` or ``"python"``).  Systems with
+no battery and no generator never enter the hour loop at all (see
+:func:`_dispatch_stateless`), so they are fast on either backend.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from engine.battery.battery_system import BatterySystem
+from engine.generator.diesel_generator import DieselGenerator
+from engine.grid.grid_connection import GridConnection, _running_total
+
+try:
+    from numba import njit
+
+    KERNEL_BACKEND = "numba"
+except ImportError:  # pragma: no cover – numba is optional
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for :func:`numba.njit` when numba is absent."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    KERNEL_BACKEND = "python"
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+HOURS_PER_YEAR = 8760
+
+_MONTH_START_HOURS = np.array(
+    [0, 744, 1416, 2160, 2880, 3624, 4344, 5088, 5832, 6552, 7296, 8016],
+    dtype=np.int64,
+)
+
+# Month (1-12) and hour of day (0-23) for every hour of the year, so the
+# per-hour conversion is an array index rather than a searchsorted call.
+_MONTH_OF_HOUR = np.repeat(
+    np.arange(1, 13, dtype=np.int8),
+    np.diff(np.r_[_MONTH_START_HOURS, HOURS_PER_YEAR]),
+)
+_HOD_OF_HOUR = np.tile(np.arange(24, dtype=np.int8), HOURS_PER_YEAR // 24)
+
+# Compilation flags shared by every jitted function below.  Only the
+# fast-math flags that cannot change a finite result are enabled (no
+# reassociation, FMA contraction or reciprocal approximation), so the
+# kernel stays bit-identical to the object methods it mirrors; inputs are
+# checked to be finite in _dispatch_core.
+_JIT_OPTIONS = dict(
+    cache=True,
+    fastmath={"nsz", "ninf", "nnan"},
+    boundscheck=False,
+    error_model="numpy",
+)
+
+# Strategy selector.
+STRATEGY_LOAD_FOLLOWING = 0
+STRATEGY_CYCLE_CHARGING = 1
+STRATEGY_COMBINED = 2
+
+# Per-hour dispatch mode, as reported in ``dispatch_mode``.
+MODE_LOAD_FOLLOWING = 0
+MODE_CYCLE_CHARGING = 1
+
+# Rows of the (_N_OUT, 8760) output buffer written by the kernel.
+_OUT_BATTERY_POWER = 0
+_OUT_BATTERY_SOC = 1
+_OUT_GENERATOR_OUTPUT = 2
+_OUT_GRID_IMPORT = 3
+_OUT_GRID_EXPORT = 4
+_OUT_EXCESS = 5
+_OUT_UNMET = 6
+_N_OUT = 7
+
+_OUTPUT_ROWS = {
+    "battery_power": _OUT_BATTERY_POWER,
+    "battery_soc": _OUT_BATTERY_SOC,
+    "generator_output": _OUT_GENERATOR_OUTPUT,
+    "grid_import": _OUT_GRID_IMPORT,
+    "grid_export": _OUT_GRID_EXPORT,
+    "excess": _OUT_EXCESS,
+    "unmet": _OUT_UNMET,
+}
+
+# Battery parameter vector layout.
+_B_CAPACITY = 0
+_B_MAX_CHARGE = 1
+_B_MAX_DISCHARGE = 2
+_B_ETA_ONE_WAY = 3
+_B_MIN_SOC = 4
+_B_MAX_SOC = 5
+_B_KIBAM_C = 6
+_B_KIBAM_K = 7
+_N_BATTERY_PARAMS = 8
+
+# Battery state vector layout.
+_BS_SOC = 0
+_BS_THROUGHPUT = 1
+_BS_ELAPSED_YEARS = 2
+_N_BATTERY_STATE = 3
+
+# Generator parameter vector layout.
+_G_RATED = 0
+_G_MIN_POWER = 1
+_G_A0 = 2
+_G_A1 = 3
+_N_GENERATOR_PARAMS = 4
+
+# Generator state vector layout.
+_GS_RUNNING_HOURS = 0
+_GS_FUEL = 1
+_GS_STARTS = 2
+_N_GENERATOR_STATE = 3
+
+# Grid parameter vector layout.
+_GR_MAX_IMPORT = 0
+_GR_MAX_EXPORT = 1
+_GR_SELL_BACK = 2
+_N_GRID_PARAMS = 3
+
+# Grid scalar state vector layout.
+_GRS_IMPORT_KWH = 0
+_GRS_EXPORT_KWH = 1
+_GRS_COST = 2
+_N_GRID_STATE = 3
+
+
+def _hour_to_month_and_hod(hour_of_year: int) -> tuple[int, int]:
+    """Convert hour-of-year (0-8759) to (month 1-12, hour_of_day 0-23)."""
+    return int(_MONTH_OF_HOUR[hour_of_year]), int(_HOD_OF_HOUR[hour_of_year])
+
+
+# ---------------------------------------------------------------------------
+# Scalar component models
+# ---------------------------------------------------------------------------
+
+
+@njit(**_JIT_OPTIONS)
+def _clip(x: float, lo: float, hi: float) -> float:
+    if x < lo:
+        return lo
+    if x > hi:
+        return hi
+    return x
+
+
+@njit(**_JIT_OPTIONS)
+def _battery_charge(bp: NDArray, bs: NDArray, power_kw: float) -> float:
+    """Scalar equivalent of :meth:`BatterySystem.charge` (dt = 1 h)."""
+    cap = bp[_B_CAPACITY]
+    max_rate = bp[_B_MAX_CHARGE]
+    eta = bp[_B_ETA_ONE_WAY]
+    c = bp[_B_KIBAM_C]
+    k = bp[_B_KIBAM_K]
+    soc = bs[_BS_SOC]
+
+    # KiBaM charge limit.
+    s = _clip(soc, 0.0, 1.0)
+    if s >= 1.0:
+        kibam_limit = 0.0
+    else:
+        q_total = s * cap
+        q1 = c * q_total
+        q2 = (1.0 - c) * q_total
+        q1_room = c * cap - q1
+        conductance_flow = k * (q1 / c - q2 / (1.0 - c))
+        kinetic = q1_room * k / c + conductance_flow
+        if kinetic < 0.0:
+            kinetic = 0.0
+        if s < 0.85:
+            soc_limit = max_rate
+        else:
+            soc_limit = max_rate * (1.0 - s) / (1.0 - 0.85)
+        kibam_limit = min(max_rate, kinetic, soc_limit)
+
+    clamped = min(abs(power_kw), max_rate, kibam_limit)
+
+    # SOC tracker (charging branch).
+    energy_stored = clamped * 1.0 * eta
+    room_kwh = (bp[_B_MAX_SOC] - soc) * cap
+    if energy_stored > room_kwh:
+        energy_stored = room_kwh
+    soc = _clip(soc + energy_stored / cap, bp[_B_MIN_SOC], bp[_B_MAX_SOC])
+    if eta > 0:
+        actual = energy_stored / (1.0 * eta)
+    else:
+        actual = 0.0
+
+    bs[_BS_SOC] = soc
+    bs[_BS_THROUGHPUT] += abs(actual) * 1.0
+    bs[_BS_ELAPSED_YEARS] += 1.0 / 8760.0
+    return abs(actual)
+
+
+@njit(**_JIT_OPTIONS)
+def _battery_discharge(bp: NDArray, bs: NDArray, power_kw: float) -> float:
+    """Scalar equivalent of :meth:`BatterySystem.discharge` (dt = 1 h)."""
+    cap = bp[_B_CAPACITY]
+    max_rate = bp[_B_MAX_DISCHARGE]
+    eta = bp[_B_ETA_ONE_WAY]
+    c = bp[_B_KIBAM_C]
+    k = bp[_B_KIBAM_K]
+    soc = bs[_BS_SOC]
+
+    # KiBaM discharge limit.
+    s = _clip(soc, 0.0, 1.0)
+    if s <= 0.0:
+        kibam_limit = 0.0
+    else:
+        q_total = s * cap
+        q1 = c * q_total
+        q2 = (1.0 - c) * q_total
+        conductance_flow = k * (q2 / (1.0 - c) - q1 / c)
+        if conductance_flow < 0.0:
+            conductance_flow = 0.0
+        kinetic = q1 * k / c + conductance_flow
+        if kinetic < 0.0:
+            kinetic = 0.0
+        if s > 0.15:
+            soc_limit = max_rate
+        else:
+            soc_limit = max_rate * s / 0.15
+        kibam_limit = min(max_rate, kinetic, soc_limit)
+
+    clamped = min(abs(power_kw), max_rate, kibam_limit)
+
+    # SOC tracker (discharging branch).  A zero request leaves SOC as-is.
+    energy_internal = clamped * 1.0 / eta
+    available_kwh = (soc - bp[_B_MIN_SOC]) * cap
+    if energy_internal > available_kwh:
+        energy_internal = available_kwh
+    soc = _clip(soc - energy_internal / cap, bp[_B_MIN_SOC], bp[_B_MAX_SOC])
+    actual = energy_internal * eta / 1.0
+
+    bs[_BS_SOC] = soc
+    bs[_BS_THROUGHPUT] += abs(actual) * 1.0
+    bs[_BS_ELAPSED_YEARS] += 1.0 / 8760.0
+    return abs(actual)
+
+
+@njit(**_JIT_OPTIONS)
+def _generator_run(gp: NDArray, gs: NDArray, request_kw: float, was_running: bool) -> float:
+    """Scalar equivalent of :meth:`DieselGenerator.simulate_hour`.
+
+    Only called with ``request_kw > 0``; returns the electrical output.
+    """
+    if not was_running:
+        gs[_GS_STARTS] += 1.0
+
+    if request_kw < gp[_G_MIN_POWER]:
+        actual_kw = gp[_G_MIN_POWER]
+    elif request_kw > gp[_G_RATED]:
+        actual_kw = gp[_G_RATED]
+    else:
+        actual_kw = request_kw
+
+    fuel_l = gp[_G_A0] * gp[_G_RATED] + gp[_G_A1] * min(actual_kw, gp[_G_RATED])
+
+    gs[_GS_RUNNING_HOURS] += 1.0
+    gs[_GS_FUEL] += fuel_l
+    return actual_kw
+
+
+@njit(**_JIT_OPTIONS)
+def _grid_import(
+    rp: NDArray,
+    rs: NDArray,
+    monthly_import: NDArray,
+    monthly_peaks: NDArray,
+    kw_needed: float,
+    price: float,
+    month_idx: int,
+) -> float:
+    """Scalar equivalent of :meth:`GridConnection.import_power`."""
+    if kw_needed <= 0:
+        return 0.0
+    actual_kw = min(kw_needed, rp[_GR_MAX_IMPORT])
+    cost = actual_kw * price
+    rs[_GRS_IMPORT_KWH] += actual_kw
+    rs[_GRS_COST] += cost
+    monthly_import[month_idx] += actual_kw
+    if actual_kw > monthly_peaks[month_idx]:
+        monthly_peaks[month_idx] = actual_kw
+    return actual_kw
+
+
+@njit(**_JIT_OPTIONS)
+def _grid_export(
+    rp: NDArray,
+    rs: NDArray,
+    monthly_export: NDArray,
+    kw_excess: float,
+    price: float,
+    month_idx: int,
+) -> float:
+    """Scalar equivalent of :meth:`GridConnection.export_power`."""
+    if kw_excess <= 0 or rp[_GR_SELL_BACK] == 0.0:
+        return 0.0
+    actual_kw = min(kw_excess, rp[_GR_MAX_EXPORT])
+    revenue = actual_kw * price
+    rs[_GRS_EXPORT_KWH] += actual_kw
+    rs[_GRS_COST] -= revenue
+    monthly_export[month_idx] += actual_kw
+    return actual_kw
+
+
+# ---------------------------------------------------------------------------
+# Hour loop
+# ---------------------------------------------------------------------------
+
+
+@njit(inline="always", **_JIT_OPTIONS)
+def _dispatch_kernel(
+    net_kw: NDArray,
+    strategy: int,
+    soc_low: float,
+    soc_high: float,
+    has_batt: bool,
+    bp: NDArray,
+    bs: NDArray,
+    has_gen: bool,
+    gp: NDArray,
+    gs: NDArray,
+    has_grid: bool,
+    rp: NDArray,
+    rs: NDArray,
+    import_price: NDArray,
+    export_price: NDArray,
+    month_idx: NDArray,
+    monthly_import: NDArray,
+    monthly_export: NDArray,
+    monthly_peaks: NDArray,
+    out: NDArray,
+    dispatch_mode: NDArray,
+    battery_called: NDArray,
+) -> bool:
+    """Run the 8760-hour rule-based dispatch.  Returns final gen state.
+
+    ``net_kw`` is RE output minus load (positive = surplus).
+    ``strategy`` selects load-following (0), cycle-charging (1, with
+    ``soc_high`` as the SOC threshold) or combined (2, switching to
+    cycle-charging below ``soc_low`` and back above ``soc_high``).
+    Hourly results are written into the rows of ``out`` (see ``_OUT_*``)
+    and the int8 ``dispatch_mode`` array.
+    ``battery_called`` flags the hours in which the battery was charged or
+    discharged, so the caller can rebuild the battery's SOC history.
+
+    Not called directly: see :func:`_specialised_kernel`.
+    """
+    gen_was_running = False
+    if strategy == STRATEGY_CYCLE_CHARGING:
+        mode = MODE_CYCLE_CHARGING
+    else:
+        mode = MODE_LOAD_FOLLOWING
+    rated = gp[_G_RATED]
+
+    for t in range(net_kw.shape[0]):
+        net = net_kw[t]
+        m = month_idx[t]
+
+        if has_batt:
+            current_soc = bs[_BS_SOC]
+        else:
+            current_soc = 1.0
+
+        # --- Mode transition logic (hysteresis) ----------------------------
+        if strategy == STRATEGY_COMBINED and has_batt:
+            if mode == MODE_LOAD_FOLLOWING and current_soc < soc_low:
+                mode = MODE_CYCLE_CHARGING
+            elif mode == MODE_CYCLE_CHARGING and current_soc >= soc_high:
+                mode = MODE_LOAD_FOLLOWING
+        dispatch_mode[t] = mode
+
+        if mode == MODE_LOAD_FOLLOWING:
+            # ----- Load following ------------------------------------------
+            # Surplus and deficit share one straight-line body: at most one
+            # of them is non-zero, so each component is reached from one
+            # side only and is never called with zero power.
+            surplus = net if net > 0.0 else 0.0
+            deficit = -net if net < 0.0 else 0.0
+            if has_batt:
+                if surplus > 0:
+                    accepted = _battery_charge(bp, bs, surplus)
+                    battery_called[t] = True
+                    surplus -= accepted
+                    out[_OUT_BATTERY_POWER, t] = -accepted
+                elif deficit > 0:
+                    delivered = _battery_discharge(bp, bs, deficit)
+                    battery_called[t] = True
+                    out[_OUT_BATTERY_POWER, t] = delivered
+                    deficit -= delivered
+            if has_gen:
+                if deficit > 0:
+                    gen_kw = _generator_run(gp, gs, deficit, gen_was_running)
+                    gen_was_running = True
+                    out[_OUT_GENERATOR_OUTPUT, t] = gen_kw
+                    deficit -= gen_kw
+                elif net >= 0:
+                    gen_was_running = False
+            if has_grid:
+                if surplus > 0:
+                    exported = _grid_export(
+                        rp, rs, monthly_export, surplus, export_price[t], m
+                    )
+                    out[_OUT_GRID_EXPORT, t] = exported
+                    surplus -= exported
+                elif deficit > 0:
+                    imported = _grid_import(
+                        rp, rs, monthly_import, monthly_peaks,
+                        deficit, import_price[t], m,
+                    )
+                    out[_OUT_GRID_IMPORT, t] = imported
+                    deficit -= imported
+            out[_OUT_EXCESS, t] = surplus if surplus > 0.0 else 0.0
+            out[_OUT_UNMET, t] = deficit if deficit > 0.0 else 0.0
+        else:
+            # ----- Cycle charging ------------------------------------------
+            if net >= 0:
+                surplus = net
+                if has_gen and gen_was_running and current_soc < soc_high:
+                    gen_kw = _generator_run(gp, gs, rated, gen_was_running)
+                    gen_was_running = True
+                    out[_OUT_GENERATOR_OUTPUT, t] = gen_kw
+                    surplus += gen_kw
+                elif has_gen and gen_was_running:
+                    gen_was_running = False
+                if has_batt and surplus > 0:
+                    accepted = _battery_charge(bp, bs, surplus)
+                    battery_called[t] = True
+                    surplus -= accepted
+                    out[_OUT_BATTERY_POWER, t] = -accepted
+                if has_grid and surplus > 0:
+                    exported = _grid_export(
+                        rp, rs, monthly_export, surplus, export_price[t], m
+                    )
+                    out[_OUT_GRID_EXPORT, t] = exported
+                    surplus -= exported
+                out[_OUT_EXCESS, t] = surplus if surplus > 0.0 else 0.0
+            else:
+                deficit = -net
+                run_gen = (
+                    has_gen
+                    and (current_soc < soc_high or gen_was_running)
+                    and deficit > 0
+                )
+                if run_gen:
+                    gen_kw = _generator_run(gp, gs, rated, gen_was_running)
+                    gen_was_running = True
+                    out[_OUT_GENERATOR_OUTPUT, t] = gen_kw
+                    gen_surplus = gen_kw - deficit
+                    if gen_surplus > 0:
+                        deficit = 0.0
+                        if has_batt and gen_surplus > 0:
+                            accepted = _battery_charge(bp, bs, gen_surplus)
+                            battery_called[t] = True
+                            gen_surplus -= accepted
+                            out[_OUT_BATTERY_POWER, t] = -accepted
+                        if has_grid and gen_surplus > 0:
+                            exported = _grid_export(
+                                rp, rs, monthly_export,
+                                gen_surplus, export_price[t], m,
+                            )
+                            out[_OUT_GRID_EXPORT, t] = exported
+                            gen_surplus -= exported
+                        out[_OUT_EXCESS, t] = gen_surplus if gen_surplus > 0.0 else 0.0
+                    else:
+                        deficit -= gen_kw
+                elif has_gen and gen_was_running:
+                    gen_was_running = False
+                if has_batt and deficit > 0:
+                    delivered = _battery_discharge(bp, bs, deficit)
+                    battery_called[t] = True
+                    out[_OUT_BATTERY_POWER, t] += delivered
+                    deficit -= delivered
+                if has_grid and deficit > 0:
+                    imported = _grid_import(
+                        rp, rs, monthly_import, monthly_peaks,
+                        deficit, import_price[t], m,
+                    )
+                    out[_OUT_GRID_IMPORT, t] = imported
+                    deficit -= imported
+                out[_OUT_UNMET, t] = deficit if deficit > 0.0 else 0.0
+
+        if has_batt:
+            out[_OUT_BATTERY_SOC, t] = bs[_BS_SOC]
+
+    return gen_was_running
+
+
+@functools.cache
+def _specialised_kernel(has_batt: bool, has_gen: bool, has_grid: bool):
+    """Return :func:`_dispatch_kernel` specialised for one set of components.
+
+    Component presence is loop-invariant, so it is bound here as a closure
+    constant instead of being tested every hour.  Under numba the kernel
+    body is inlined into the wrapper and the branches for absent
+    components are folded away; each of the eight variants is compiled
+    (and cached on disk) on first use.  The compiled kernel releases the
+    GIL so independent runs can proceed in parallel threads.
+    """
+
+    @njit(nogil=True, **_JIT_OPTIONS)
+    def kernel(
+        net_kw, strategy, soc_low, soc_high,
+        bp, bs, gp, gs, rp, rs,
+        import_price, export_price, month_idx,
+        monthly_import, monthly_export, monthly_peaks,
+        out, dispatch_mode, battery_called,
+    ):
+        return _dispatch_kernel(
+            net_kw, strategy, soc_low, soc_high,
+            has_batt, bp, bs,
+            has_gen, gp, gs,
+            has_grid, rp, rs,
+            import_price, export_price, month_idx,
+            monthly_import, monthly_export, monthly_peaks,
+            out, dispatch_mode, battery_called,
+        )
+
+    return kernel
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel specialisation.
+
+    Under numba the first dispatch for each component combination pays a
+    one-off compilation cost -- about a second from cold, less when the
+    cache is warm.  Calling this once at process start, e.g. from a worker
+    initialiser, moves that cost out of the first user-facing request.
+    Without numba it just runs eight one-hour no-op dispatches.
+    """
+    for has_batt, has_gen, has_grid in itertools.product((False, True), repeat=3):
+        # A single hour with zero net load: no component is ever called.
+        _specialised_kernel(has_batt, has_gen, has_grid)(
+            np.zeros(1), STRATEGY_LOAD_FOLLOWING, 0.0, 0.0,
+            np.zeros(_N_BATTERY_PARAMS), np.zeros(_N_BATTERY_STATE),
+            np.zeros(_N_GENERATOR_PARAMS), np.zeros(_N_GENERATOR_STATE),
+            np.zeros(_N_GRID_PARAMS), np.zeros(_N_GRID_STATE),
+            np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64),
+            np.zeros(12), np.zeros(12), np.zeros(12),
+            np.zeros((_N_OUT, 1)), np.zeros(1, dtype=np.int8),
+            np.zeros(1, dtype=np.bool_),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Vectorised path (no battery, no generator)
+# ---------------------------------------------------------------------------
+
+
+def _dispatch_stateless(
+    net_kw: NDArray,
+    has_grid: bool,
+    rp: NDArray,
+    rs: NDArray,
+    import_price: NDArray,
+    export_price: NDArray,
+    monthly_import: NDArray,
+    monthly_export: NDArray,
+    monthly_peaks: NDArray,
+    out: NDArray,
+) -> None:
+    """Whole-year dispatch with NumPy array operations, for systems with no
+    battery and no generator.
+
+    Every strategy then reduces to: export the surplus up to the export
+    limit, import the deficit up to the import limit.  No state links one
+    hour to the next.  Grid accumulators are updated exactly as
+    :func:`_grid_import` / :func:`_grid_export` would update them.
+    """
+    surplus = np.where(net_kw > 0.0, net_kw, 0.0)
+    deficit = np.where(net_kw < 0.0, -net_kw, 0.0)
+
+    if has_grid:
+        if rp[_GR_SELL_BACK] != 0.0:
+            exported = np.minimum(surplus, rp[_GR_MAX_EXPORT])
+        else:
+            exported = np.zeros_like(surplus)
+        imported = np.minimum(deficit, rp[_GR_MAX_IMPORT])
+        out[_OUT_GRID_EXPORT] = exported
+        out[_OUT_GRID_IMPORT] = imported
+        surplus -= exported
+        deficit -= imported
+
+        # In any hour at most one of the two terms is non-zero.
+        cost = imported * import_price - exported * export_price
+        rs[_GRS_IMPORT_KWH] = _running_total(rs[_GRS_IMPORT_KWH], imported)
+        rs[_GRS_EXPORT_KWH] = _running_total(rs[_GRS_EXPORT_KWH], exported)
+        rs[_GRS_COST] = _running_total(rs[_GRS_COST], cost)
+
+        bounds = np.r_[_MONTH_START_HOURS, HOURS_PER_YEAR]
+        for m in range(12):
+            month = slice(bounds[m], bounds[m + 1])
+            monthly_import[m] = _running_total(monthly_import[m], imported[month])
+            monthly_export[m] = _running_total(monthly_export[m], exported[month])
+            monthly_peaks[m] = max(monthly_peaks[m], imported[month].max())
+
+    out[_OUT_EXCESS] = surplus
+    out[_OUT_UNMET] = deficit
+
+
+# ---------------------------------------------------------------------------
+# Python-side packing / unpacking
+# ---------------------------------------------------------------------------
+
+
+def _pack_battery(battery: Optional[BatterySystem]) -> tuple[NDArray, NDArray]:
+    """Flatten battery parameters and state for the kernel."""
+    bp = np.zeros(_N_BATTERY_PARAMS, dtype=np.float64)
+    bs = np.zeros(_N_BATTERY_STATE, dtype=np.float64)
+    if battery is None:
+        return bp, bs
+
+    tracker = battery._soc_tracker
+    bp[_B_CAPACITY] = tracker.capacity_kwh
+    bp[_B_MAX_CHARGE] = battery.max_charge_kw
+    bp[_B_MAX_DISCHARGE] = battery.max_discharge_kw
+    bp[_B_ETA_ONE_WAY] = tracker._eta_one_way
+    bp[_B_MIN_SOC] = tracker.min_soc
+    bp[_B_MAX_SOC] = tracker.max_soc
+    bp[_B_KIBAM_C] = battery._kibam.c
+    bp[_B_KIBAM_K] = battery._kibam.k
+
+    bs[_BS_SOC] = battery.soc
+    bs[_BS_THROUGHPUT] = battery._throughput_kwh
+    bs[_BS_ELAPSED_YEARS] = battery._elapsed_years
+    return bp, bs
+
+
+def _store_battery(
+    battery: Optional[BatterySystem],
+    bs: NDArray,
+    battery_soc: NDArray,
+    battery_called: NDArray,
+) -> None:
+    """Write the kernel's final battery state back onto *battery*."""
+    if battery is None:
+        return
+    battery._soc_tracker._soc = float(bs[_BS_SOC])
+    battery._throughput_kwh = float(bs[_BS_THROUGHPUT])
+    battery._elapsed_years = float(bs[_BS_ELAPSED_YEARS])
+    # At most one charge/discharge call happens per hour; the object
+    # model appends the post-call SOC to its history on each call.
+    battery._soc_history.extend(battery_soc[battery_called].tolist())
+
+
+def _pack_generator(generator: Optional[DieselGenerator]) -> tuple[NDArray, NDArray]:
+    """Flatten generator parameters and accumulators for the kernel."""
+    gp = np.zeros(_N_GENERATOR_PARAMS, dtype=np.float64)
+    gs = np.zeros(_N_GENERATOR_STATE, dtype=np.float64)
+    if generator is None:
+        return gp, gs
+
+    gp[_G_RATED] = generator.rated_power_kw
+    gp[_G_MIN_POWER] = generator.min_power_kw
+    gp[_G_A0] = generator.fuel_curve.a0
+    gp[_G_A1] = generator.fuel_curve.a1
+
+    gs[_GS_RUNNING_HOURS] = generator.running_hours
+    gs[_GS_FUEL] = generator.fuel_consumed_total
+    gs[_GS_STARTS] = generator.starts_count
+    return gp, gs
+
+
+def _store_generator(
+    generator: Optional[DieselGenerator], gs: NDArray, is_running: bool
+) -> None:
+    """Write the kernel's generator accumulators back onto *generator*."""
+    if generator is None:
+        return
+    generator.running_hours = float(gs[_GS_RUNNING_HOURS])
+    generator.fuel_consumed_total = float(gs[_GS_FUEL])
+    generator.starts_count = int(gs[_GS_STARTS])
+    generator._is_running = bool(is_running)
+
+
+def _pack_grid(
+    grid: Optional[GridConnection],
+) -> tuple[NDArray, NDArray, NDArray, NDArray, NDArray]:
+    """Flatten grid limits and per-hour prices for the kernel.
+
+    Returns ``(params, state, import_price, export_price, month_idx)``.
+    """
+    rp = np.zeros(_N_GRID_PARAMS, dtype=np.float64)
+    rs = np.zeros(_N_GRID_STATE, dtype=np.float64)
+    month_idx = _MONTH_OF_HOUR.astype(np.int64) - 1
+
+    if grid is None:
+        import_price = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
+        export_price = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
+    else:
+        import_price, export_price = grid.precompute_tariffs(
+            _HOD_OF_HOUR, _MONTH_OF_HOUR
+        )
+
+        rp[_GR_MAX_IMPORT] = grid.max_import_kw
+        rp[_GR_MAX_EXPORT] = grid.max_export_kw
+        rp[_GR_SELL_BACK] = 1.0 if grid.sell_back_enabled else 0.0
+        rs[_GRS_IMPORT_KWH] = grid.total_import_kwh
+        rs[_GRS_EXPORT_KWH] = grid.total_export_kwh
+        rs[_GRS_COST] = grid.total_cost
+
+    return rp, rs, import_price, export_price, month_idx
+
+
+def _store_grid(
+    grid: Optional[GridConnection],
+    rs: NDArray,
+    monthly_import: NDArray,
+    monthly_export: NDArray,
+    monthly_peaks: NDArray,
+) -> None:
+    """Write the kernel's grid accumulators back onto *grid*."""
+    if grid is None:
+        return
+    grid.total_import_kwh = float(rs[_GRS_IMPORT_KWH])
+    grid.total_export_kwh = float(rs[_GRS_EXPORT_KWH])
+    grid.total_cost = float(rs[_GRS_COST])
+    grid._monthly_import_kwh = monthly_import
+    grid._monthly_export_kwh = monthly_export
+    grid.monthly_peaks = monthly_peaks
+    if grid.demand_charge is not None:
+        grid.demand_charge.record_demand_series(monthly_peaks, np.arange(1, 13))
+
+
+def run_dispatch(
+    load_kw: NDArray[np.floating],
+    re_output_kw: NDArray[np.floating],
+    battery: Optional[BatterySystem],
+    generator: Optional[DieselGenerator],
+    grid: Optional[GridConnection],
+    strategy: int,
+    soc_low: float = 0.0,
+    soc_high: float = 0.0,
+) -> dict[str, NDArray]:
+    """Pack components, run the dispatch kernel, and unpack results.
+
+    Inputs must already be validated numeric arrays of shape (8760,) and
+    the components must already have been reset by the caller.
+    """
+    net_kw = np.subtract(re_output_kw, load_kw, dtype=np.float64)
+    bp, bs = _pack_battery(battery)
+    gp, gs = _pack_generator(generator)
+    rp, rs, import_price, export_price, month_idx = _pack_grid(grid)
+
+    monthly_import = np.zeros(12, dtype=np.float64)
+    monthly_export = np.zeros(12, dtype=np.float64)
+    monthly_peaks = np.zeros(12, dtype=np.float64)
+    if grid is not None:
+        monthly_import[:] = grid._monthly_import_kwh
+        monthly_export[:] = grid._monthly_export_kwh
+        monthly_peaks[:] = grid.monthly_peaks
+
+    out = np.zeros((_N_OUT, HOURS_PER_YEAR), dtype=np.float64)
+    dispatch_mode = np.zeros(HOURS_PER_YEAR, dtype=np.int8)
+    battery_called = np.zeros(HOURS_PER_YEAR, dtype=np.bool_)
+
+    if battery is None and generator is None:
+        # Nothing carries over from one hour to the next: no loop needed.
+        _dispatch_stateless(
+            net_kw, grid is not None, rp, rs, import_price, export_price,
+            monthly_import, monthly_export, monthly_peaks, out,
+        )
+        if strategy == STRATEGY_CYCLE_CHARGING:
+            dispatch_mode[:] = MODE_CYCLE_CHARGING
+        gen_running = False
+    else:
+        kernel = _specialised_kernel(
+            battery is not None, generator is not None, grid is not None
+        )
+        gen_running = kernel(
+            net_kw,
+            strategy, soc_low, soc_high,
+            bp, bs,
+            gp, gs,
+            rp, rs,
+            import_price, export_price, month_idx,
+            monthly_import, monthly_export, monthly_peaks,
+            out, dispatch_mode, battery_called,
+        )
+
+    _store_battery(battery, bs, out[_OUT_BATTERY_SOC], battery_called)
+    _store_generator(generator, gs, gen_running)
+    _store_grid(grid, rs, monthly_import, monthly_export, monthly_peaks)
+
+    # Rows of the single output buffer, returned as views (no copy).
+    results = {name: out[row] for name, row in _OUTPUT_ROWS.items()}
+    results["dispatch_mode"] = dispatch_mode
+    return results
+
+
+def _dispatch_core(
+    load_kw: NDArray[np.floating],
+    re_output_kw: NDArray[np.floating],
+    battery: Optional[BatterySystem],
+    generator: Optional[DieselGenerator],
+    grid: Optional[GridConnection],
+    strategy: int,
+    soc_low: float = 0.0,
+    soc_high: float = 0.0,
+) -> dict[str, NDArray]:
+    """Shared entry point behind the public rule-based strategies.
+
+    Validates the input series (shape and finiteness), resets the stateful
+    components so results are reproducible, and runs :func:`run_dispatch`.
+    The result includes ``dispatch_mode``; strategies that do not report it
+    drop the key.
+    """
+    # No float64 copy here: only the net series reaches the kernel, and
+    # run_dispatch forms it in float64 straight from float32 (or other
+    # numeric) inputs.
+    load_kw = np.asarray(load_kw)
+    re_output_kw = np.asarray(re_output_kw)
+
+    if load_kw.shape != (HOURS_PER_YEAR,):
+        raise ValueError(
+            f"load_kw must have shape ({HOURS_PER_YEAR},), got {load_kw.shape}"
+        )
+    if re_output_kw.shape != (HOURS_PER_YEAR,):
+        raise ValueError(
+            f"re_output_kw must have shape ({HOURS_PER_YEAR},), "
+            f"got {re_output_kw.shape}"
+        )
+    if not (np.isfinite(load_kw).all() and np.isfinite(re_output_kw).all()):
+        raise ValueError("load_kw and re_output_kw must be finite")
+
+    if generator is not None:
+        generator.reset_accumulators()
+    if grid is not None:
+        grid.reset()
+
+    return run_dispatch(
+        load_kw, re_output_kw, battery, generator, grid,
+        strategy=strategy, soc_low=soc_low, soc_high=soc_high,
+    )
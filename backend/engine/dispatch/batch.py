@@ -0,0 +1,160 @@
+"""Batch execution of the rule-based dispatch strategies.
+
+Capacity-planning and Monte-Carlo studies run the same strategy over many
+independent load / RE scenarios.  The helpers here run one scenario per
+row of the input matrices on a thread pool.
+
+Every scenario gets its own deep copy of the battery, generator and grid
+objects, because dispatch mutates them; the objects passed in act only as
+templates and are left untouched.  When ``numba`` is installed the hour
+loop runs without the GIL, so scenarios execute on separate cores.
+Without it the batch still produces the same results, just serially in
+effect.
+"""
+
+from __future__ import annotations
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from engine.battery.battery_system import BatterySystem
+from engine.generator.diesel_generator import DieselGenerator
+from engine.grid.grid_connection import GridConnection
+
+from .combined import dispatch_combined
+from .cycle_charging import dispatch_cycle_charging
+from .load_following import dispatch_load_following
+
+
+@dataclass
+class BatchScenarioResult:
+    """Outcome of one scenario in a batch run.
+
+    Attributes
+    ----------
+    results : dict[str, ndarray]
+        The strategy's usual result dict.
+    battery, generator, grid
+        The scenario's own component copies, holding its end-of-year state
+        and accumulators (throughput, fuel, import totals, ...).
+    """
+
+    results: dict[str, NDArray]
+    battery: Optional[BatterySystem]
+    generator: Optional[DieselGenerator]
+    grid: Optional[GridConnection]
+
+
+def _run_batch(
+    dispatch_fn: Callable[..., dict[str, NDArray]],
+    load_kw: ArrayLike,
+    re_output_kw: ArrayLike,
+    battery: Optional[BatterySystem],
+    generator: Optional[DieselGenerator],
+    grid: Optional[GridConnection],
+    max_workers: Optional[int],
+    strategy_kwargs: dict[str, Any],
+) -> list[BatchScenarioResult]:
+    loads = np.atleast_2d(np.asarray(load_kw))
+    res = np.atleast_2d(np.asarray(re_output_kw))
+    if loads.ndim != 2 or res.ndim != 2:
+        raise ValueError("load_kw and re_output_kw must be 1-D or 2-D arrays")
+    try:
+        loads, res = np.broadcast_arrays(loads, res)
+    except ValueError as exc:
+        raise ValueError(
+            f"load_kw {loads.shape} and re_output_kw {res.shape} "
+            f"cannot be broadcast together"
+        ) from exc
+
+    # Copy up front on the calling thread; deepcopy is GIL-bound anyway.
+    scenarios = [
+        (copy.deepcopy(battery), copy.deepcopy(generator), copy.deepcopy(grid))
+        for _ in range(loads.shape[0])
+    ]
+
+    def run(i: int) -> BatchScenarioResult:
+        b, g, r = scenarios[i]
+        results = dispatch_fn(loads[i], res[i], b, g, r, **strategy_kwargs)
+        return BatchScenarioResult(results=results, battery=b, generator=g, grid=r)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, range(loads.shape[0])))
+
+
+def dispatch_load_following_batch(
+    load_kw: ArrayLike,
+    re_output_kw: ArrayLike,
+    battery: Optional[BatterySystem] = None,
+    generator: Optional[DieselGenerator] = None,
+    grid: Optional[GridConnection] = None,
+    max_workers: Optional[int] = None,
+) -> list[BatchScenarioResult]:
+    """Run :func:`dispatch_load_following` for every scenario row.
+
+    Parameters
+    ----------
+    load_kw, re_output_kw : array_like, shape (N, 8760) or (8760,)
+        Hourly load and RE output per scenario.  A 1-D array is broadcast
+        against the other input, e.g. one load profile against N RE
+        profiles.
+    battery, generator, grid
+        Component templates, copied for each scenario.
+    max_workers : int or None
+        Thread pool size.  Default ``None`` lets the executor choose.
+
+    Returns
+    -------
+    list[BatchScenarioResult]
+        One entry per scenario, in input order.
+    """
+    return _run_batch(
+        dispatch_load_following, load_kw, re_output_kw,
+        battery, generator, grid, max_workers, {},
+    )
+
+
+def dispatch_cycle_charging_batch(
+    load_kw: ArrayLike,
+    re_output_kw: ArrayLike,
+    battery: Optional[BatterySystem] = None,
+    generator: Optional[DieselGenerator] = None,
+    grid: Optional[GridConnection] = None,
+    soc_threshold: float = 0.80,
+    max_workers: Optional[int] = None,
+) -> list[BatchScenarioResult]:
+    """Run :func:`dispatch_cycle_charging` for every scenario row.
+
+    See :func:`dispatch_load_following_batch` for the batch parameters.
+    """
+    return _run_batch(
+        dispatch_cycle_charging, load_kw, re_output_kw,
+        battery, generator, grid, max_workers,
+        {"soc_threshold": soc_threshold},
+    )
+
+
+def dispatch_combined_batch(
+    load_kw: ArrayLike,
+    re_output_kw: ArrayLike,
+    battery: Optional[BatterySystem] = None,
+    generator: Optional[DieselGenerator] = None,
+    grid: Optional[GridConnection] = None,
+    critical_soc: float = 0.30,
+    recovery_soc: float = 0.70,
+    max_workers: Optional[int] = None,
+) -> list[BatchScenarioResult]:
+    """Run :func:`dispatch_combined` for every scenario row.
+
+    See :func:`dispatch_load_following_batch` for the batch parameters.
+    """
+    return _run_batch(
+        dispatch_combined, load_kw, re_output_kw,
+        battery, generator, grid, max_workers,
+        {"critical_soc": critical_soc, "recovery_soc": recovery_soc},
+    )
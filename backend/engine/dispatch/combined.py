@@ -27,207 +27,31 @@ from engine.battery.battery_system import BatterySystem
 from engine.generator.diesel_generator import DieselGenerator
 from engine.grid.grid_connection import GridConnection
 
-# ---------------------------------------------------------------------------
-# Constants
-# ---------------------------------------------------------------------------
-
-HOURS_PER_YEAR = 8760
-
-_MONTH_START_HOURS = np.array(
-    [0, 744, 1416, 2160, 2880, 3624, 4344, 5088, 5832, 6552, 7296, 8016],
-    dtype=np.int64,
+from ._kernel import (
+    MODE_CYCLE_CHARGING,
+    MODE_LOAD_FOLLOWING,
+    STRATEGY_COMBINED,
+    STRATEGY_LOAD_FOLLOWING,
+    _dispatch_core,
+    _hour_to_month_and_hod,  # noqa: F401 -- re-exported
 )
 
-
-def _hour_to_month_and_hod(hour_of_year: int) -> tuple[int, int]:
-    """Convert hour-of-year (0-8759) to (month 1-12, hour_of_day 0-23)."""
-    month = int(np.searchsorted(_MONTH_START_HOURS, hour_of_year, side="right"))
-    hour_of_day = hour_of_year % 24
-    return month, hour_of_day
-
-
-class _Mode(enum.Enum):
-    """Internal dispatch mode tracker."""
-
-    LOAD_FOLLOWING = "load_following"
-    CYCLE_CHARGING = "cycle_charging"
-
-
 # ---------------------------------------------------------------------------
-# Per-hour dispatch helpers (inline, avoiding function-call overhead)
+# Constants
 # ---------------------------------------------------------------------------
 
+HOURS_PER_YEAR = 8760
 
-def _dispatch_hour_load_following(
-    t: int,
-    net: float,
-    month: int,
-    hod: int,
-    battery: Optional[BatterySystem],
-    generator: Optional[DieselGenerator],
-    grid: Optional[GridConnection],
-    gen_was_running: bool,
-    battery_power: NDArray,
-    generator_output: NDArray,
-    grid_import: NDArray,
-    grid_export: NDArray,
-    excess: NDArray,
-    unmet: NDArray,
-) -> bool:
-    """Dispatch one hour in load-following mode.  Returns gen_was_running."""
-    if net >= 0:
-        surplus = net
-
-        # Charge battery.
-        if battery is not None and surplus > 0:
-            accepted = battery.charge(surplus)
-            surplus -= accepted
-            battery_power[t] = -accepted
-
-        # Export to grid.
-        if grid is not None and surplus > 0:
-            exported, _ = grid.export_power(surplus, hod, month)
-            grid_export[t] = exported
-            surplus -= exported
-
-        excess[t] = max(surplus, 0.0)
-
-        # Turn off generator during surplus.
-        if generator is not None and gen_was_running:
-            generator.stop()
-            gen_was_running = False
-    else:
-        deficit = -net
-
-        # Battery discharge.
-        if battery is not None and deficit > 0:
-            delivered = battery.discharge(deficit)
-            battery_power[t] = delivered
-            deficit -= delivered
-
-        # Generator.
-        if generator is not None and deficit > 0:
-            gen_kw, _, _, gen_was_running = generator.simulate_hour(
-                deficit, gen_was_running
-            )
-            generator_output[t] = gen_kw
-            deficit -= gen_kw
-
-        # Grid import.
-        if grid is not None and deficit > 0:
-            imported, _ = grid.import_power(deficit, hod, month)
-            grid_import[t] = imported
-            deficit -= imported
-
-        unmet[t] = max(deficit, 0.0)
-
-    return gen_was_running
-
-
-def _dispatch_hour_cycle_charging(
-    t: int,
-    net: float,
-    month: int,
-    hod: int,
-    battery: Optional[BatterySystem],
-    generator: Optional[DieselGenerator],
-    grid: Optional[GridConnection],
-    gen_was_running: bool,
-    battery_power: NDArray,
-    generator_output: NDArray,
-    grid_import: NDArray,
-    grid_export: NDArray,
-    excess: NDArray,
-    unmet: NDArray,
-    soc_threshold: float,
-) -> bool:
-    """Dispatch one hour in cycle-charging mode.  Returns gen_was_running."""
-    current_soc = battery.get_state()["soc"] if battery is not None else 1.0
-
-    if net >= 0:
-        surplus = net
-
-        # Keep generator running if battery still below threshold.
-        if (
-            generator is not None
-            and gen_was_running
-            and current_soc < soc_threshold
-        ):
-            gen_kw, _, _, gen_was_running = generator.simulate_hour(
-                generator.rated_power_kw, gen_was_running
-            )
-            generator_output[t] = gen_kw
-            surplus += gen_kw
-        elif generator is not None and gen_was_running:
-            generator.stop()
-            gen_was_running = False
-
-        # Charge battery.
-        if battery is not None and surplus > 0:
-            accepted = battery.charge(surplus)
-            surplus -= accepted
-            battery_power[t] = -accepted
-
-        # Export.
-        if grid is not None and surplus > 0:
-            exported, _ = grid.export_power(surplus, hod, month)
-            grid_export[t] = exported
-            surplus -= exported
-
-        excess[t] = max(surplus, 0.0)
-    else:
-        deficit = -net
-
-        # Generator at full capacity.
-        run_gen = (
-            generator is not None
-            and (current_soc < soc_threshold or gen_was_running)
-            and deficit > 0
-        )
-
-        if run_gen:
-            gen_kw, _, _, gen_was_running = generator.simulate_hour(
-                generator.rated_power_kw, gen_was_running
-            )
-            generator_output[t] = gen_kw
-
-            gen_surplus = gen_kw - deficit
-            if gen_surplus > 0:
-                deficit = 0.0
-
-                if battery is not None and gen_surplus > 0:
-                    accepted = battery.charge(gen_surplus)
-                    gen_surplus -= accepted
-                    battery_power[t] = -accepted
-
-                if grid is not None and gen_surplus > 0:
-                    exported, _ = grid.export_power(gen_surplus, hod, month)
-                    grid_export[t] = exported
-                    gen_surplus -= exported
-
-                excess[t] = max(gen_surplus, 0.0)
-            else:
-                deficit -= gen_kw
-        else:
-            if generator is not None and gen_was_running:
-                generator.stop()
-                gen_was_running = False
-
-        # Battery discharge for remaining deficit.
-        if battery is not None and deficit > 0:
-            delivered = battery.discharge(deficit)
-            battery_power[t] += delivered
-            deficit -= delivered
 
-        # Grid import.
-        if grid is not None and deficit > 0:
-            imported, _ = grid.import_power(deficit, hod, month)
-            grid_import[t] = imported
-            deficit -= imported
+class _Mode(enum.IntEnum):
+    """Dispatch mode codes as reported in ``dispatch_mode``.
 
-        unmet[t] = max(deficit, 0.0)
+    The hour loop tracks the mode as a plain ``int``; this enum only names
+    the values for callers interpreting the output.
+    """
 
-    return gen_was_running
+    LOAD_FOLLOWING = MODE_LOAD_FOLLOWING
+    CYCLE_CHARGING = MODE_CYCLE_CHARGING
 
 
 # ---------------------------------------------------------------------------
@@ -243,7 +67,7 @@ def dispatch_combined(
     grid: Optional[GridConnection] = None,
     critical_soc: float = 0.30,
     recovery_soc: float = 0.70,
-) -> dict[str, NDArray[np.floating]]:
+) -> dict[str, NDArray]:
     """Run combined load-following / cycle-charging dispatch over 8760 hours.
 
     The strategy begins in load-following mode.  When the battery SOC falls
@@ -270,7 +94,7 @@ def dispatch_combined(
     Returns
     -------
     dict[str, ndarray]
-        Keys (all ndarray of shape (8760,)):
+        Keys (all ndarray of shape (8760,), float64 unless noted):
 
         * ``battery_power``    -- Battery power flow (positive = discharge).
         * ``battery_soc``      -- Battery SOC at end of each hour.
@@ -279,8 +103,9 @@ def dispatch_combined(
         * ``grid_export``      -- Power exported to grid in kW.
         * ``excess``           -- Curtailed energy in kW.
         * ``unmet``            -- Unserved load in kW.
-        * ``dispatch_mode``    -- Integer mode indicator per hour
-                                  (0 = load_following, 1 = cycle_charging).
+        * ``dispatch_mode``    -- ``int8`` mode indicator per hour
+                                  (0 = load_following, 1 = cycle_charging;
+                                  see ``_Mode``).
 
     Raises
     ------
@@ -293,81 +118,18 @@ def dispatch_combined(
             f"recovery_soc ({recovery_soc}) to form a hysteresis band."
         )
 
-    load_kw = np.asarray(load_kw, dtype=np.float64)
-    re_output_kw = np.asarray(re_output_kw, dtype=np.float64)
-
-    if load_kw.shape != (HOURS_PER_YEAR,):
-        raise ValueError(
-            f"load_kw must have shape ({HOURS_PER_YEAR},), got {load_kw.shape}"
-        )
-    if re_output_kw.shape != (HOURS_PER_YEAR,):
-        raise ValueError(
-            f"re_output_kw must have shape ({HOURS_PER_YEAR},), "
-            f"got {re_output_kw.shape}"
+    if battery is None:
+        # Without a battery SOC never falls below critical_soc, so the
+        # strategy is plain load following for the whole year
+        # (``dispatch_mode`` stays all zeros).
+        return _dispatch_core(
+            load_kw, re_output_kw, None, generator, grid,
+            strategy=STRATEGY_LOAD_FOLLOWING,
         )
 
-    # Reset stateful components.
-    if generator is not None:
-        generator.reset_accumulators()
-    if grid is not None:
-        grid.reset()
-
-    # Pre-allocate output arrays.
-    battery_power = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    battery_soc = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    generator_output = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    grid_import = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    grid_export = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    excess = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    unmet = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    dispatch_mode = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-
-    gen_was_running = False
-    mode = _Mode.LOAD_FOLLOWING
-
-    for t in range(HOURS_PER_YEAR):
-        month, hod = _hour_to_month_and_hod(t)
-        net = re_output_kw[t] - load_kw[t]
-
-        # --- Mode transition logic (hysteresis) ----------------------------
-        if battery is not None:
-            current_soc = battery.get_state()["soc"]
-
-            if mode == _Mode.LOAD_FOLLOWING and current_soc < critical_soc:
-                mode = _Mode.CYCLE_CHARGING
-            elif mode == _Mode.CYCLE_CHARGING and current_soc >= recovery_soc:
-                mode = _Mode.LOAD_FOLLOWING
-
-        # --- Dispatch based on current mode --------------------------------
-        if mode == _Mode.LOAD_FOLLOWING:
-            dispatch_mode[t] = 0.0
-            gen_was_running = _dispatch_hour_load_following(
-                t, net, month, hod,
-                battery, generator, grid, gen_was_running,
-                battery_power, generator_output,
-                grid_import, grid_export, excess, unmet,
-            )
-        else:
-            dispatch_mode[t] = 1.0
-            gen_was_running = _dispatch_hour_cycle_charging(
-                t, net, month, hod,
-                battery, generator, grid, gen_was_running,
-                battery_power, generator_output,
-                grid_import, grid_export, excess, unmet,
-                soc_threshold=recovery_soc,
-            )
-
-        # Record battery SOC.
-        if battery is not None:
-            battery_soc[t] = battery.get_state()["soc"]
-
-    return {
-        "battery_power": battery_power,
-        "battery_soc": battery_soc,
-        "generator_output": generator_output,
-        "grid_import": grid_import,
-        "grid_export": grid_export,
-        "excess": excess,
-        "unmet": unmet,
-        "dispatch_mode": dispatch_mode,
-    }
+    return _dispatch_core(
+        load_kw, re_output_kw, battery, generator, grid,
+        strategy=STRATEGY_COMBINED,
+        soc_low=critical_soc,
+        soc_high=recovery_soc,
+    )
@@ -21,36 +21,18 @@ from engine.battery.battery_system import BatterySystem
 from engine.generator.diesel_generator import DieselGenerator
 from engine.grid.grid_connection import GridConnection
 
+from ._kernel import (
+    STRATEGY_LOAD_FOLLOWING,
+    _dispatch_core,
+    _hour_to_month_and_hod,  # noqa: F401 -- re-exported
+)
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 HOURS_PER_YEAR = 8760
 
-# Cumulative hours at the start of each month (non-leap year).
-_MONTH_START_HOURS = np.array(
-    [0, 744, 1416, 2160, 2880, 3624, 4344, 5088, 5832, 6552, 7296, 8016],
-    dtype=np.int64,
-)
-
-
-def _hour_to_month_and_hod(hour_of_year: int) -> tuple[int, int]:
-    """Convert an hour-of-year index (0-8759) to (month, hour_of_day).
-
-    Returns
-    -------
-    month : int
-        Month of year, 1 -- 12.
-    hour_of_day : int
-        Hour of day, 0 -- 23.
-    """
-    # Month: find the last month whose start hour is <= hour_of_year.
-    month = int(np.searchsorted(_MONTH_START_HOURS, hour_of_year, side="right"))
-    # searchsorted with side='right' gives the insertion point *after* any
-    # equal values, so month is already 1-indexed.
-    hour_of_day = hour_of_year % 24
-    return month, hour_of_day
-
 
 # ---------------------------------------------------------------------------
 # Main entry point
@@ -92,102 +74,9 @@ def dispatch_load_following(
         * ``excess``         -- Curtailed energy in kW.
         * ``unmet``          -- Unserved load in kW.
     """
-    load_kw = np.asarray(load_kw, dtype=np.float64)
-    re_output_kw = np.asarray(re_output_kw, dtype=np.float64)
-
-    if load_kw.shape != (HOURS_PER_YEAR,):
-        raise ValueError(
-            f"load_kw must have shape ({HOURS_PER_YEAR},), got {load_kw.shape}"
-        )
-    if re_output_kw.shape != (HOURS_PER_YEAR,):
-        raise ValueError(
-            f"re_output_kw must have shape ({HOURS_PER_YEAR},), "
-            f"got {re_output_kw.shape}"
-        )
-
-    # Reset stateful components so results are reproducible.
-    if generator is not None:
-        generator.reset_accumulators()
-    if grid is not None:
-        grid.reset()
-
-    # Pre-allocate output arrays.
-    battery_power = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    battery_soc = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    generator_output = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    grid_import = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    grid_export = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    excess = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-    unmet = np.zeros(HOURS_PER_YEAR, dtype=np.float64)
-
-    gen_was_running = False
-
-    for t in range(HOURS_PER_YEAR):
-        month, hod = _hour_to_month_and_hod(t)
-        net = re_output_kw[t] - load_kw[t]  # positive = surplus, negative = deficit
-
-        if net >= 0:
-            # ----- SURPLUS: RE exceeds load ---------------------------------
-            surplus = net
-
-            # 1. Charge battery with surplus.
-            if battery is not None and surplus > 0:
-                accepted = battery.charge(surplus)
-                surplus -= accepted
-                battery_power[t] = -accepted  # negative = charging
-
-            # 2. Export remaining surplus to grid.
-            if grid is not None and surplus > 0:
-                exported, _rev = grid.export_power(surplus, hod, month)
-                grid_export[t] = exported
-                surplus -= exported
-
-            # 3. Anything left over is curtailed.
-            excess[t] = max(surplus, 0.0)
-
-            # Turn off generator during surplus periods.
-            if generator is not None and gen_was_running:
-                generator.stop()
-                gen_was_running = False
-
-        else:
-            # ----- DEFICIT: load exceeds RE ---------------------------------
-            deficit = -net  # positive magnitude
-
-            # 1. Discharge battery.
-            if battery is not None and deficit > 0:
-                delivered = battery.discharge(deficit)
-                battery_power[t] = delivered  # positive = discharging
-                deficit -= delivered
-
-            # 2. Run generator.
-            if generator is not None and deficit > 0:
-                gen_kw, _fuel, _cost, gen_was_running = generator.simulate_hour(
-                    deficit, gen_was_running
-                )
-                generator_output[t] = gen_kw
-                deficit -= gen_kw
-
-            # 3. Import from grid.
-            if grid is not None and deficit > 0:
-                imported, _cost = grid.import_power(deficit, hod, month)
-                grid_import[t] = imported
-                deficit -= imported
-
-            # 4. Remaining deficit is unmet load.
-            unmet[t] = max(deficit, 0.0)
-
-        # Record battery SOC at end of this hour.
-        if battery is not None:
-            battery_soc[t] = battery.get_state()["soc"]
-        # else remains 0.0
-
-    return {
-        "battery_power": battery_power,
-        "battery_soc": battery_soc,
-        "generator_output": generator_output,
-        "grid_import": grid_import,
-        "grid_export": grid_export,
-        "excess": excess,
-        "unmet": unmet,
-    }
+    results = _dispatch_core(
+        load_kw, re_output_kw, battery, generator, grid,
+        strategy=STRATEGY_LOAD_FOLLOWING,
+    )
+    del results["dispatch_mode"]
+    return results
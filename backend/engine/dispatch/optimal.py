@@ -24,23 +24,48 @@ This module requires the ``highspy`` package (``pip install highspy``).
 
 from __future__ import annotations
 
+import functools
 import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.sparse import coo_matrix, csc_matrix
 
 from engine.grid.tariff import FlatTariff, TariffBase
 
+try:
+    import highspy  # type: ignore[import-untyped]
+
+    _HAS_HIGHS = True
+except ImportError:  # pragma: no cover – highspy is optional
+    highspy = None
+    _HAS_HIGHS = False
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 HOURS_PER_YEAR = 8760
 
-# Penalty for unmet load -- high enough to discourage it, but finite so
-# the solver can always find a feasible solution.
-UNMET_PENALTY_PER_KWH = 10.0
+# Penalty for unmet load, as a multiple of the dearest supply cost (and at
+# least this many $/kWh).  It must exceed every way of serving load, yet
+# stay finite so the solver can always find a feasible solution; scaling
+# it to the other costs keeps the column well-conditioned.
+UNMET_PENALTY_SCALE = 100.0
+
+# HiGHS options applied to every solve, before any ``solver_options``
+# passed to :func:`dispatch_optimal`.  Serial dual simplex suits this very
+# sparse, staircase-structured LP; primal simplex was several times slower
+# on representative systems and interior point about twice as slow.
+DEFAULT_SOLVER_OPTIONS: dict[str, Any] = {
+    "solver": "simplex",
+    "simplex_strategy": 1,
+    "presolve": "on",
+}
 
 # Cumulative hours at the start of each month (non-leap year).
 _MONTH_START_HOURS = np.array(
@@ -48,12 +73,33 @@ _MONTH_START_HOURS = np.array(
     dtype=np.int64,
 )
 
-
-def _hour_to_month_and_hod(hour_of_year: int) -> tuple[int, int]:
-    """Convert hour-of-year (0-8759) to (month 1-12, hour_of_day 0-23)."""
-    month = int(np.searchsorted(_MONTH_START_HOURS, hour_of_year, side="right"))
-    hour_of_day = hour_of_year % 24
-    return month, hour_of_day
+# Month (1-12) and hour of day (0-23) for every hour of the year.
+_MONTH_OF_HOUR = np.searchsorted(
+    _MONTH_START_HOURS, np.arange(HOURS_PER_YEAR), side="right"
+).astype(np.int32)
+_HOD_OF_HOUR = (np.arange(HOURS_PER_YEAR) % 24).astype(np.int32)
+
+# ----- Variable index layout -----------------------------------------------
+# For each hour t there are 7 decision variables, stored hour-major at
+# columns t * VARS_PER_HOUR + <offset>:
+#   batt_charge[t], batt_discharge[t], gen_out[t],
+#   grid_imp[t], grid_exp[t], excess[t], unmet[t]
+# With a battery, T state variables soc[t] (battery SOC in kWh) follow
+# all the dispatch variables.
+VARS_PER_HOUR = 7
+BATT_CH = 0
+BATT_DISCH = 1
+GEN_OUT = 2
+GRID_IMP = 3
+GRID_EXP = 4
+EXCESS = 5
+UNMET = 6
+
+# Result-dict key for each of the above, in column order.
+_VAR_KEYS = (
+    "battery_charge", "battery_discharge", "generator_output",
+    "grid_import", "grid_export", "excess", "unmet",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -61,94 +107,310 @@ def _hour_to_month_and_hod(hour_of_year: int) -> tuple[int, int]:
 # ---------------------------------------------------------------------------
 
 
-def _extract_battery_params(config: dict[str, Any] | None) -> dict[str, float] | None:
+@dataclass(frozen=True, slots=True)
+class BatteryParams:
+    """Battery parameters for :func:`dispatch_optimal`.
+
+    Fields mirror the ``battery_config`` dict keys and defaults.  Build an
+    instance once and pass it in place of the dict to skip re-parsing in
+    sweeps.  The derived kWh limits and one-way efficiency are computed
+    on construction.
+    """
+
+    capacity_kwh: float = 100.0
+    max_charge_kw: float = 50.0
+    max_discharge_kw: float = 50.0
+    efficiency: float = 0.90
+    min_soc: float = 0.10
+    max_soc: float = 0.95
+    initial_soc: float = 0.50
+    one_way_eff: float = field(init=False)
+    min_soc_kwh: float = field(init=False)
+    max_soc_kwh: float = field(init=False)
+    initial_soc_kwh: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "one_way_eff", math.sqrt(self.efficiency))
+        object.__setattr__(self, "min_soc_kwh", self.min_soc * self.capacity_kwh)
+        object.__setattr__(self, "max_soc_kwh", self.max_soc * self.capacity_kwh)
+        object.__setattr__(self, "initial_soc_kwh", self.initial_soc * self.capacity_kwh)
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratorParams:
+    """Generator parameters for :func:`dispatch_optimal`.
+
+    Fields mirror the ``generator_config`` dict keys and defaults; the
+    LP's linear cost per kW is computed on construction.
+    """
+
+    rated_power_kw: float = 100.0
+    min_load_ratio: float = 0.30
+    fuel_curve_a0: float = 0.0845
+    fuel_curve_a1: float = 0.2460
+    fuel_price: float = 1.20
+    om_cost_per_hour: float = 5.0
+    cost_per_kw: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Marginal cost per kWh of generator output:
+        # cost = (a0 * rated + a1 * P) * fuel_price + om_per_hr
+        # The LP uses a linear cost per kW of gen_output:
+        #   variable_cost_per_kw = a1 * fuel_price  (marginal fuel)
+        # plus a fixed cost when running: a0 * rated * fuel_price + om_per_hr.
+        # Since the LP does not model on/off decisions (that would require MIP),
+        # we approximate by spreading the no-load cost across the minimum load
+        # range and penalising output below min_load with the marginal rate.
+        # For the LP relaxation we simply use:
+        #   gen_cost[t] = (a0 * rated * fuel_price + om_per_hr) / rated * gen[t]
+        #               + a1 * fuel_price * gen[t]
+        # i.e. cost_per_kw = (a0 * fuel_price + om_per_hr / rated) + a1 * fuel_price
+        # This slightly under-estimates cost at low loading but is exact at rated.
+        cost_per_kw = (
+            self.fuel_curve_a0 * self.fuel_price
+            + self.om_cost_per_hour / self.rated_power_kw
+        ) + self.fuel_curve_a1 * self.fuel_price
+        object.__setattr__(self, "cost_per_kw", cost_per_kw)
+
+
+@dataclass(frozen=True, slots=True)
+class GridParams:
+    """Grid parameters for :func:`dispatch_optimal`.
+
+    Fields mirror the ``grid_config`` dict keys and defaults.
+    """
+
+    max_import_kw: float = 1_000.0
+    max_export_kw: float = 500.0
+    tariff: TariffBase = field(default_factory=FlatTariff)
+    sell_back_enabled: bool = True
+
+
+def _extract_battery_params(
+    config: dict[str, Any] | BatteryParams | None,
+) -> BatteryParams | None:
     """Normalise a battery configuration dict.
 
     Expected keys (all optional, with defaults):
         capacity_kwh, max_charge_kw, max_discharge_kw, efficiency,
         min_soc, max_soc, initial_soc.
     """
-    if config is None:
-        return None
-
-    eff = float(config.get("efficiency", 0.90))
-    one_way_eff = math.sqrt(eff)
+    if config is None or isinstance(config, BatteryParams):
+        return config
 
-    return {
-        "capacity_kwh": float(config.get("capacity_kwh", 100.0)),
-        "max_charge_kw": float(config.get("max_charge_kw", 50.0)),
-        "max_discharge_kw": float(config.get("max_discharge_kw", 50.0)),
-        "efficiency": eff,
-        "one_way_eff": one_way_eff,
-        "min_soc_kwh": float(config.get("min_soc", 0.10))
-        * float(config.get("capacity_kwh", 100.0)),
-        "max_soc_kwh": float(config.get("max_soc", 0.95))
-        * float(config.get("capacity_kwh", 100.0)),
-        "initial_soc_kwh": float(config.get("initial_soc", 0.50))
-        * float(config.get("capacity_kwh", 100.0)),
-    }
+    return BatteryParams(
+        capacity_kwh=float(config.get("capacity_kwh", 100.0)),
+        max_charge_kw=float(config.get("max_charge_kw", 50.0)),
+        max_discharge_kw=float(config.get("max_discharge_kw", 50.0)),
+        efficiency=float(config.get("efficiency", 0.90)),
+        min_soc=float(config.get("min_soc", 0.10)),
+        max_soc=float(config.get("max_soc", 0.95)),
+        initial_soc=float(config.get("initial_soc", 0.50)),
+    )
 
 
 def _extract_generator_params(
-    config: dict[str, Any] | None,
-) -> dict[str, float] | None:
+    config: dict[str, Any] | GeneratorParams | None,
+) -> GeneratorParams | None:
     """Normalise a generator configuration dict.
 
     Expected keys:
         rated_power_kw, min_load_ratio, fuel_curve_a0, fuel_curve_a1,
         fuel_price, om_cost_per_hour.
     """
-    if config is None:
-        return None
-
-    rated = float(config.get("rated_power_kw", 100.0))
-    a0 = float(config.get("fuel_curve_a0", 0.0845))
-    a1 = float(config.get("fuel_curve_a1", 0.2460))
-    fuel_price = float(config.get("fuel_price", 1.20))
-    om_per_hr = float(config.get("om_cost_per_hour", 5.0))
-
-    # Marginal cost per kWh of generator output:
-    # cost = (a0 * rated + a1 * P) * fuel_price + om_per_hr
-    # The LP uses a linear cost per kW of gen_output:
-    #   variable_cost_per_kw = a1 * fuel_price  (marginal fuel)
-    # plus a fixed cost when running: a0 * rated * fuel_price + om_per_hr.
-    # Since the LP does not model on/off decisions (that would require MIP),
-    # we approximate by spreading the no-load cost across the minimum load
-    # range and penalising output below min_load with the marginal rate.
-    # For the LP relaxation we simply use:
-    #   gen_cost[t] = (a0 * rated * fuel_price + om_per_hr) / rated * gen[t]
-    #               + a1 * fuel_price * gen[t]
-    # i.e. cost_per_kw = (a0 * fuel_price + om_per_hr / rated) + a1 * fuel_price
-    # This slightly under-estimates cost at low loading but is exact at rated.
-    cost_per_kw = (a0 * fuel_price + om_per_hr / rated) + a1 * fuel_price
+    if config is None or isinstance(config, GeneratorParams):
+        return config
 
-    return {
-        "rated_power_kw": rated,
-        "min_load_ratio": float(config.get("min_load_ratio", 0.30)),
-        "cost_per_kw": cost_per_kw,
-    }
+    return GeneratorParams(
+        rated_power_kw=float(config.get("rated_power_kw", 100.0)),
+        min_load_ratio=float(config.get("min_load_ratio", 0.30)),
+        fuel_curve_a0=float(config.get("fuel_curve_a0", 0.0845)),
+        fuel_curve_a1=float(config.get("fuel_curve_a1", 0.2460)),
+        fuel_price=float(config.get("fuel_price", 1.20)),
+        om_cost_per_hour=float(config.get("om_cost_per_hour", 5.0)),
+    )
 
 
 def _extract_grid_params(
-    config: dict[str, Any] | None,
-) -> dict[str, Any] | None:
+    config: dict[str, Any] | GridParams | None,
+) -> GridParams | None:
     """Normalise a grid configuration dict.
 
     Expected keys:
         max_import_kw, max_export_kw, tariff (TariffBase instance or None),
         sell_back_enabled.
     """
-    if config is None:
-        return None
+    if config is None or isinstance(config, GridParams):
+        return config
 
-    tariff: TariffBase = config.get("tariff", None) or FlatTariff()
+    return GridParams(
+        max_import_kw=float(config.get("max_import_kw", 1_000.0)),
+        max_export_kw=float(config.get("max_export_kw", 500.0)),
+        tariff=config.get("tariff", None) or FlatTariff(),
+        sell_back_enabled=bool(config.get("sell_back_enabled", True)),
+    )
 
-    return {
-        "max_import_kw": float(config.get("max_import_kw", 1_000.0)),
-        "max_export_kw": float(config.get("max_export_kw", 500.0)),
-        "tariff": tariff,
-        "sell_back_enabled": bool(config.get("sell_back_enabled", True)),
-    }
+
+# ---------------------------------------------------------------------------
+# Model cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _CachedLP:
+    """A solved HiGHS model plus the data it currently holds."""
+
+    highs: Any
+    col_cost: NDArray[np.float64]
+    col_lower: NDArray[np.float64]
+    col_upper: NDArray[np.float64]
+    row_lower: NDArray[np.float64]
+    row_upper: NDArray[np.float64]
+
+    def update(
+        self,
+        col_cost: NDArray[np.float64],
+        col_lower: NDArray[np.float64],
+        col_upper: NDArray[np.float64],
+        row_lower: NDArray[np.float64],
+        row_upper: NDArray[np.float64],
+    ) -> None:
+        """Push only the changed costs and bounds into the model."""
+        h = self.highs
+        cols = np.flatnonzero(col_cost != self.col_cost).astype(np.int32)
+        if cols.size:
+            h.changeColsCost(cols.size, cols, col_cost[cols])
+        cols = np.flatnonzero(
+            (col_lower != self.col_lower) | (col_upper != self.col_upper)
+        ).astype(np.int32)
+        if cols.size:
+            h.changeColsBounds(cols.size, cols, col_lower[cols], col_upper[cols])
+        rows = np.flatnonzero(
+            (row_lower != self.row_lower) | (row_upper != self.row_upper)
+        ).astype(np.int32)
+        if rows.size:
+            h.changeRowsBounds(rows.size, rows, row_lower[rows], row_upper[rows])
+
+        self.col_cost = col_cost
+        self.col_lower = col_lower
+        self.col_upper = col_upper
+        self.row_lower = row_lower
+        self.row_upper = row_upper
+
+
+class _LPCache:
+    """Built HiGHS models keyed by :attr:`_LPStructure.key`.
+
+    Scenario sweeps that vary fuel price, tariff or load keep the
+    constraint matrix fixed.  Reusing the previous model means only the
+    changed costs and bounds are pushed, and HiGHS re-solves from the
+    simplex basis it already holds.  Entries are checked out while in use
+    so that concurrent callers never share a model.
+    """
+
+    def __init__(self, maxsize: int = 4) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, _CachedLP] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def checkout(self, key: tuple) -> _CachedLP | None:
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def checkin(self, key: tuple, entry: _CachedLP) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_LP_CACHE = _LPCache()
+
+
+def _warm_start_columns(
+    result: dict[str, NDArray[np.floating]],
+    n_vars: int,
+    capacity_kwh: float | None,
+) -> NDArray[np.float64]:
+    """Lay a dispatch result dict out in the full LP column layout."""
+    col_value = np.zeros(n_vars, dtype=np.float64)
+    soc_offset = VARS_PER_HOUR * HOURS_PER_YEAR
+    dispatch = col_value[:soc_offset].reshape(HOURS_PER_YEAR, VARS_PER_HOUR)
+    for j, key in enumerate(_VAR_KEYS):
+        if key in result:
+            dispatch[:, j] = result[key]
+    if capacity_kwh is not None and "battery_soc" in result:
+        col_value[soc_offset:] = np.asarray(result["battery_soc"]) * capacity_kwh
+    return col_value
+
+
+def _greedy_dispatch(
+    load_kw: NDArray[np.float64],
+    re_output_kw: NDArray[np.float64],
+    batt: BatteryParams | None,
+    gen: GeneratorParams | None,
+    grid: GridParams | None,
+) -> dict[str, NDArray[np.float64]]:
+    """Load-following dispatch over the LP's variables, as a warm start.
+
+    Surplus RE charges the battery, then is exported, then curtailed; a
+    deficit is met by the battery, then the generator, then the grid,
+    with the remainder unmet.  The result respects every bound and
+    energy balance but not the cyclic SOC condition, which the solver
+    repairs in a few pivots.
+    """
+    T = HOURS_PER_YEAR
+    result = {key: np.zeros(T, dtype=np.float64) for key in _VAR_KEYS}
+    charge = result["battery_charge"]
+    discharge = result["battery_discharge"]
+    gen_out = result["generator_output"]
+    grid_imp = result["grid_import"]
+    grid_exp = result["grid_export"]
+    excess = result["excess"]
+    unmet = result["unmet"]
+    soc_kwh = np.zeros(T, dtype=np.float64)
+
+    eta = batt.one_way_eff if batt is not None else 1.0
+    max_charge = batt.max_charge_kw if batt is not None else 0.0
+    max_discharge = batt.max_discharge_kw if batt is not None else 0.0
+    min_soc = batt.min_soc_kwh if batt is not None else 0.0
+    max_soc = batt.max_soc_kwh if batt is not None else 0.0
+    soc = batt.initial_soc_kwh if batt is not None else 0.0
+    rated = gen.rated_power_kw if gen is not None else 0.0
+    max_import = grid.max_import_kw if grid is not None else 0.0
+    max_export = (
+        grid.max_export_kw if grid is not None and grid.sell_back_enabled else 0.0
+    )
+
+    net = (re_output_kw - load_kw).tolist()
+    for t in range(T):
+        x = net[t]
+        if x >= 0.0:
+            c = max(min(x, max_charge, (max_soc - soc) / eta), 0.0)
+            soc += c * eta
+            e = min(x - c, max_export)
+            charge[t] = c
+            grid_exp[t] = e
+            excess[t] = x - c - e
+        else:
+            d = -x
+            b = max(min(d, max_discharge, (soc - min_soc) * eta), 0.0)
+            soc -= b / eta
+            g = min(d - b, rated)
+            i = min(d - b - g, max_import)
+            discharge[t] = b
+            gen_out[t] = g
+            grid_imp[t] = i
+            unmet[t] = d - b - g - i
+        soc_kwh[t] = soc
+
+    if batt is not None:
+        result["battery_soc"] = soc_kwh / batt.capacity_kwh
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -156,12 +418,275 @@ def _extract_grid_params(
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class _LPStructure:
+    """Constraint matrix shared by every dispatch LP of one shape.
+
+    ``columns`` maps each LP column to its index in the full variable
+    layout when some variables were left out of the model; ``None``
+    means the LP uses the full layout.  ``n_full_vars`` is the size of
+    that layout and ``key`` identifies the structure.
+    """
+
+    a_matrix: csc_matrix
+    n_full_vars: int
+    columns: Optional[NDArray[np.intp]]
+    key: tuple
+
+
+@dataclass
+class _LPArrays:
+    """Costs, bounds and constraint structure describing one dispatch LP."""
+
+    col_cost: NDArray[np.float64]
+    col_lower: NDArray[np.float64]
+    col_upper: NDArray[np.float64]
+    row_lower: NDArray[np.float64]
+    row_upper: NDArray[np.float64]
+    structure: _LPStructure
+
+    @property
+    def n_vars(self) -> int:
+        return self.col_cost.shape[0]
+
+    @property
+    def n_rows(self) -> int:
+        return self.row_lower.shape[0]
+
+
+@functools.lru_cache(maxsize=8)
+def _lp_structure(
+    has_batt: bool,
+    has_gen: bool,
+    has_grid: bool,
+    can_export: bool,
+    eta: float,
+    lean: bool,
+) -> _LPStructure:
+    """Build the constraint matrix for the given system layout.
+
+    The matrix depends only on which components are present, the
+    battery's one-way efficiency ``eta`` and the formulation, so one
+    build serves every call that shares them; loads, prices and limits
+    enter through the bounds and costs alone.  Columns of absent
+    components could only ever be zero, so they are left out.
+    """
+    T = HOURS_PER_YEAR
+    n_dispatch_vars = VARS_PER_HOUR * T
+    soc_offset = n_dispatch_vars
+    n_vars = n_dispatch_vars + (T if has_batt else 0)
+
+    # The sparsity pattern is static, so every block is written straight
+    # into preallocated arrays, in the row order described in _build_lp.
+    rows_per_hour = 2 if has_batt else 1
+    n_rows = rows_per_hour * T + (1 if has_batt else 0)
+    # Energy balance: 7 nnz per hour.  SOC continuity: 3 nnz in hour 0,
+    # 4 afterwards, plus 1 for the cyclic row -- 4 * T in total.
+    nnz = VARS_PER_HOUR * T + (4 * T if has_batt else 0)
+
+    coo_row = np.empty(nnz, dtype=np.int32)
+    coo_col = np.empty(nnz, dtype=np.int32)
+    coo_val = np.empty(nnz, dtype=np.float64)
+
+    hours = np.arange(T, dtype=np.int32)
+    dispatch_cols = hours[:, None] * VARS_PER_HOUR + np.arange(VARS_PER_HOUR, dtype=np.int32)
+    balance_rows = hours * rows_per_hour
+
+    # ---- 1. Energy balance (equality) -------------------------------------
+    # re[t] + gen[t] + batt_discharge[t] + grid_import[t]
+    #   = load[t] + batt_charge[t] + grid_export[t] + excess[t] - unmet[t]
+    #
+    # Rearranged to LHS:
+    # gen[t] + batt_discharge[t] + grid_import[t]
+    #   - batt_charge[t] - grid_export[t] - excess[t] + unmet[t]
+    #   = load[t] - re[t]
+    balance_coeffs = np.empty(VARS_PER_HOUR, dtype=np.float64)
+    balance_coeffs[[BATT_DISCH, GEN_OUT, GRID_IMP, UNMET]] = 1.0
+    balance_coeffs[[BATT_CH, GRID_EXP, EXCESS]] = -1.0
+
+    n_balance = VARS_PER_HOUR * T
+    coo_row[:n_balance].reshape(T, VARS_PER_HOUR)[:] = balance_rows[:, None]
+    coo_col[:n_balance] = dispatch_cols.ravel()
+    coo_val[:n_balance].reshape(T, VARS_PER_HOUR)[:] = balance_coeffs
+
+    if has_batt:
+        # ---- 2. Battery SOC continuity ------------------------------------
+        # soc[t] = soc[t-1] + charge[t] * eta_one_way - discharge[t] / eta_one_way
+        # => soc[t] - charge[t] * eta + discharge[t] / eta = soc[t-1]
+        # with soc[-1] the initial SOC.
+        soc_rows = balance_rows + 1
+        soc_cols = soc_offset + hours
+
+        # soc[t], charge[t] and discharge[t] coefficients, one block each.
+        block = slice(n_balance, n_balance + 3 * T)
+        coo_row[block].reshape(3, T)[:] = soc_rows
+        coo_col[block].reshape(3, T)[:] = (
+            soc_cols, dispatch_cols[:, BATT_CH], dispatch_cols[:, BATT_DISCH],
+        )
+        coo_val[block].reshape(3, T)[:] = [[1.0], [-eta], [1.0 / eta]]
+
+        # soc[t-1] coefficient for t >= 1.
+        prev = slice(n_balance + 3 * T, nnz - 1)
+        coo_row[prev] = soc_rows[1:]
+        coo_col[prev] = soc_cols[:-1]
+        coo_val[prev] = -1.0
+
+        # ---- 3. Cyclic SOC constraint: soc[T-1] = initial_soc -------------
+        coo_row[-1] = n_rows - 1
+        coo_col[-1] = soc_cols[-1]
+        coo_val[-1] = 1.0
+
+    a_matrix = coo_matrix((coo_val, (coo_row, coo_col)), shape=(n_rows, n_vars)).tocsc()
+    if lean and has_batt:
+        a_matrix = a_matrix[:-1]
+
+    dropped = [
+        offset
+        for offset, active in (
+            (BATT_CH, has_batt),
+            (BATT_DISCH, has_batt),
+            (GEN_OUT, has_gen),
+            (GRID_IMP, has_grid),
+            (GRID_EXP, can_export),
+            (EXCESS, not lean),
+        )
+        if not active
+    ]
+    columns = None
+    if dropped:
+        columns = np.delete(np.arange(n_vars), dispatch_cols[:, dropped].ravel())
+        a_matrix = a_matrix[:, columns]
+
+    # Shared between calls, so guard against accidental writes.
+    for arr in (a_matrix.indptr, a_matrix.indices, a_matrix.data, columns):
+        if arr is not None:
+            arr.flags.writeable = False
+    key = (has_batt, has_gen, has_grid, can_export, eta, lean)
+    return _LPStructure(a_matrix, n_vars, columns, key)
+
+
+def _build_lp(
+    load_kw: NDArray[np.float64],
+    re_output_kw: NDArray[np.float64],
+    batt: BatteryParams | None,
+    gen: GeneratorParams | None,
+    grid: GridParams | None,
+    lean: bool = False,
+) -> _LPArrays:
+    """Assemble objective, bounds and constraints for one dispatch year.
+
+    Every hour has the same structure, so each quantity is written for
+    all hours at once through a ``(T, VARS_PER_HOUR)`` view of the
+    dispatch columns.
+
+    With ``lean`` the same optimum is described with T fewer columns and
+    one fewer row: the free ``excess`` slack is dropped, turning each
+    energy balance into ``supply >= demand``, and the cyclic SOC row
+    becomes fixed bounds on the last SOC variable.
+    """
+    has_batt = batt is not None
+    has_gen = gen is not None
+    has_grid = grid is not None
+
+    T = HOURS_PER_YEAR
+    n_dispatch_vars = VARS_PER_HOUR * T
+    # SOC variables start after all dispatch variables.
+    soc_offset = n_dispatch_vars
+    n_vars = n_dispatch_vars + (T if has_batt else 0)
+
+    # ----- Objective coefficients ------------------------------------------
+    # Battery charge/discharge have zero direct cost (cost is implicit
+    # through the grid/gen that provides the power), curtailment is free
+    # and SOC variables carry no cost.
+    col_cost = np.zeros(n_vars, dtype=np.float64)
+    cost = col_cost[:n_dispatch_vars].reshape(T, VARS_PER_HOUR)
+
+    if has_gen:
+        cost[:, GEN_OUT] = gen.cost_per_kw
+    if has_grid:
+        tariff: TariffBase = grid.tariff
+        cost[:, GRID_IMP] = tariff.buy_price_array(_HOD_OF_HOUR, _MONTH_OF_HOUR)
+        if grid.sell_back_enabled:
+            # Grid export revenue (negative cost).
+            cost[:, GRID_EXP] = -tariff.sell_price_array(_HOD_OF_HOUR, _MONTH_OF_HOUR)
+    # Unmet load penalty, scaled to the dearest source of supply.
+    cost[:, UNMET] = UNMET_PENALTY_SCALE * max(
+        cost[:, GEN_OUT].max(), cost[:, GRID_IMP].max(), 1.0
+    )
+
+    # ----- Variable bounds -------------------------------------------------
+    # Absent components are pinned to zero (and their columns left out of
+    # the model below); excess and unmet are only non-negative.
+    col_lower = np.zeros(n_vars, dtype=np.float64)
+    col_upper = np.full(n_vars, np.inf, dtype=np.float64)
+    upper = col_upper[:n_dispatch_vars].reshape(T, VARS_PER_HOUR)
+
+    upper[:, BATT_CH] = batt.max_charge_kw if has_batt else 0.0
+    upper[:, BATT_DISCH] = batt.max_discharge_kw if has_batt else 0.0
+    # LP relaxation: allow any generator output between 0 and rated.
+    # (Minimum-load constraint would require MIP for on/off.)
+    upper[:, GEN_OUT] = gen.rated_power_kw if has_gen else 0.0
+    upper[:, GRID_IMP] = grid.max_import_kw if has_grid else 0.0
+    upper[:, GRID_EXP] = (
+        grid.max_export_kw if has_grid and grid.sell_back_enabled else 0.0
+    )
+
+    if has_batt:
+        col_lower[soc_offset:] = batt.min_soc_kwh
+        col_upper[soc_offset:] = batt.max_soc_kwh
+
+    # ----- Constraint right-hand sides ------------------------------------
+    # Every constraint is an equality (but see ``lean`` below).  Rows are
+    # ordered per hour: the energy balance, then (with a battery) the SOC
+    # continuity row; the cyclic SOC row comes last.
+    rows_per_hour = 2 if has_batt else 1
+    n_rows = rows_per_hour * T + (1 if has_batt else 0)
+    balance_rows = np.arange(T) * rows_per_hour
+    row_lower = np.zeros(n_rows, dtype=np.float64)
+    row_lower[balance_rows] = load_kw - re_output_kw
+    if has_batt:
+        # First SOC row (soc[-1] is the initial SOC) and the cyclic row.
+        row_lower[1] = row_lower[-1] = batt.initial_soc_kwh
+
+    structure = _lp_structure(
+        has_batt,
+        has_gen,
+        has_grid,
+        has_grid and grid.sell_back_enabled,
+        batt.one_way_eff if has_batt else 1.0,
+        lean,
+    )
+    row_upper = row_lower
+    if lean:
+        row_upper = row_lower.copy()
+        row_upper[balance_rows] = np.inf
+        if has_batt:
+            # The cyclic row becomes fixed bounds on soc[T-1].
+            col_lower[-1] = col_upper[-1] = batt.initial_soc_kwh
+            row_lower = row_lower[:-1]
+            row_upper = row_upper[:-1]
+
+    columns = structure.columns
+    if columns is None:
+        return _LPArrays(
+            col_cost, col_lower, col_upper, row_lower, row_upper, structure,
+        )
+    return _LPArrays(
+        col_cost[columns], col_lower[columns], col_upper[columns],
+        row_lower, row_upper, structure,
+    )
+
+
 def dispatch_optimal(
     load_kw: NDArray[np.floating],
     re_output_kw: NDArray[np.floating],
-    battery_config: Optional[dict[str, Any]] = None,
-    generator_config: Optional[dict[str, Any]] = None,
-    grid_config: Optional[dict[str, Any]] = None,
+    battery_config: Optional[dict[str, Any] | BatteryParams] = None,
+    generator_config: Optional[dict[str, Any] | GeneratorParams] = None,
+    grid_config: Optional[dict[str, Any] | GridParams] = None,
+    warm_start_from: Optional[dict[str, NDArray[np.floating]] | str] = None,
+    reuse_model: bool = False,
+    lean_formulation: bool = False,
+    solver_options: Optional[dict[str, Any]] = None,
 ) -> dict[str, NDArray[np.floating]]:
     """Solve the optimal dispatch LP using the HiGHS solver.
 
@@ -171,17 +696,38 @@ def dispatch_optimal(
         Hourly electrical load in kW.
     re_output_kw : ndarray, shape (8760,)
         Combined renewable-energy output in kW.
-    battery_config : dict or None
+    battery_config : dict, BatteryParams or None
         Battery parameters.  Keys: ``capacity_kwh``, ``max_charge_kw``,
         ``max_discharge_kw``, ``efficiency``, ``min_soc``, ``max_soc``,
         ``initial_soc``.
-    generator_config : dict or None
+    generator_config : dict, GeneratorParams or None
         Generator parameters.  Keys: ``rated_power_kw``, ``min_load_ratio``,
         ``fuel_curve_a0``, ``fuel_curve_a1``, ``fuel_price``,
         ``om_cost_per_hour``.
-    grid_config : dict or None
+    grid_config : dict, GridParams or None
         Grid parameters.  Keys: ``max_import_kw``, ``max_export_kw``,
         ``tariff`` (:class:`TariffBase`), ``sell_back_enabled``.
+    warm_start_from : dict, ``"heuristic"`` or None
+        Starting primal solution passed to HiGHS: a previous result of
+        this function (e.g. the neighbouring point of a sweep), or
+        ``"heuristic"`` for a greedy load-following dispatch computed on
+        the spot.  Either can substantially cut the solve time of a
+        model that is not already cached.
+    reuse_model : bool
+        Opt in to reusing a cached HiGHS model with the same constraint
+        matrix from an earlier call that also set this flag, updating only
+        costs and bounds and re-solving from its last basis.  Meant for
+        sweeps.  Only the objective value is then guaranteed to match a
+        fresh solve: where the optimum is not unique, the hourly series
+        returned may depend on which models were solved before.  The
+        default solves a fresh model, so results depend only on the
+        inputs.
+    lean_formulation : bool
+        Solve an equivalent, smaller LP without the curtailment slack
+        columns; ``excess`` is then recovered from the energy balance.
+    solver_options : dict or None
+        HiGHS options (e.g. ``{"time_limit": 30.0, "parallel": "on"}``)
+        overriding :data:`DEFAULT_SOLVER_OPTIONS`.
 
     Returns
     -------
@@ -204,16 +750,18 @@ def dispatch_optimal(
     ------
     ImportError
         If ``highspy`` is not installed.
+    ValueError
+        If an input profile does not have shape (8760,), ``warm_start_from``
+        is an unknown string, or ``solver_options`` names an unknown
+        option or an invalid value.
     RuntimeError
         If the solver fails to find an optimal solution.
     """
-    try:
-        import highspy  # type: ignore[import-untyped]
-    except ImportError as exc:
+    if not _HAS_HIGHS:
         raise ImportError(
             "The 'highspy' package is required for optimal dispatch. "
             "Install it with: pip install highspy"
-        ) from exc
+        )
 
     load_kw = np.asarray(load_kw, dtype=np.float64)
     re_output_kw = np.asarray(re_output_kw, dtype=np.float64)
@@ -234,248 +782,71 @@ def dispatch_optimal(
     grid = _extract_grid_params(grid_config)
 
     has_batt = batt is not None
-    has_gen = gen is not None
-    has_grid = grid is not None
 
-    T = HOURS_PER_YEAR
-    INF = highspy.kHighsInf
-
-    # ----- Variable index layout -------------------------------------------
-    # For each hour t we have 7 decision variables:
-    #   batt_charge[t], batt_discharge[t], gen_out[t],
-    #   grid_imp[t], grid_exp[t], excess[t], unmet[t]
-    # Plus 1 state variable:
-    #   soc[t]  (battery SOC in kWh)
-
-    VARS_PER_HOUR = 7
-    BATT_CH = 0
-    BATT_DISCH = 1
-    GEN_OUT = 2
-    GRID_IMP = 3
-    GRID_EXP = 4
-    EXCESS = 5
-    UNMET = 6
+    if isinstance(warm_start_from, str):
+        if warm_start_from != "heuristic":
+            raise ValueError(
+                f"warm_start_from must be a result dict or 'heuristic', "
+                f"got {warm_start_from!r}"
+            )
+        warm_start_from = _greedy_dispatch(load_kw, re_output_kw, batt, gen, grid)
 
+    T = HOURS_PER_YEAR
     n_dispatch_vars = VARS_PER_HOUR * T
-    # SOC variables start after all dispatch variables.
     soc_offset = n_dispatch_vars
-    n_soc_vars = T if has_batt else 0
-    n_vars = n_dispatch_vars + n_soc_vars
-
-    def _idx(var_type: int, t: int) -> int:
-        """Column index for a dispatch variable at hour t."""
-        return t * VARS_PER_HOUR + var_type
-
-    def _soc_idx(t: int) -> int:
-        """Column index for the SOC variable at hour t."""
-        return soc_offset + t
-
-    # ----- Pre-compute hourly tariff prices --------------------------------
-    import_price = np.zeros(T, dtype=np.float64)
-    export_price = np.zeros(T, dtype=np.float64)
-
-    if has_grid:
-        grid_tariff: TariffBase = grid["tariff"]
-        for t in range(T):
-            month, hod = _hour_to_month_and_hod(t)
-            import_price[t] = grid_tariff.buy_price(hod, month)
-            export_price[t] = grid_tariff.sell_price(hod, month)
-
-    # ----- Build objective coefficients ------------------------------------
-    col_cost = np.zeros(n_vars, dtype=np.float64)
-
-    gen_cost_per_kw = gen["cost_per_kw"] if has_gen else 0.0
-
-    for t in range(T):
-        # Generator cost.
-        col_cost[_idx(GEN_OUT, t)] = gen_cost_per_kw if has_gen else 0.0
-
-        # Grid import cost.
-        col_cost[_idx(GRID_IMP, t)] = import_price[t] if has_grid else 0.0
-
-        # Grid export revenue (negative cost).
-        if has_grid and grid["sell_back_enabled"]:
-            col_cost[_idx(GRID_EXP, t)] = -export_price[t]
-        else:
-            col_cost[_idx(GRID_EXP, t)] = 0.0
-
-        # Excess has zero cost (curtailment is free).
-        col_cost[_idx(EXCESS, t)] = 0.0
-
-        # Unmet load penalty.
-        col_cost[_idx(UNMET, t)] = UNMET_PENALTY_PER_KWH
-
-        # Battery charge/discharge: zero direct cost (cost is implicit
-        # through the grid/gen that provides the power).
-        col_cost[_idx(BATT_CH, t)] = 0.0
-        col_cost[_idx(BATT_DISCH, t)] = 0.0
-
-    # SOC variables have zero cost.
-    # (already zero from initialization)
-
-    # ----- Variable bounds -------------------------------------------------
-    col_lower = np.zeros(n_vars, dtype=np.float64)
-    col_upper = np.full(n_vars, INF, dtype=np.float64)
-
-    for t in range(T):
-        # Battery charge/discharge bounds.
-        if has_batt:
-            col_upper[_idx(BATT_CH, t)] = batt["max_charge_kw"]
-            col_upper[_idx(BATT_DISCH, t)] = batt["max_discharge_kw"]
-        else:
-            col_upper[_idx(BATT_CH, t)] = 0.0
-            col_upper[_idx(BATT_DISCH, t)] = 0.0
-
-        # Generator bounds.
-        if has_gen:
-            # LP relaxation: allow any output between 0 and rated.
-            # (Minimum-load constraint would require MIP for on/off.)
-            col_upper[_idx(GEN_OUT, t)] = gen["rated_power_kw"]
-        else:
-            col_upper[_idx(GEN_OUT, t)] = 0.0
-
-        # Grid bounds.
-        if has_grid:
-            col_upper[_idx(GRID_IMP, t)] = grid["max_import_kw"]
-            if grid["sell_back_enabled"]:
-                col_upper[_idx(GRID_EXP, t)] = grid["max_export_kw"]
-            else:
-                col_upper[_idx(GRID_EXP, t)] = 0.0
-        else:
-            col_upper[_idx(GRID_IMP, t)] = 0.0
-            col_upper[_idx(GRID_EXP, t)] = 0.0
-
-        # Excess and unmet are non-negative (lower=0, upper=INF).
-
-    # SOC variable bounds.
-    if has_batt:
-        for t in range(T):
-            col_lower[_soc_idx(t)] = batt["min_soc_kwh"]
-            col_upper[_soc_idx(t)] = batt["max_soc_kwh"]
-
-    # ----- Build constraint matrix (sparse, row-by-row) --------------------
-    # We will collect constraints in COO format and convert to CSC.
-    row_indices: list[int] = []
-    col_indices: list[int] = []
-    values: list[float] = []
-    row_lower: list[float] = []
-    row_upper: list[float] = []
-    n_rows = 0
-
-    def _add_constraint(
-        coeffs: list[tuple[int, float]],
-        lb: float,
-        ub: float,
-    ) -> None:
-        """Register one constraint row."""
-        nonlocal n_rows
-        for col, val in coeffs:
-            row_indices.append(n_rows)
-            col_indices.append(col)
-            values.append(val)
-        row_lower.append(lb)
-        row_upper.append(ub)
-        n_rows += 1
-
-    for t in range(T):
-        month, hod = _hour_to_month_and_hod(t)
-
-        # ---- 1. Energy balance (equality) ---------------------------------
-        # re[t] + gen[t] + batt_discharge[t] + grid_import[t]
-        #   = load[t] + batt_charge[t] + grid_export[t] + excess[t] - unmet[t]
-        #
-        # Rearranged to LHS:
-        # gen[t] + batt_discharge[t] + grid_import[t]
-        #   - batt_charge[t] - grid_export[t] - excess[t] + unmet[t]
-        #   = load[t] - re[t]
-        rhs = load_kw[t] - re_output_kw[t]
-        coeffs: list[tuple[int, float]] = [
-            (_idx(BATT_DISCH, t), 1.0),
-            (_idx(BATT_CH, t), -1.0),
-            (_idx(GEN_OUT, t), 1.0),
-            (_idx(GRID_IMP, t), 1.0),
-            (_idx(GRID_EXP, t), -1.0),
-            (_idx(EXCESS, t), -1.0),
-            (_idx(UNMET, t), 1.0),
-        ]
-        _add_constraint(coeffs, rhs, rhs)
-
-        # ---- 2. Battery SOC continuity ------------------------------------
-        if has_batt:
-            # soc[t] = soc[t-1] + charge[t] * eta_one_way - discharge[t] / eta_one_way
-            # => soc[t] - charge[t] * eta + discharge[t] / eta = soc[t-1]
-            eta = batt["one_way_eff"]
-            if t == 0:
-                # soc[-1] is the initial SOC.
-                rhs_soc = batt["initial_soc_kwh"]
-            else:
-                rhs_soc = 0.0  # we add soc[t-1] coefficient below
-
-            soc_coeffs: list[tuple[int, float]] = [
-                (_soc_idx(t), 1.0),
-                (_idx(BATT_CH, t), -eta),
-                (_idx(BATT_DISCH, t), 1.0 / eta),
-            ]
-            if t > 0:
-                soc_coeffs.append((_soc_idx(t - 1), -1.0))
-
-            _add_constraint(soc_coeffs, rhs_soc, rhs_soc)
-
-    # ---- 3. Cyclic SOC constraint: soc[T-1] = initial_soc -----------------
-    if has_batt:
-        cyc_coeffs: list[tuple[int, float]] = [(_soc_idx(T - 1), 1.0)]
-        cyc_rhs = batt["initial_soc_kwh"]
-        _add_constraint(cyc_coeffs, cyc_rhs, cyc_rhs)
+    arrays = _build_lp(load_kw, re_output_kw, batt, gen, grid, lean_formulation)
+    n_vars, n_rows = arrays.n_vars, arrays.n_rows
 
     # ----- Create HiGHS model and solve ------------------------------------
-    h = highspy.Highs()
+    # A cached model with the same constraint matrix is updated in place;
+    # otherwise the whole LP goes to HiGHS in one passModel call, with the
+    # matrix in column-wise (CSC) form.
+    structure = arrays.structure
+    cache_key = structure.key
+    cached = _LP_CACHE.checkout(cache_key) if reuse_model else None
+    h = cached.highs if cached is not None else highspy.Highs()
+    h.resetOptions()
     h.silent()
-
-    # Build sparse column representation from COO data.
-    # Convert to numpy arrays for efficient handoff.
-    coo_row = np.array(row_indices, dtype=np.int32)
-    coo_col = np.array(col_indices, dtype=np.int32)
-    coo_val = np.array(values, dtype=np.float64)
-
-    # Add variables.
-    h.addVars(n_vars, col_lower, col_upper)
-
-    # Set objective (minimise).
-    h.changeObjectiveSense(highspy.ObjSense.kMinimize)
-    for j in range(n_vars):
-        if col_cost[j] != 0.0:
-            h.changeColCost(j, float(col_cost[j]))
-
-    # Add constraints row by row.  While this is not the fastest method,
-    # it avoids building a full CSC matrix in Python and is adequate for
-    # ~35k rows.
-    rl = np.array(row_lower, dtype=np.float64)
-    ru = np.array(row_upper, dtype=np.float64)
-
-    # Group entries by row for efficient addRow calls.
-    # Pre-sort by row index.
-    sort_order = np.argsort(coo_row, kind="stable")
-    coo_row = coo_row[sort_order]
-    coo_col = coo_col[sort_order]
-    coo_val = coo_val[sort_order]
-
-    # Find row boundaries.
-    row_starts = np.searchsorted(coo_row, np.arange(n_rows), side="left")
-    row_ends = np.searchsorted(coo_row, np.arange(n_rows), side="right")
-
-    for r in range(n_rows):
-        s, e = int(row_starts[r]), int(row_ends[r])
-        if s == e:
-            # Empty row (should not happen but handle gracefully).
-            h.addRow(float(rl[r]), float(ru[r]), 0, np.array([], dtype=np.int32), np.array([], dtype=np.float64))
-        else:
-            h.addRow(
-                float(rl[r]),
-                float(ru[r]),
-                int(e - s),
-                coo_col[s:e].astype(np.int32),
-                coo_val[s:e],
-            )
+    for name, value in {**DEFAULT_SOLVER_OPTIONS, **(solver_options or {})}.items():
+        if h.setOptionValue(name, value) == highspy.HighsStatus.kError:
+            raise ValueError(f"Invalid HiGHS option {name}={value!r}")
+
+    if cached is not None:
+        cached.update(
+            arrays.col_cost, arrays.col_lower, arrays.col_upper,
+            arrays.row_lower, arrays.row_upper,
+        )
+    else:
+        lp = highspy.HighsLp()
+        lp.num_col_ = n_vars
+        lp.num_row_ = n_rows
+        lp.sense_ = highspy.ObjSense.kMinimize
+        lp.offset_ = 0.0
+        lp.col_cost_ = arrays.col_cost
+        lp.col_lower_ = arrays.col_lower
+        lp.col_upper_ = arrays.col_upper
+        lp.row_lower_ = arrays.row_lower
+        lp.row_upper_ = arrays.row_upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.num_col_ = n_vars
+        lp.a_matrix_.num_row_ = n_rows
+        lp.a_matrix_.start_ = structure.a_matrix.indptr
+        lp.a_matrix_.index_ = structure.a_matrix.indices
+        lp.a_matrix_.value_ = structure.a_matrix.data
+
+        if h.passModel(lp) == highspy.HighsStatus.kError:
+            raise RuntimeError("HiGHS rejected the dispatch LP")
+
+    if warm_start_from is not None:
+        start = highspy.HighsSolution()
+        col_value = _warm_start_columns(
+            warm_start_from,
+            structure.n_full_vars,
+            batt.capacity_kwh if has_batt else None,
+        )
+        start.col_value = col_value if structure.columns is None else col_value[structure.columns]
+        start.value_valid = True
+        h.setSolution(start)
 
     # Solve.
     h.run()
@@ -489,49 +860,66 @@ def dispatch_optimal(
             f"Model status: {model_status}"
         )
 
-    sol = np.array(h.getSolution().col_value, dtype=np.float64)
+    # Older highspy returns a list; asarray avoids a second copy when the
+    # solution comes back as an array.  Extraction below writes in place.
+    sol = np.asarray(h.getSolution().col_value, dtype=np.float64)
+    if not sol.flags.writeable:
+        sol = sol.copy()
     obj_val = h.getInfoValue("objective_function_value")[1]
+    if structure.columns is not None:
+        # Scatter back into the full layout; omitted columns read as zero.
+        full = np.zeros(structure.n_full_vars, dtype=np.float64)
+        full[structure.columns] = sol
+        sol = full
 
     # ----- Extract results -------------------------------------------------
-    batt_ch = np.array([sol[_idx(BATT_CH, t)] for t in range(T)])
-    batt_disch = np.array([sol[_idx(BATT_DISCH, t)] for t in range(T)])
-    gen_out = np.array([sol[_idx(GEN_OUT, t)] for t in range(T)])
-    g_imp = np.array([sol[_idx(GRID_IMP, t)] for t in range(T)])
-    g_exp = np.array([sol[_idx(GRID_EXP, t)] for t in range(T)])
-    ex = np.array([sol[_idx(EXCESS, t)] for t in range(T)])
-    un = np.array([sol[_idx(UNMET, t)] for t in range(T)])
+    # Dispatch columns are laid out hour-major, so one reshape turns them
+    # into a (T, VARS_PER_HOUR) table whose columns are the series.
+    dispatch = sol[:n_dispatch_vars].reshape(T, VARS_PER_HOUR)
+    if lean_formulation:
+        # Curtailment is the surplus left in each energy balance row.
+        dispatch[:, EXCESS] = (
+            dispatch[:, BATT_DISCH] + dispatch[:, GEN_OUT] + dispatch[:, GRID_IMP]
+            + dispatch[:, UNMET] - dispatch[:, BATT_CH] - dispatch[:, GRID_EXP]
+            - (load_kw - re_output_kw)
+        )
+
+    # Net battery power (positive = discharge convention).
+    batt_net = dispatch[:, BATT_DISCH] - dispatch[:, BATT_CH]
+
+    # Clip tiny negative values from solver tolerance, then transpose so
+    # each series is a contiguous row.
+    np.maximum(dispatch, 0.0, out=dispatch)
+    series = np.ascontiguousarray(dispatch.T)
 
     # Battery SOC in kWh -> fraction.
     if has_batt:
-        soc_kwh = np.array([sol[_soc_idx(t)] for t in range(T)])
-        soc_frac = soc_kwh / batt["capacity_kwh"]
+        soc_kwh = sol[soc_offset:soc_offset + T]
+        soc_frac = np.divide(soc_kwh, batt.capacity_kwh, out=soc_kwh)
     else:
         soc_frac = np.zeros(T, dtype=np.float64)
 
-    # Net battery power (positive = discharge convention).
-    batt_net = batt_disch - batt_ch
-
-    # Clip tiny negative values from solver tolerance.
-    batt_ch = np.maximum(batt_ch, 0.0)
-    batt_disch = np.maximum(batt_disch, 0.0)
-    gen_out = np.maximum(gen_out, 0.0)
-    g_imp = np.maximum(g_imp, 0.0)
-    g_exp = np.maximum(g_exp, 0.0)
-    ex = np.maximum(ex, 0.0)
-    un = np.maximum(un, 0.0)
-
     objective_arr = np.zeros(T, dtype=np.float64)
     objective_arr[0] = obj_val
 
+    if reuse_model:
+        _LP_CACHE.checkin(
+            cache_key,
+            cached or _CachedLP(
+                h, arrays.col_cost, arrays.col_lower, arrays.col_upper,
+                arrays.row_lower, arrays.row_upper,
+            ),
+        )
+
     return {
-        "battery_charge": batt_ch,
-        "battery_discharge": batt_disch,
+        "battery_charge": series[BATT_CH],
+        "battery_discharge": series[BATT_DISCH],
         "battery_power": batt_net,
         "battery_soc": soc_frac,
-        "generator_output": gen_out,
-        "grid_import": g_imp,
-        "grid_export": g_exp,
-        "excess": ex,
-        "unmet": un,
+        "generator_output": series[GEN_OUT],
+        "grid_import": series[GRID_IMP],
+        "grid_export": series[GRID_EXP],
+        "excess": series[EXCESS],
+        "unmet": series[UNMET],
         "objective_value": objective_arr,
     }
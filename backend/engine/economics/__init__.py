@@ -1,6 +1,11 @@
 """Economic analysis module."""
 
-from .metrics import compute_economics
-from .sensitivity import sensitivity_analysis
+from .metrics import compute_economics, compute_npc_lcoe_batch
+from .sensitivity import sensitivity_analysis, sensitivity_analysis_stream
 
-__all__ = ["compute_economics", "sensitivity_analysis"]
+__all__ = [
+    "compute_economics",
+    "compute_npc_lcoe_batch",
+    "sensitivity_analysis",
+    "sensitivity_analysis_stream",
+]
@@ -46,6 +46,12 @@ FIJI_PRESETS: dict[str, Any] = {
     "smart_meter_cost_usd": 150.0,
 }
 
+# Defaults read by the helpers below, resolved once at import so calls in
+# sensitivity loops skip the dict lookup.
+_LOGISTICS_PREMIUM_PCT: float = FIJI_PRESETS["logistics_premium_pct"]
+_CYCLONE_DERATING_PCT: float = FIJI_PRESETS["cyclone_derating_pct"]
+_USD_TO_FJD: float = FIJI_PRESETS["usd_to_fjd"]
+
 
 # ======================================================================
 # Utility functions
@@ -68,7 +74,7 @@ def apply_logistics_premium(base_cost: float, premium_pct: float | None = None)
         Cost including logistics premium.
     """
     if premium_pct is None:
-        premium_pct = FIJI_PRESETS["logistics_premium_pct"]
+        premium_pct = _LOGISTICS_PREMIUM_PCT
     return base_cost * (1.0 + premium_pct / 100.0)
 
 
@@ -116,7 +122,7 @@ def cyclone_derating_factor(derating_pct: float | None = None) -> float:
         Factor to multiply annual PV output by (e.g. 0.95 for 5% derating).
     """
     if derating_pct is None:
-        derating_pct = FIJI_PRESETS["cyclone_derating_pct"]
+        derating_pct = _CYCLONE_DERATING_PCT
     return 1.0 - derating_pct / 100.0
 
 
@@ -169,7 +175,7 @@ def cost_per_household(
     if num_households <= 0:
         return {"usd": 0.0, "fjd": 0.0}
 
-    rate = FIJI_PRESETS["usd_to_fjd"]
+    rate = _USD_TO_FJD
 
     if currency.upper() == "FJD":
         cost_fjd = total_npc / num_households
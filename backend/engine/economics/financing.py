@@ -7,6 +7,82 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+
+def _round_list(values: np.ndarray, ndigits: int | np.ndarray) -> list[float]:
+    """``[round(v, ndigits) for v in values.flat]``, computed mostly in NumPy.
+
+    *ndigits* may be an integer array broadcast against *values*, e.g. one
+    entry per row of a table.
+
+    ``np.round`` scales, rounds and rescales, which can land one unit off
+    on values that sit almost exactly halfway (e.g. ``interest *
+    tax_rate``).  Only those near-ties go through Python's correctly
+    rounded ``round()``.
+    """
+    values, ndigits = np.broadcast_arrays(values, ndigits)
+    values = values.ravel()
+    ndigits = ndigits.ravel()
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    # The product is within half an ulp of exact, so only fractions that
+    # close to .5 can round the other way.
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 4.0 * np.spacing(
+        np.abs(scaled)
+    )
+    out = rounded.tolist()
+    for i in np.flatnonzero(near_tie).tolist():
+        out[i] = round(float(values[i]), int(ndigits[i]))
+    return out
+
+
+# Columns of the yearly cashflow table, in output order.  Every field is
+# 8 bytes wide, so the amounts can also be viewed as a plain float table.
+_CASHFLOW_DTYPE = np.dtype(
+    [("year", np.int64)]
+    + [
+        (name, np.float64)
+        for name in (
+            "equity_investment",
+            "debt_drawdown",
+            "capital_outlay",
+            "om_cost",
+            "fuel_cost",
+            "grid_cost",
+            "loan_payment",
+            "interest_payment",
+            "tax_shield",
+            "replacement_cost",
+            "revenue",
+            "net_cashflow",
+            "discount_factor",
+            "discounted_cashflow",
+            "cumulative_nominal",
+            "cumulative_discounted",
+        )
+    ]
+)
+
+
+def _cashflow_rows(yearly: np.ndarray) -> list[dict[str, float]]:
+    """Turn the yearly cashflow table into per-year dicts for the API.
+
+    Amounts are rounded to cents and discount factors to 6 decimals, all
+    in one pass over the table.
+    """
+    names = yearly.dtype.names
+    n_rows = len(yearly)
+    # All amount columns as one (column, year) float table, without a copy.
+    amounts = yearly.view(np.float64).reshape(n_rows, len(names))[:, 1:].T
+    ndigits = np.array([[6 if name == "discount_factor" else 2] for name in names[1:]])
+    flat = _round_list(amounts, ndigits)
+    columns = [yearly["year"].tolist()] + [
+        flat[i:i + n_rows] for i in range(0, len(flat), n_rows)
+    ]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
 
 def compute_wacc(
     debt_fraction: float,
@@ -23,54 +99,209 @@ def compute_wacc(
     return wacc
 
 
-def loan_amortization(
+def _amortization_table(
+    principal: float,
+    rate: float,
+    annual_payment: float,
+    n: int,
+) -> np.ndarray:
+    """Principal repaid, interest and closing balance, shape ``(3, n)``.
+
+    The balance recurrence is inherently sequential; with only tens of
+    years it is cheapest as a plain loop over Python floats.
+    """
+    table = [[0.0] * n for _ in range(3)]
+    principal_pmt, interest, balance_out = table
+    balance = principal
+    for k in range(n):
+        i = balance * rate
+        p = annual_payment - i
+        balance -= p
+        principal_pmt[k] = p
+        interest[k] = i
+        balance_out[k] = balance
+    return np.array(table)
+
+
+def _loan_schedule(
     principal: float,
     interest_rate: float,
     loan_term: int,
-) -> list[dict[str, float]]:
-    """Generate a loan amortization schedule.
+) -> tuple[list[dict[str, float]], float, float]:
+    """Amortization schedule plus its total payments and total interest.
 
-    Returns a list of dicts with keys: year, payment, principal_payment,
-    interest_payment, remaining_balance.
+    The totals are sums of the rounded per-year entries, so they agree
+    exactly with summing over the schedule afterwards.
     """
     if loan_term <= 0 or principal <= 0:
-        return []
+        return [], 0.0, 0.0
 
     if interest_rate <= 0:
         annual_payment = principal / loan_term
-        schedule = []
+        payment = round(annual_payment, 2)
+        balances = np.empty(loan_term, dtype=np.float64)
         balance = principal
-        for yr in range(1, loan_term + 1):
-            schedule.append({
-                "year": yr,
-                "payment": round(annual_payment, 2),
-                "principal_payment": round(annual_payment, 2),
-                "interest_payment": 0.0,
-                "remaining_balance": round(max(balance - annual_payment, 0.0), 2),
-            })
+        for k in range(loan_term):
             balance -= annual_payment
-        return schedule
+            balances[k] = balance
+        np.maximum(balances, 0.0, out=balances)
+        remaining = _round_list(balances, 2)
+        schedule = [
+            {
+                "year": k + 1,
+                "payment": payment,
+                "principal_payment": payment,
+                "interest_payment": 0.0,
+                "remaining_balance": remaining[k],
+            }
+            for k in range(loan_term)
+        ]
+        return schedule, sum([payment] * loan_term), 0.0
 
     # Standard amortization formula
     r = interest_rate
     n = loan_term
-    annual_payment = principal * r * (1 + r) ** n / ((1 + r) ** n - 1)
+    growth = (1 + r) ** n
+    annual_payment = principal * r * growth / (growth - 1)
+    table = _amortization_table(principal, r, annual_payment, n)
+    np.maximum(table[2], 0.0, out=table[2])
 
-    schedule = []
-    balance = principal
-    for yr in range(1, n + 1):
-        interest = balance * r
-        principal_pmt = annual_payment - interest
-        balance -= principal_pmt
-        schedule.append({
-            "year": yr,
-            "payment": round(annual_payment, 2),
-            "principal_payment": round(principal_pmt, 2),
-            "interest_payment": round(interest, 2),
-            "remaining_balance": round(max(balance, 0.0), 2),
-        })
+    # Round all three series in one pass, then split them again.
+    rounded = _round_list(table.ravel(), 2)
+    payment = round(annual_payment, 2)
+    schedule = [
+        {
+            "year": k + 1,
+            "payment": payment,
+            "principal_payment": rounded[k],
+            "interest_payment": rounded[n + k],
+            "remaining_balance": rounded[2 * n + k],
+        }
+        for k in range(n)
+    ]
+    return schedule, sum([payment] * n), sum(rounded[n:2 * n])
+
+
+def loan_amortization(
+    principal: float,
+    interest_rate: float,
+    loan_term: int,
+) -> list[dict[str, float]]:
+    """Generate a loan amortization schedule.
+
+    Returns a list of dicts with keys: year, payment, principal_payment,
+    interest_payment, remaining_balance.
+    """
+    return _loan_schedule(principal, interest_rate, loan_term)[0]
 
-    return schedule
+
+def _cashflow_table(
+    cost_breakdown: dict,
+    lifetime_years: int,
+    discount_rate: float,
+    debt_fraction: float = 0.7,
+    interest_rate: float = 0.06,
+    loan_term: int = 10,
+    equity_cost: float = 0.12,
+    tax_rate: float = 0.0,
+    om_escalation: float = 0.02,
+    annual_revenue: float = 0.0,
+) -> tuple[np.ndarray, dict, list[dict[str, float]]]:
+    """Yearly cashflow table plus the summary figures derived from it.
+
+    Shared by :func:`cashflow_projection` and
+    :func:`cashflow_projection_summary`; see the former for parameters.
+    Returns ``(yearly, summary, loan_schedule)``.
+    """
+    capital_total = float(cost_breakdown.get("capital_total", 0))
+    om_annual_base = float(cost_breakdown.get("om_npv", 0)) / max(lifetime_years, 1) if "om_annual" not in cost_breakdown else sum(
+        v for v in (cost_breakdown.get("om_annual", {}) if isinstance(cost_breakdown.get("om_annual"), dict) else {}).values()
+    )
+    fuel_annual = float(cost_breakdown.get("fuel_annual", 0))
+    grid_annual = float(cost_breakdown.get("grid_annual", 0))
+    replacement_years = cost_breakdown.get("replacement_years", [])
+    replacement_cost = float(cost_breakdown.get("replacement_cost_each", 0))
+
+    # Compute WACC
+    wacc = compute_wacc(debt_fraction, interest_rate, equity_cost, tax_rate)
+
+    # Loan schedule
+    debt_amount = capital_total * debt_fraction
+    equity_amount = capital_total * (1.0 - debt_fraction)
+    loan_schedule, total_debt_service, total_interest = _loan_schedule(
+        debt_amount, interest_rate, loan_term
+    )
+
+    # Build yearly cashflows as a table with one row per year (year 0 is
+    # the investment) and one column per quantity; rows are only turned
+    # into dicts for the output.
+    n = max(lifetime_years, 0)
+    yearly = np.zeros(n + 1, dtype=_CASHFLOW_DTYPE)
+    yearly["year"] = np.arange(n + 1)
+    years = yearly["year"][1:]
+
+    yearly["equity_investment"][0] = -equity_amount
+    yearly["debt_drawdown"][0] = debt_amount
+    yearly["capital_outlay"][0] = -capital_total
+
+    # Loan payments as scheduled (already rounded to cents), zero after
+    # the loan term.
+    loan_pmt = np.zeros(n)
+    interest_pmt = np.zeros(n)
+    n_loan = min(n, len(loan_schedule))
+    loan_pmt[:n_loan] = [e["payment"] for e in loan_schedule[:n_loan]]
+    interest_pmt[:n_loan] = [e["interest_payment"] for e in loan_schedule[:n_loan]]
+
+    # O&M with escalation
+    om = om_annual_base * (1.0 + om_escalation) ** (years - 1.0)
+    fuel = fuel_annual
+    grid = grid_annual
+    repl = np.where(np.isin(years, replacement_years), replacement_cost, 0.0)
+
+    # Tax shield on interest
+    tax_shield = interest_pmt * tax_rate
+
+    # Net cashflow
+    revenue = annual_revenue
+    net = revenue - om - fuel - grid - loan_pmt + tax_shield - repl
+
+    df = 1.0 / (1.0 + discount_rate) ** years.astype(np.float64)
+
+    body = yearly[1:]
+    body["om_cost"] = -om
+    body["fuel_cost"] = -fuel
+    body["grid_cost"] = -grid
+    body["loan_payment"] = -loan_pmt
+    body["interest_payment"] = -interest_pmt
+    body["tax_shield"] = tax_shield
+    body["replacement_cost"] = -repl
+    body["revenue"] = revenue
+    body["net_cashflow"] = net
+    body["discount_factor"] = df
+    body["discounted_cashflow"] = net * df
+
+    yearly["net_cashflow"][0] = -equity_amount
+    yearly["discount_factor"][0] = 1.0
+    yearly["discounted_cashflow"][0] = -equity_amount
+
+    # Cumulative sums start from the year-0 equity outlay.
+    yearly["cumulative_nominal"] = np.cumsum(yearly["net_cashflow"])
+    yearly["cumulative_discounted"] = np.cumsum(yearly["discounted_cashflow"])
+
+    breakeven_year = None
+    positive = np.flatnonzero(yearly["cumulative_discounted"][1:] >= 0)
+    if positive.size:
+        breakeven_year = int(positive[0]) + 1
+
+    return yearly, {
+        "wacc": round(wacc, 6),
+        "debt_amount": round(debt_amount, 2),
+        "equity_amount": round(equity_amount, 2),
+        "breakeven_year": breakeven_year,
+        "npv": round(float(yearly["cumulative_discounted"][-1]), 2),
+        "total_debt_service": round(total_debt_service, 2),
+        "total_interest": round(total_interest, 2),
+    }, loan_schedule
 
 
 def cashflow_projection(
@@ -114,106 +345,49 @@ def cashflow_projection(
     -------
     dict with wacc, loan_schedule, yearly_cashflows, breakeven_year, totals.
     """
-    capital_total = float(cost_breakdown.get("capital_total", 0))
-    om_annual_base = float(cost_breakdown.get("om_npv", 0)) / max(lifetime_years, 1) if "om_annual" not in cost_breakdown else sum(
-        v for v in (cost_breakdown.get("om_annual", {}) if isinstance(cost_breakdown.get("om_annual"), dict) else {}).values()
+    yearly, summary, loan_schedule = _cashflow_table(
+        cost_breakdown, lifetime_years, discount_rate, debt_fraction,
+        interest_rate, loan_term, equity_cost, tax_rate, om_escalation,
+        annual_revenue,
     )
-    fuel_annual = float(cost_breakdown.get("fuel_annual", 0))
-    grid_annual = float(cost_breakdown.get("grid_annual", 0))
-    replacement_years = cost_breakdown.get("replacement_years", [])
-    replacement_cost = float(cost_breakdown.get("replacement_cost_each", 0))
-
-    # Compute WACC
-    wacc = compute_wacc(debt_fraction, interest_rate, equity_cost, tax_rate)
+    return {
+        "wacc": summary["wacc"],
+        "debt_amount": summary["debt_amount"],
+        "equity_amount": summary["equity_amount"],
+        "loan_schedule": loan_schedule,
+        "yearly_cashflows": _cashflow_rows(yearly),
+        "breakeven_year": summary["breakeven_year"],
+        "total_debt_service": summary["total_debt_service"],
+        "total_interest": summary["total_interest"],
+    }
 
-    # Loan schedule
-    debt_amount = capital_total * debt_fraction
-    equity_amount = capital_total * (1.0 - debt_fraction)
-    loan_schedule = loan_amortization(debt_amount, interest_rate, loan_term)
 
-    # Build yearly cashflows
-    yearly = []
-    cumulative_nominal = 0.0
-    cumulative_discounted = 0.0
-    breakeven_year = None
+def cashflow_projection_summary(
+    cost_breakdown: dict,
+    lifetime_years: int,
+    discount_rate: float,
+    debt_fraction: float = 0.7,
+    interest_rate: float = 0.06,
+    loan_term: int = 10,
+    equity_cost: float = 0.12,
+    tax_rate: float = 0.0,
+    om_escalation: float = 0.02,
+    annual_revenue: float = 0.0,
+) -> dict:
+    """Headline figures of :func:`cashflow_projection` without the tables.
 
-    for yr in range(0, lifetime_years + 1):
-        entry: dict[str, float] = {"year": yr}
-
-        if yr == 0:
-            entry["equity_investment"] = -equity_amount
-            entry["debt_drawdown"] = debt_amount
-            entry["capital_outlay"] = -capital_total
-            entry["om_cost"] = 0.0
-            entry["fuel_cost"] = 0.0
-            entry["grid_cost"] = 0.0
-            entry["loan_payment"] = 0.0
-            entry["interest_payment"] = 0.0
-            entry["tax_shield"] = 0.0
-            entry["replacement_cost"] = 0.0
-            entry["revenue"] = 0.0
-            entry["net_cashflow"] = -equity_amount
-            entry["discount_factor"] = 1.0
-            entry["discounted_cashflow"] = -equity_amount
-            cumulative_nominal = -equity_amount
-            cumulative_discounted = -equity_amount
-        else:
-            # O&M with escalation
-            om = om_annual_base * (1.0 + om_escalation) ** (yr - 1)
-            fuel = fuel_annual
-            grid = grid_annual
-            repl = replacement_cost if yr in replacement_years else 0.0
-
-            # Loan payment
-            loan_pmt = 0.0
-            interest_pmt = 0.0
-            if yr <= loan_term and loan_schedule:
-                ls = loan_schedule[yr - 1]
-                loan_pmt = ls["payment"]
-                interest_pmt = ls["interest_payment"]
-
-            # Tax shield on interest
-            tax_shield = interest_pmt * tax_rate
-
-            # Net cashflow
-            revenue = annual_revenue
-            net = revenue - om - fuel - grid - loan_pmt + tax_shield - repl
-
-            df = 1.0 / (1.0 + discount_rate) ** yr
-
-            entry["equity_investment"] = 0.0
-            entry["debt_drawdown"] = 0.0
-            entry["capital_outlay"] = 0.0
-            entry["om_cost"] = -round(om, 2)
-            entry["fuel_cost"] = -round(fuel, 2)
-            entry["grid_cost"] = -round(grid, 2)
-            entry["loan_payment"] = -round(loan_pmt, 2)
-            entry["interest_payment"] = -round(interest_pmt, 2)
-            entry["tax_shield"] = round(tax_shield, 2)
-            entry["replacement_cost"] = -round(repl, 2)
-            entry["revenue"] = round(revenue, 2)
-            entry["net_cashflow"] = round(net, 2)
-            entry["discount_factor"] = round(df, 6)
-            entry["discounted_cashflow"] = round(net * df, 2)
-
-            cumulative_nominal += net
-            cumulative_discounted += net * df
-
-        entry["cumulative_nominal"] = round(cumulative_nominal, 2)
-        entry["cumulative_discounted"] = round(cumulative_discounted, 2)
-
-        if breakeven_year is None and cumulative_discounted >= 0 and yr > 0:
-            breakeven_year = yr
-
-        yearly.append(entry)
+    Takes the same parameters but does not convert the per-year cashflow
+    table into dicts, for callers that only compare or rank financing
+    options.
 
-    return {
-        "wacc": round(wacc, 6),
-        "debt_amount": round(debt_amount, 2),
-        "equity_amount": round(equity_amount, 2),
-        "loan_schedule": loan_schedule,
-        "yearly_cashflows": yearly,
-        "breakeven_year": breakeven_year,
-        "total_debt_service": round(sum(e["payment"] for e in loan_schedule), 2),
-        "total_interest": round(sum(e["interest_payment"] for e in loan_schedule), 2),
-    }
+    Returns
+    -------
+    dict with wacc, debt_amount, equity_amount, breakeven_year, npv
+    (final cumulative discounted cashflow), total_debt_service and
+    total_interest.
+    """
+    return _cashflow_table(
+        cost_breakdown, lifetime_years, discount_rate, debt_fraction,
+        interest_rate, loan_term, equity_cost, tax_rate, om_escalation,
+        annual_revenue,
+    )[1]
@@ -10,10 +10,11 @@ All monetary values are in USD ($).  Energy is in kWh or kW as noted.
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 try:
     from scipy.optimize import brentq
@@ -39,10 +40,47 @@ def _discount_factor(rate: float, year: int) -> float:
 
 
 def _annuity_factor(rate: float, years: int) -> float:
-    """Present-value annuity factor: sum of discount factors for years 1..N."""
+    """Present-value annuity factor: sum of discount factors for years 1..N.
+
+    Closed form ``(1 - (1 + r)**-N) / r``, evaluated with ``expm1`` /
+    ``log1p`` so that it stays accurate for rates close to zero.
+    """
     if rate == 0:
         return float(years)
-    return sum(_discount_factor(rate, y) for y in range(1, years + 1))
+    return -math.expm1(-years * math.log1p(rate)) / rate
+
+
+def _growing_annuity_factor(rate: float, growth: float, years: int) -> float:
+    """Present value of 1 in year 1, growing by *growth* a year, over N years.
+
+    ``sum((1 + g)**(y - 1) / (1 + r)**y for y in 1..N)``: a geometric
+    series with ratio ``(1 + g) / (1 + r)``, summed in closed form.
+    """
+    # ratio - 1, without the cancellation of forming the ratio first.
+    x = (growth - rate) / (1.0 + rate)
+    if x == 0:
+        series = float(years)
+    else:
+        series = math.expm1(years * math.log1p(x)) / x
+    return series / (1.0 + rate)
+
+
+def _annuity_factor_array(rate: NDArray[np.float64], years: int) -> NDArray[np.float64]:
+    """Elementwise :func:`_annuity_factor` for an array of rates."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = -np.expm1(-years * np.log1p(rate)) / rate
+    return np.where(rate == 0, float(years), factor)
+
+
+def _growing_annuity_factor_array(
+    rate: NDArray[np.float64], growth: NDArray[np.float64], years: int
+) -> NDArray[np.float64]:
+    """Elementwise :func:`_growing_annuity_factor`."""
+    x = (growth - rate) / (1.0 + rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        series = np.expm1(years * np.log1p(x)) / x
+    series = np.where(x == 0, float(years), series)
+    return series / (1.0 + rate)
 
 
 def _get_component(
@@ -193,13 +231,8 @@ def _battery_replacement_years(
     cycles_per_year = daily_cycles * 365.0
     years_to_eol = cycle_life / cycles_per_year
 
-    replacement_years: list[int] = []
-    year = int(np.ceil(years_to_eol))
-    while year < lifetime_years:
-        replacement_years.append(year)
-        year += int(np.ceil(years_to_eol))
-
-    return replacement_years
+    step = math.ceil(years_to_eol)
+    return list(range(step, lifetime_years, step))
 
 
 def _battery_replacement_cost(components: dict[str, dict]) -> float:
@@ -277,8 +310,16 @@ def _compute_irr(cash_flows: list[float]) -> float | None:
     if brentq is None:
         return None
 
+    # Horner's scheme from the last year back: one division per year
+    # instead of a power per term.
+    reversed_flows = [float(cf) for cf in reversed(cash_flows)]
+
     def npv_at_rate(r: float) -> float:
-        return sum(cf / (1.0 + r) ** t for t, cf in enumerate(cash_flows))
+        growth = 1.0 + r
+        npv = 0.0
+        for cf in reversed_flows:
+            npv = npv / growth + cf
+        return npv
 
     # Search for a root in a reasonable range.
     try:
@@ -327,6 +368,8 @@ def compute_economics(
         ``cost_breakdown``, ``annual_costs``.
     """
     r = discount_rate
+    # Discount factors for years 0..N, computed once.
+    discount = (1.0 + r) ** -np.arange(max(lifetime_years, 0) + 1, dtype=np.float64)
 
     # ------------------------------------------------------------------
     # 1. Capital costs (year 0)
@@ -351,10 +394,9 @@ def compute_economics(
         results, components, fuel_escalation
     )
 
-    fuel_npv = 0.0
-    for yr in range(1, lifetime_years + 1):
-        escalated = base_fuel_cost * (1.0 + fuel_escalation) ** (yr - 1)
-        fuel_npv += escalated * _discount_factor(r, yr)
+    fuel_npv = base_fuel_cost * _growing_annuity_factor(
+        r, fuel_escalation, lifetime_years
+    )
 
     # ------------------------------------------------------------------
     # 4. Grid costs (discounted)
@@ -366,17 +408,16 @@ def compute_economics(
     # 5. Battery replacement costs
     # ------------------------------------------------------------------
     replacement_years = _battery_replacement_years(components, lifetime_years)
+    # For the per-year membership test in the cost schedule.
+    replacement_year_set = frozenset(replacement_years)
     single_replacement = _battery_replacement_cost(components)
-    replacement_npv = sum(
-        single_replacement * _discount_factor(r, yr)
-        for yr in replacement_years
-    )
+    replacement_npv = single_replacement * float(discount[replacement_years].sum())
 
     # ------------------------------------------------------------------
     # 6. Salvage value (subtracted from NPC)
     # ------------------------------------------------------------------
     salvage = _salvage_value(components, cap_costs, lifetime_years)
-    salvage_npv = salvage * _discount_factor(r, lifetime_years)
+    salvage_npv = salvage * float(discount[-1])
 
     # ------------------------------------------------------------------
     # 7. Net Present Cost
@@ -419,14 +460,11 @@ def compute_economics(
     annual_operating = total_om_annual + base_fuel_cost + base_grid_cost
     annual_savings = grid_only_annual - annual_operating
 
-    # Build cash flow series for IRR.
-    cash_flows = [-total_capital]
-    for yr in range(1, lifetime_years + 1):
-        cf = annual_savings
-        # Subtract replacement cost in replacement years.
-        if yr in replacement_years:
-            cf -= single_replacement
-        cash_flows.append(cf)
+    # Build cash flow series for IRR, less replacement costs in
+    # replacement years.
+    cash_flows = [-total_capital] + [annual_savings] * max(lifetime_years, 0)
+    for yr in replacement_years:
+        cash_flows[yr] -= single_replacement
 
     irr = _compute_irr(cash_flows)
 
@@ -458,29 +496,34 @@ def compute_economics(
         "salvage_npv": salvage_npv,
     }
 
-    # Per-year cost schedule for detailed analysis.
-    annual_costs: list[dict[str, float]] = []
-    for yr in range(0, lifetime_years + 1):
-        entry: dict[str, float] = {"year": yr}
-        if yr == 0:
-            entry["capital"] = total_capital
-            entry["om"] = 0.0
-            entry["fuel"] = 0.0
-            entry["grid"] = 0.0
-            entry["replacement"] = 0.0
-            entry["total"] = total_capital
-        else:
-            escalated_fuel = base_fuel_cost * (1.0 + fuel_escalation) ** (yr - 1)
-            repl = single_replacement if yr in replacement_years else 0.0
-            year_total = total_om_annual + escalated_fuel + base_grid_cost + repl
-            entry["capital"] = 0.0
-            entry["om"] = total_om_annual
-            entry["fuel"] = escalated_fuel
-            entry["grid"] = base_grid_cost
-            entry["replacement"] = repl
-            entry["total"] = year_total
-            entry["discounted_total"] = year_total * _discount_factor(r, yr)
-        annual_costs.append(entry)
+    # Per-year cost schedule for detailed analysis.  Fuel escalation is a
+    # running product, updated once per year.
+    annual_costs: list[dict[str, float]] = [{
+        "year": 0,
+        "capital": total_capital,
+        "om": 0.0,
+        "fuel": 0.0,
+        "grid": 0.0,
+        "replacement": 0.0,
+        "total": total_capital,
+    }]
+    escalation_step = 1.0 + fuel_escalation
+    escalated_fuel = base_fuel_cost
+    year_discount = discount.tolist()
+    for yr in range(1, lifetime_years + 1):
+        repl = single_replacement if yr in replacement_year_set else 0.0
+        year_total = total_om_annual + escalated_fuel + base_grid_cost + repl
+        annual_costs.append({
+            "year": yr,
+            "capital": 0.0,
+            "om": total_om_annual,
+            "fuel": escalated_fuel,
+            "grid": base_grid_cost,
+            "replacement": repl,
+            "total": year_total,
+            "discounted_total": year_total * year_discount[yr],
+        })
+        escalated_fuel *= escalation_step
 
     return {
         "npc": npc,
@@ -490,3 +533,87 @@ def compute_economics(
         "cost_breakdown": cost_breakdown,
         "annual_costs": annual_costs,
     }
+
+
+# ======================================================================
+# Batch evaluation
+# ======================================================================
+
+def compute_npc_lcoe_batch(
+    capital: ArrayLike,
+    om_annual: ArrayLike,
+    fuel_annual: ArrayLike,
+    grid_annual: ArrayLike,
+    annual_load_kwh: ArrayLike,
+    lifetime_years: int = 25,
+    discount_rate: ArrayLike = 0.08,
+    fuel_escalation: ArrayLike = 0.0,
+    replacement_cost: ArrayLike = 0.0,
+    replacement_interval: ArrayLike = 0,
+    salvage: ArrayLike = 0.0,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """NPC and LCOE for many scenarios at once.
+
+    Evaluates the closed-form NPC of :func:`compute_economics` (capital +
+    discounted O&M, escalating fuel, grid and battery replacements, minus
+    discounted salvage) and the matching LCOE, vectorised over scenarios.
+    Use it to rank a sweep of candidate systems without building a full
+    result dict for each.
+
+    Parameters
+    ----------
+    capital, om_annual, fuel_annual, grid_annual : array_like
+        Per-scenario capital cost and base-year O&M, fuel and net grid
+        costs ($).
+    annual_load_kwh : array_like
+        Energy served per year (kWh); LCOE is 0 where this is not positive.
+    lifetime_years : int
+        Project analysis period, shared by all scenarios.
+    discount_rate, fuel_escalation : array_like
+        Annual rates, scalar or per scenario.
+    replacement_cost : array_like
+        Cost of one battery replacement ($).
+    replacement_interval : array_like of int
+        Years between battery replacements, as in
+        ``cost_breakdown["replacement_years"]``; 0 means none.
+    salvage : array_like
+        Undiscounted salvage value at the end of the period ($).
+
+    All array arguments broadcast against each other.
+
+    Returns
+    -------
+    npc, lcoe : ndarray
+        Net present cost ($) and levelised cost ($/kWh) per scenario.
+    """
+    arrays = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (
+            capital, om_annual, fuel_annual, grid_annual, annual_load_kwh,
+            discount_rate, fuel_escalation, replacement_cost, salvage,
+        )),
+        np.asarray(replacement_interval, dtype=np.int64),
+    )
+    (capital, om, fuel, grid, load, r, escalation,
+     repl_cost, salvage, interval) = arrays
+
+    annuity = _annuity_factor_array(r, lifetime_years)
+    years = np.arange(max(lifetime_years, 0) + 1)
+    discount = (1.0 + r[..., None]) ** -years.astype(np.float64)
+
+    # Replacement years are multiples of the interval before end of life.
+    step = interval[..., None]
+    is_replacement = (step > 0) & (years > 0) & (years < lifetime_years)
+    is_replacement &= years % np.maximum(step, 1) == 0
+    replacement_df = np.where(is_replacement, discount, 0.0).sum(axis=-1)
+
+    npc = (
+        capital
+        + om * annuity
+        + fuel * _growing_annuity_factor_array(r, escalation, lifetime_years)
+        + grid * annuity
+        + repl_cost * replacement_df
+        - salvage * discount[..., -1]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lcoe = np.where(load > 0, npc / (load * annuity), 0.0)
+    return npc, lcoe
@@ -5,6 +5,7 @@ score for ranking design alternatives.
 """
 from __future__ import annotations
 
+import numpy as np
 
 # Metrics where lower values are better
 LOWER_IS_BETTER = {"npc", "lcoe", "payback_years", "co2_emissions_kg"}
@@ -12,6 +13,33 @@ LOWER_IS_BETTER = {"npc", "lcoe", "payback_years", "co2_emissions_kg"}
 HIGHER_IS_BETTER = {"irr", "renewable_fraction"}
 
 
+def _normalized_matrix(scenarios: list[dict], metric_keys: list[str]) -> np.ndarray:
+    """Min-max normalized metrics, shape ``(len(scenarios), len(metric_keys))``.
+
+    See :func:`normalize_metrics` for the scaling; missing values are 0.0.
+    """
+    # Missing values (None) become NaN in the conversion; +inf is
+    # treated as missing too.
+    raw = np.array(
+        [[s.get(k) for k in metric_keys] for s in scenarios], dtype=np.float64
+    ).reshape(len(scenarios), len(metric_keys))
+    raw[raw == np.inf] = np.nan
+    valid = ~np.isnan(raw)
+
+    min_v = np.where(valid, raw, np.inf).min(axis=0)
+    max_v = np.where(valid, raw, -np.inf).max(axis=0)
+    span = max_v - min_v
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = (raw - min_v) / span
+    # Lower is better: best (min) → 1.0, worst (max) → 0.0.
+    # Higher is better: best (max) → 1.0, worst (min) → 0.0.
+    lower = np.array([k in LOWER_IS_BETTER for k in metric_keys], dtype=bool)
+    scaled = np.where(lower, 1.0 - scaled, scaled)
+    scaled = np.where(span == 0, 1.0, scaled)  # All same value
+    return np.where(valid, scaled, 0.0)
+
+
 def normalize_metrics(
     scenarios: list[dict],
     metric_keys: list[str] | None = None,
@@ -39,42 +67,15 @@ def normalize_metrics(
     if metric_keys is None:
         metric_keys = list(LOWER_IS_BETTER | HIGHER_IS_BETTER)
 
+    matrix = _normalized_matrix(scenarios, metric_keys)
+
     normalized = []
-    for s in scenarios:
-        entry = {k: v for k, v in s.items() if k not in metric_keys}
+    metric_set = set(metric_keys)
+    for s, row in zip(scenarios, matrix.tolist()):
+        entry = {k: v for k, v in s.items() if k not in metric_set}
+        entry.update(zip(metric_keys, row))
         normalized.append(entry)
 
-    for key in metric_keys:
-        values = []
-        for s in scenarios:
-            v = s.get(key)
-            if v is not None and v != float("inf"):
-                values.append(float(v))
-            else:
-                values.append(None)
-
-        valid = [v for v in values if v is not None]
-        if not valid or len(valid) < 1:
-            for i in range(len(scenarios)):
-                normalized[i][key] = 0.0
-            continue
-
-        min_v = min(valid)
-        max_v = max(valid)
-        span = max_v - min_v
-
-        for i, v in enumerate(values):
-            if v is None:
-                normalized[i][key] = 0.0
-            elif span == 0:
-                normalized[i][key] = 1.0  # All same value
-            elif key in LOWER_IS_BETTER:
-                # Lower is better: best (min) → 1.0, worst (max) → 0.0
-                normalized[i][key] = 1.0 - (v - min_v) / span
-            else:
-                # Higher is better: best (max) → 1.0, worst (min) → 0.0
-                normalized[i][key] = (v - min_v) / span
-
     return normalized
 
 
@@ -112,23 +113,21 @@ def score_scenarios(
     total_w = sum(weights.get(m, 0) for m in available)
     if total_w <= 0:
         total_w = 1.0
-    norm_weights = {m: weights.get(m, 0) / total_w for m in available}
+    weight_vec = np.array([weights.get(m, 0) / total_w for m in available], dtype=np.float64)
 
-    # Normalize metrics
-    normalized = normalize_metrics(scenarios, available)
+    # Normalize metrics, then take the weighted sum for every scenario at once
+    normalized = _normalized_matrix(scenarios, available)
+    composite = normalized @ weight_vec
 
-    # Compute composite score
     scored = []
-    for i, (orig, norm) in enumerate(zip(scenarios, normalized)):
-        composite = sum(
-            norm.get(m, 0) * norm_weights.get(m, 0)
-            for m in available
-        )
+    for i, (orig, norm_row, score) in enumerate(
+        zip(scenarios, normalized.tolist(), composite.tolist())
+    ):
         scored.append({
             "simulation_id": orig.get("simulation_id", ""),
             "simulation_name": orig.get("simulation_name", f"Scenario {i+1}"),
-            "score": round(composite, 4),
-            "normalized": {m: round(norm.get(m, 0), 4) for m in available},
+            "score": round(score, 4),
+            "normalized": {m: round(v, 4) for m, v in zip(available, norm_row)},
             "raw": {m: orig.get(m) for m in available},
         })
 
@@ -3,12 +3,21 @@
 Provides one-at-a-time (OAT) sensitivity sweeps suitable for spider
 plots and tornado diagrams.  Each variable is varied independently
 while all others remain at their base-case values.
+
+The sweep points are independent, so they can be evaluated on a process
+pool (see the ``max_workers`` argument of :func:`sensitivity_analysis`).
+:func:`sensitivity_analysis_stream` yields the results point by point,
+for callers that render them incrementally.
 """
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Callable
+import hashlib
+import math
+import pickle
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, Optional
 
 import numpy as np
 
@@ -17,43 +26,45 @@ import numpy as np
 # Helpers
 # ======================================================================
 
-def _set_nested(d: dict, path: str, value: Any) -> dict:
-    """Set a value in a nested dict using a dot-separated *path*.
+def _with_override(d: dict, keys: tuple[str, ...], value: Any) -> dict:
+    """Copy of *d* with the value at a nested key path replaced.
+
+    Only the dicts along *keys* are copied; every other branch is shared
+    with *d*, which is left untouched.  Missing or non-dict intermediate
+    levels are replaced by new dicts.
 
     Parameters
     ----------
     d : dict
-        The dictionary to modify (a deep copy is recommended beforehand).
-    path : str
-        Dot-separated key path, e.g. ``"diesel_generator.fuel_price"``.
+        Source dictionary.
+    keys : tuple[str, ...]
+        Key path, e.g. ``("diesel_generator", "fuel_price")``.
     value : Any
-        The value to assign at the terminal key.
+        The value to place at the terminal key.
 
     Returns
     -------
     dict
-        The modified dictionary (same reference as *d*).
+        The new top-level dictionary.
     """
-    keys = path.split(".")
-    obj = d
-    for key in keys[:-1]:
-        # Navigate into nested dicts; create intermediate dicts if absent.
-        if key not in obj or not isinstance(obj[key], dict):
-            obj[key] = {}
-        obj = obj[key]
-    obj[keys[-1]] = value
-    return d
+    head, rest = keys[0], keys[1:]
+    if not rest:
+        return {**d, head: value}
+    child = d.get(head)
+    if not isinstance(child, dict):
+        child = {}
+    return {**d, head: _with_override(child, rest, value)}
 
 
-def _get_nested(d: dict, path: str, default: Any = None) -> Any:
+def _get_nested(d: dict, path: str | tuple[str, ...], default: Any = None) -> Any:
     """Retrieve a value from a nested dict using a dot-separated *path*.
 
     Parameters
     ----------
     d : dict
         Source dictionary.
-    path : str
-        Dot-separated key path.
+    path : str or tuple[str, ...]
+        Dot-separated key path, or the same path already split into keys.
     default : Any
         Value to return if the path does not exist.
 
@@ -62,7 +73,7 @@ def _get_nested(d: dict, path: str, default: Any = None) -> Any:
     Any
         The value found at *path*, or *default*.
     """
-    keys = path.split(".")
+    keys = path.split(".") if isinstance(path, str) else path
     obj = d
     for key in keys:
         if not isinstance(obj, dict) or key not in obj:
@@ -77,28 +88,261 @@ def _get_nested(d: dict, path: str, default: Any = None) -> Any:
 
 _METRIC_KEYS = ("npc", "lcoe", "irr", "payback_years")
 
+# One run's metrics, in _METRIC_KEYS order; converted to dicts only for the
+# output.
+_Metrics = namedtuple("_Metrics", _METRIC_KEYS)
+
 
-def _extract_metrics(result: dict) -> dict[str, float | None]:
-    """Pull the standard economic metrics out of a run result."""
+def _extract_metrics(result: dict) -> _Metrics:
+    """Pull the standard economic metrics out of a run result.
+
+    A metric that is missing or ``None`` becomes NaN, so it propagates
+    through arithmetic instead of passing for zero.
+    """
+    return _Metrics._make(
+        math.nan if (v := result.get(k)) is None else v for k in _METRIC_KEYS
+    )
+
+
+def _stable_hash(params: dict) -> bytes:
+    """Digest identifying a parameter set, for the evaluation cache."""
+    blob = pickle.dumps(params, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.blake2b(blob, digest_size=16).digest()
+
+
+def _run_metrics(run_fn: Callable[[dict], dict], params: dict) -> dict:
+    """Evaluate one parameter set; module-level so worker processes can run it.
+
+    Only the metric entries are returned, to keep what a worker sends back
+    small.  :func:`_extract_metrics` is applied in the calling process, so
+    every missing metric is the same ``math.nan`` object and results
+    compare equal however they were evaluated.
+    """
+    result = run_fn(params)
     return {k: result.get(k) for k in _METRIC_KEYS}
 
 
+def _plan_sweeps(
+    base_params: dict, variables: list[dict]
+) -> tuple[list[dict], list[list[float]], list[list[int]]]:
+    """Build every parameter set: the base case, then each sweep.
+
+    Returns the parameter sets, the sweep values of every variable and,
+    for every sweep point, the index of the parameter set it evaluates.
+    """
+    # Sweep points copy only the dicts along the varied path and share the
+    # rest of the parameter tree (including weather/load arrays) with the
+    # base case, so building each set costs O(path depth).
+    shared = {
+        "components": base_params["components"],
+        "project": base_params["project"],
+        "dispatch_strategy": base_params["dispatch_strategy"],
+        "weather": base_params["weather"],
+        "load_kw": base_params["load_kw"],
+    }
+    param_sets: list[dict] = [dict(base_params)]
+    sweeps: list[list[float]] = []
+    # Index into param_sets for every sweep point.  A point at the base
+    # value reuses the base case, and a (path, value) pair seen before
+    # reuses that evaluation, so neither is run twice.  The base case is
+    # only reused when it holds exactly the keys every sweep point gets;
+    # with extra keys it would not be evaluated like its neighbours.
+    reuse_base = base_params.keys() == shared.keys()
+    slots: list[list[int]] = []
+    seen: dict[tuple[str, float], int] = {}
+
+    for var in variables:
+        param_path: str = var["param_path"]
+        val_range: list[float] = var["range"]
+        n_points: int = int(var.get("points", 11))
+
+        if n_points < 2:
+            n_points = 2
+
+        sweep_values = np.linspace(
+            float(val_range[0]), float(val_range[1]), n_points
+        ).tolist()
+        sweeps.append(sweep_values)
+        # Split the path once for every point of this variable.
+        keys = tuple(param_path.split("."))
+        base_val = _get_nested(base_params, keys)
+        if isinstance(base_val, bool) or not isinstance(base_val, (int, float)):
+            base_val = None
+
+        var_slots: list[int] = []
+        slots.append(var_slots)
+        for val in sweep_values:
+            if (
+                reuse_base
+                and base_val is not None
+                and math.isclose(val, base_val, rel_tol=1e-9)
+            ):
+                var_slots.append(0)
+                continue
+            slot = seen.get((param_path, val))
+            if slot is not None:
+                var_slots.append(slot)
+                continue
+            seen[param_path, val] = len(param_sets)
+            var_slots.append(len(param_sets))
+
+            param_sets.append(_with_override(shared, keys, val))
+
+    return param_sets, sweeps, slots
+
+
+def _evaluate(
+    param_sets: list[dict],
+    run_fn: Callable[[dict], dict],
+    max_workers: Optional[int],
+    cache: Optional[dict[bytes, Any]],
+) -> Iterator[_Metrics]:
+    """Yield the metrics of every parameter set, in order.
+
+    Parameter sets found in *cache* are looked up instead of run; the rest
+    run in this process, or on a process pool if *max_workers* asks for
+    one, and are added to *cache* as they complete.
+    """
+    if cache is None:
+        cache_keys = None
+        todo = param_sets
+    else:
+        cache_keys = [_stable_hash(params) for params in param_sets]
+        pending: dict[bytes, dict] = {}
+        for params, key in zip(param_sets, cache_keys):
+            if key not in cache and key not in pending:
+                pending[key] = params
+        todo = list(pending.values())
+
+    run_fns = [run_fn] * len(todo)
+    pool = None
+    if max_workers == 1 or not todo:
+        new_results = map(_run_metrics, run_fns, todo)
+    else:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        new_results = pool.map(_run_metrics, run_fns, todo)
+    new_metrics = map(_extract_metrics, new_results)
+
+    try:
+        if cache_keys is None:
+            yield from new_metrics
+        else:
+            for key in cache_keys:
+                if key not in cache:
+                    cache[key] = next(new_metrics)
+                yield cache[key]
+    finally:
+        if pool is not None:
+            # Stop queued work if the consumer abandons the stream early.
+            pool.shutdown(cancel_futures=True)
+
+
+def _tornado_entry(
+    var: dict, low: _Metrics, high: _Metrics, base: _Metrics
+) -> dict[str, Any]:
+    """Tornado-diagram data for one variable from the ends of its sweep."""
+    return {
+        "low_value": float(var["range"][0]),
+        "high_value": float(var["range"][1]),
+        "low_npc": low.npc,
+        "high_npc": high.npc,
+        "low_lcoe": low.lcoe,
+        "high_lcoe": high.lcoe,
+        "low_irr": low.irr,
+        "high_irr": high.irr,
+        "base_npc": base.npc,
+        "base_lcoe": base.lcoe,
+        "base_irr": base.irr,
+        # NaN if either end is missing an NPC.
+        "npc_spread": abs(high.npc - low.npc),
+    }
+
+
 # ======================================================================
-# Main entry point
+# Main entry points
 # ======================================================================
 
+def sensitivity_analysis_stream(
+    base_params: dict,
+    variables: list[dict],
+    run_fn: Callable[[dict], dict],
+    max_workers: Optional[int] = 1,
+    cache: Optional[dict[bytes, Any]] = None,
+) -> Iterator[dict[str, Any]]:
+    """Run one-at-a-time sensitivity analysis, yielding results as they arrive.
+
+    Takes the same arguments as :func:`sensitivity_analysis`.  Each
+    sweep point is yielded as soon as it has been evaluated, so a caller
+    can render the first points before the last ones have run.
+
+    Yields
+    ------
+    dict
+        Events, in this order:
+
+        * ``{"event": "base", "metrics": {...}}`` -- the unperturbed base
+          case, first.
+        * ``{"event": "sweep", "name": name, "index": i, "value": v,
+          "metrics": {...}}`` -- one per sweep point, variable by variable.
+        * ``{"event": "tornado", "name": name, "tornado": {...}}`` -- after
+          the last sweep point of each variable.
+
+        ``metrics`` holds the ``npc``, ``lcoe``, ``irr`` and
+        ``payback_years`` of the run; any the run did not report are NaN.
+    """
+    param_sets, sweeps, slots = _plan_sweeps(base_params, variables)
+    metrics_iter = _evaluate(param_sets, run_fn, max_workers, cache)
+    # Evaluated metrics, indexed like param_sets.  Sweep points only refer
+    # to earlier parameter sets or the next one, so this fills in order.
+    done: list[_Metrics] = []
+
+    def metrics_at(slot: int) -> _Metrics:
+        while len(done) <= slot:
+            done.append(next(metrics_iter))
+        return done[slot]
+
+    try:
+        base_metrics = metrics_at(0)
+        yield {"event": "base", "metrics": base_metrics._asdict()}
+
+        for var, sweep_values, var_slots in zip(variables, sweeps, slots):
+            name: str = var["name"]
+            for i, (val, slot) in enumerate(zip(sweep_values, var_slots)):
+                yield {
+                    "event": "sweep",
+                    "name": name,
+                    "index": i,
+                    "value": val,
+                    "metrics": metrics_at(slot)._asdict(),
+                }
+
+            # Tornado data: use the extreme ends of the sweep.
+            yield {
+                "event": "tornado",
+                "name": name,
+                "tornado": _tornado_entry(
+                    var, done[var_slots[0]], done[var_slots[-1]], base_metrics
+                ),
+            }
+    finally:
+        metrics_iter.close()
+
+
 def sensitivity_analysis(
     base_params: dict,
     variables: list[dict],
     run_fn: Callable[[dict], dict],
+    max_workers: Optional[int] = 1,
+    cache: Optional[dict[bytes, Any]] = None,
 ) -> dict:
     """Run one-at-a-time sensitivity analysis.
 
     Parameters
     ----------
     base_params : dict
-        Base-case simulation parameters.  A deep copy is made for each
-        evaluation so the original is never mutated.
+        Base-case simulation parameters.  It is never modified: each sweep
+        point gets new dicts along the varied path and shares everything
+        else with it, so *run_fn* must treat its parameters as read-only.
     variables : list[dict]
         Each entry describes one sensitivity variable::
 
@@ -119,6 +363,19 @@ def sensitivity_analysis(
         ``run_fn(params) -> dict`` that accepts a complete parameter set
         and returns a results dictionary containing at minimum ``npc``,
         ``lcoe``, and ``irr`` keys.
+    max_workers : int or None
+        Number of worker processes for the sweep.  The default ``1``
+        evaluates every point in this process, in order; ``None`` uses
+        one process per CPU.  With more than one worker, *run_fn* and
+        *base_params* must be picklable (e.g. *run_fn* a module-level
+        function), and the caller must be allowed to start child
+        processes.
+    cache : dict or None
+        Optional memo of earlier evaluations, keyed by a hash of the
+        complete parameter set.  Pass the same dict to repeated analyses
+        that use the same *run_fn*: parameter sets evaluated before are
+        then looked up instead of run again.  Parameter sets must be
+        picklable.
 
     Returns
     -------
@@ -131,73 +388,29 @@ def sensitivity_analysis(
           ``{variable_name: {"low_value", "high_value", "low_npc",
           "high_npc", "base_npc"}}``
         * ``"base_results"`` -- metrics from the unperturbed base case.
-    """
-    # --- Run the base case first ---
-    base_results = run_fn(copy.deepcopy(base_params))
-    base_metrics = _extract_metrics(base_results)
-    base_npc = base_metrics.get("npc", 0.0)
 
+        Metrics that *run_fn* did not report are NaN, and so is the
+        ``npc_spread`` of a variable missing an NPC at either end.
+    """
     spider: dict[str, list[dict[str, Any]]] = {}
     tornado: dict[str, dict[str, Any]] = {}
-
-    for var in variables:
-        name: str = var["name"]
-        param_path: str = var["param_path"]
-        val_range: list[float] = var["range"]
-        n_points: int = int(var.get("points", 11))
-
-        if n_points < 2:
-            n_points = 2
-
-        low_val = float(val_range[0])
-        high_val = float(val_range[1])
-        sweep_values = np.linspace(low_val, high_val, n_points).tolist()
-
-        sweep_results: list[dict[str, Any]] = []
-
-        for val in sweep_values:
-            # Only deep-copy mutable config dicts; share weather/load arrays
-            # (they are never mutated by the simulation runner).
-            params = {
-                "components": copy.deepcopy(base_params["components"]),
-                "project": copy.deepcopy(base_params["project"]),
-                "dispatch_strategy": base_params["dispatch_strategy"],
-                "weather": base_params["weather"],
-                "load_kw": base_params["load_kw"],
-            }
-            _set_nested(params, param_path, val)
-
-            result = run_fn(params)
-            metrics = _extract_metrics(result)
-            entry: dict[str, Any] = {"value": val}
-            entry.update(metrics)
-            sweep_results.append(entry)
-
-        spider[name] = sweep_results
-
-        # Tornado data: use the extreme ends of the sweep.
-        low_result = sweep_results[0]
-        high_result = sweep_results[-1]
-
-        tornado[name] = {
-            "low_value": low_val,
-            "high_value": high_val,
-            "low_npc": low_result.get("npc"),
-            "high_npc": high_result.get("npc"),
-            "low_lcoe": low_result.get("lcoe"),
-            "high_lcoe": high_result.get("lcoe"),
-            "low_irr": low_result.get("irr"),
-            "high_irr": high_result.get("irr"),
-            "base_npc": base_npc,
-            "base_lcoe": base_metrics.get("lcoe"),
-            "base_irr": base_metrics.get("irr"),
-            "npc_spread": abs(
-                (high_result.get("npc") or 0.0) - (low_result.get("npc") or 0.0)
-            ),
-        }
+    base_results: dict[str, Any] = {}
+
+    for event in sensitivity_analysis_stream(
+        base_params, variables, run_fn, max_workers=max_workers, cache=cache
+    ):
+        kind = event["event"]
+        if kind == "sweep":
+            if event["index"] == 0:
+                spider[event["name"]] = []
+            spider[event["name"]].append({"value": event["value"], **event["metrics"]})
+        elif kind == "tornado":
+            tornado[event["name"]] = event["tornado"]
+        else:
+            base_results = event["metrics"]
 
     return {
         "spider": spider,
         "tornado": tornado,
-        "base_results": base_metrics,
+        "base_results": base_results,
     }
@@ -9,6 +9,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from .fuel_curve import FuelCurve
 
 
@@ -136,14 +139,20 @@ class DieselGenerator:
             )
 
         # Enforce minimum and maximum loading.
-        if power_request_kw < self.min_power_kw:
-            actual_kw = self.min_power_kw
-        elif power_request_kw > self.rated_power_kw:
-            actual_kw = self.rated_power_kw
+        rated_kw = self.rated_power_kw
+        min_kw = rated_kw * self.min_load_ratio
+        if power_request_kw < min_kw:
+            actual_kw = min_kw
+        elif power_request_kw > rated_kw:
+            actual_kw = rated_kw
         else:
             actual_kw = power_request_kw
 
-        fuel_l = self.fuel_curve.consumption(actual_kw, self.rated_power_kw)
+        # Fuel curve evaluated directly: actual_kw is already within
+        # [min_kw, rated_kw], so FuelCurve.consumption's range checks
+        # cannot fire.
+        curve = self.fuel_curve
+        fuel_l = curve.a0 * rated_kw + curve.a1 * actual_kw
         cost = fuel_l * self.fuel_price + self.om_cost_per_hour
 
         # Update accumulators.
@@ -213,6 +222,67 @@ class DieselGenerator:
 
         return output_kw, fuel_l, total_cost, True
 
+    def simulate_year(
+        self,
+        power_request_kw: ArrayLike,
+        was_running: bool = False,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.bool_]]:
+        """Vectorised :meth:`simulate_hour` over a series of hourly requests.
+
+        Use this when the requests are known up front, i.e. they do not
+        depend on the generator's own output in earlier hours.  Outputs,
+        costs and accumulators match calling :meth:`simulate_hour` once
+        per hour in order.
+
+        Parameters
+        ----------
+        power_request_kw : array_like
+            Desired electrical output for each hour (kW).
+        was_running : bool
+            Whether the generator was running before the first hour.
+
+        Returns
+        -------
+        output_kw, fuel_l, cost : ndarray
+            Per-hour output (kW), fuel (L) and cost ($, including start
+            costs).
+        is_running : ndarray of bool
+            Generator state at the end of each hour.
+        """
+        request = np.asarray(power_request_kw, dtype=np.float64)
+        is_running = request > 0
+        previous = np.empty_like(is_running)
+        previous[:1] = was_running
+        previous[1:] = is_running[:-1]
+        starts = is_running & ~previous
+
+        output_kw = np.where(
+            is_running,
+            np.clip(request, self.min_power_kw, self.rated_power_kw),
+            0.0,
+        )
+        fuel_l = np.zeros_like(request)
+        fuel_l[is_running] = self.fuel_curve.consumption_array(
+            output_kw[is_running], self.rated_power_kw
+        )
+        cost = np.where(
+            is_running, fuel_l * self.fuel_price + self.om_cost_per_hour, 0.0
+        )
+        cost += np.where(starts, self.start_cost, 0.0)
+
+        # Accumulate fuel hour by hour (cumsum is sequential), so the total
+        # matches the per-hour loop exactly.
+        on_fuel = fuel_l[is_running]
+        if on_fuel.size:
+            self.fuel_consumed_total = float(
+                np.cumsum(np.r_[self.fuel_consumed_total, on_fuel])[-1]
+            )
+        self.running_hours += float(np.count_nonzero(is_running))
+        self.starts_count += int(np.count_nonzero(starts))
+        self._is_running = bool(is_running[-1]) if is_running.size else was_running
+
+        return output_kw, fuel_l, cost, is_running
+
     # ------------------------------------------------------------------
     # Reporting helpers
     # ------------------------------------------------------------------
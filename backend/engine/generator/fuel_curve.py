@@ -14,6 +14,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 
 @dataclass
 class FuelCurve:
@@ -86,6 +89,44 @@ class FuelCurve:
 
         return self.a0 * rated_power_kw + self.a1 * power_output_kw
 
+    def consumption_array(
+        self, power_output_kw: ArrayLike, rated_power_kw: float
+    ) -> NDArray[np.float64]:
+        """Vectorised :meth:`consumption` for a series of operating points.
+
+        Parameters
+        ----------
+        power_output_kw : array_like
+            Electrical output of the generator for each time-step (kW).
+            Every value must be in [0, rated_power_kw].
+        rated_power_kw : float
+            Nameplate rated capacity of the generator (kW).
+
+        Returns
+        -------
+        ndarray
+            Fuel consumption in litres per hour (L/hr) for each time-step.
+
+        Raises
+        ------
+        ValueError
+            If any output is negative or exceeds rated_power_kw.
+        """
+        power = np.asarray(power_output_kw, dtype=np.float64)
+        if power.size:
+            if power.min() < 0:
+                raise ValueError(
+                    f"power_output_kw must be >= 0, got {power.min()}"
+                )
+            if power.max() > rated_power_kw * 1.001:  # small tolerance
+                raise ValueError(
+                    f"power_output_kw ({power.max()}) exceeds "
+                    f"rated_power_kw ({rated_power_kw})"
+                )
+
+        # Clamp to rated capacity (handles floating-point overshoot).
+        return self.a0 * rated_power_kw + self.a1 * np.minimum(power, rated_power_kw)
+
     def efficiency(self, power_output_kw: float, rated_power_kw: float) -> float:
         """Electrical conversion efficiency at a given operating point.
 
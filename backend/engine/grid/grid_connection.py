@@ -6,10 +6,23 @@ distributed-energy-resource site and the utility grid.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Optional, Tuple
 
-from .tariff import DemandCharge, TariffBase
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .tariff import DemandCharge, TariffBase, _table_index
+
+
+def _running_total(start: float, values: NDArray) -> float:
+    """``start + values[0] + values[1] + ...`` added strictly left to right.
+
+    ``np.add.accumulate`` is sequential (unlike ``np.sum``, which sums
+    pairwise), so the result matches a per-hour ``+=`` loop bit for bit.
+    Also used by the dispatch kernel's vectorised path.
+    """
+    return float(np.add.accumulate(np.concatenate(([start], values)))[-1])
 
 
 @dataclass
@@ -48,16 +61,16 @@ class GridConnection:
     total_import_kwh: float = field(default=0.0, init=False, repr=False)
     total_export_kwh: float = field(default=0.0, init=False, repr=False)
     total_cost: float = field(default=0.0, init=False, repr=False)
-    monthly_peaks: List[float] = field(
-        default_factory=lambda: [0.0] * 12, init=False, repr=False
+    monthly_peaks: NDArray[np.float64] = field(
+        default_factory=lambda: np.zeros(12), init=False, repr=False
     )
 
     # Per-month energy accumulators for net-metering settlement.
-    _monthly_import_kwh: List[float] = field(
-        default_factory=lambda: [0.0] * 12, init=False, repr=False
+    _monthly_import_kwh: NDArray[np.float64] = field(
+        default_factory=lambda: np.zeros(12), init=False, repr=False
     )
-    _monthly_export_kwh: List[float] = field(
-        default_factory=lambda: [0.0] * 12, init=False, repr=False
+    _monthly_export_kwh: NDArray[np.float64] = field(
+        default_factory=lambda: np.zeros(12), init=False, repr=False
     )
 
     def __post_init__(self) -> None:
@@ -75,6 +88,20 @@ class GridConnection:
                 f"max_export_kw must be >= 0, got {self.max_export_kw}"
             )
 
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ compares field tuples, which is ambiguous
+        # for the ndarray accumulators; compare those element-wise.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        for f in fields(self):
+            a, b = getattr(self, f.name), getattr(other, f.name)
+            if isinstance(a, np.ndarray):
+                if not np.array_equal(a, b):
+                    return False
+            elif a != b:
+                return False
+        return True
+
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
@@ -172,6 +199,114 @@ class GridConnection:
 
         return actual_kw, revenue
 
+    # ------------------------------------------------------------------
+    # Batch import / export
+    # ------------------------------------------------------------------
+
+    def import_power_batch(
+        self, kw_needed: ArrayLike, hour: ArrayLike, month: ArrayLike
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Vectorised :meth:`import_power` over a series of time-steps.
+
+        Returns the same values and leaves the accumulators in the same
+        state as calling :meth:`import_power` once per time-step, in order.
+
+        Parameters
+        ----------
+        kw_needed : array_like
+            Desired import power for each time-step (kW).
+        hour, month : array_like of int
+            Hour of day (0 -- 23) and month (1 -- 12) of each time-step.
+
+        Returns
+        -------
+        actual_kw, cost : ndarray
+            Power imported (kW) and its cost ($) for each time-step.
+        """
+        kw = np.asarray(kw_needed, dtype=np.float64)
+        month_idx = np.asarray(month, dtype=np.intp) - 1
+        actual_kw = np.where(kw > 0, np.minimum(kw, self.max_import_kw), 0.0)
+        cost = actual_kw * self.tariff.buy_price_array(hour, month)
+
+        self.total_import_kwh = _running_total(self.total_import_kwh, actual_kw)
+        self.total_cost = _running_total(self.total_cost, cost)
+        # ufunc.at is unbuffered and applies the updates in order, so the
+        # monthly sums match the per-hour loop.
+        np.add.at(self._monthly_import_kwh, month_idx, actual_kw)
+        peaks = np.zeros(12)
+        np.maximum.at(peaks, month_idx, actual_kw)
+        np.maximum(self.monthly_peaks, peaks, out=self.monthly_peaks)
+        if self.demand_charge is not None:
+            self.demand_charge.record_demand_series(peaks, np.arange(1, 13))
+
+        return actual_kw, cost
+
+    def export_power_batch(
+        self, kw_excess: ArrayLike, hour: ArrayLike, month: ArrayLike
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Vectorised :meth:`export_power`; see :meth:`import_power_batch`.
+
+        Returns
+        -------
+        actual_kw, revenue : ndarray
+            Power exported (kW) and its revenue ($) for each time-step.
+        """
+        kw = np.asarray(kw_excess, dtype=np.float64)
+        if not self.sell_back_enabled:
+            return np.zeros_like(kw), np.zeros_like(kw)
+
+        month_idx = np.asarray(month, dtype=np.intp) - 1
+        actual_kw = np.where(kw > 0, np.minimum(kw, self.max_export_kw), 0.0)
+        _import_price, export_price = self.precompute_tariffs(hour, month)
+        revenue = actual_kw * export_price
+
+        self.total_export_kwh = _running_total(self.total_export_kwh, actual_kw)
+        self.total_cost = _running_total(self.total_cost, -revenue)
+        np.add.at(self._monthly_export_kwh, month_idx, actual_kw)
+
+        return actual_kw, revenue
+
+    # ------------------------------------------------------------------
+    # Vectorised pricing
+    # ------------------------------------------------------------------
+
+    def precompute_tariffs(
+        self, hour: ArrayLike, month: ArrayLike
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Per-time-step import and export prices.
+
+        Looks up the tariff once per (hour, month) pair instead of once
+        per time-step, for callers that price a whole series up front.
+
+        Parameters
+        ----------
+        hour : array_like of int
+            Hour of day, 0 -- 23, for each time-step.
+        month : array_like of int
+            Month of year, 1 -- 12, for each time-step.
+
+        Returns
+        -------
+        import_price, export_price : ndarray
+            $/kWh for each time-step, as :meth:`import_power` and
+            :meth:`export_power` would price it (export at the buy rate
+            under net metering).
+
+        Raises
+        ------
+        ValueError
+            If an hour or month is out of range.
+        """
+        buy, sell = self.tariff.price_table()
+        idx = _table_index(hour, month)
+        import_price = buy[idx]
+        if self.net_metering:
+            # Under net metering, export is valued at the buy rate.
+            export_price = import_price.copy()
+        else:
+            export_price = sell[idx]
+        return import_price, export_price
+
     # ------------------------------------------------------------------
     # Demand-charge settlement
     # ------------------------------------------------------------------
@@ -218,7 +353,7 @@ class GridConnection:
             Net kWh: positive means net import, negative means net export.
         """
         idx = month - 1
-        return self._monthly_import_kwh[idx] - self._monthly_export_kwh[idx]
+        return float(self._monthly_import_kwh[idx] - self._monthly_export_kwh[idx])
 
     # ------------------------------------------------------------------
     # Summary & reset
@@ -237,8 +372,8 @@ class GridConnection:
         self.total_import_kwh = 0.0
         self.total_export_kwh = 0.0
         self.total_cost = 0.0
-        self.monthly_peaks = [0.0] * 12
-        self._monthly_import_kwh = [0.0] * 12
-        self._monthly_export_kwh = [0.0] * 12
+        self.monthly_peaks = np.zeros(12)
+        self._monthly_import_kwh = np.zeros(12)
+        self._monthly_export_kwh = np.zeros(12)
         if self.demand_charge is not None:
             self.demand_charge.reset()
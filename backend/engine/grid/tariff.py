@@ -8,7 +8,30 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+def _table_index(
+    hour: ArrayLike, month: ArrayLike
+) -> Tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Row and column indices into a ``(24, 12)`` price table.
+
+    Raises
+    ------
+    ValueError
+        If any hour is outside 0 -- 23 or any month outside 1 -- 12
+        (NumPy indexing would otherwise wrap them silently).
+    """
+    hour_idx = np.asarray(hour, dtype=np.intp)
+    month_idx = np.asarray(month, dtype=np.intp) - 1
+    if hour_idx.size and (hour_idx.min() < 0 or hour_idx.max() > 23):
+        raise ValueError("hour values must be in 0 -- 23")
+    if month_idx.size and (month_idx.min() < 0 or month_idx.max() > 11):
+        raise ValueError("month values must be in 1 -- 12")
+    return hour_idx, month_idx
 
 
 # ======================================================================
@@ -52,6 +75,54 @@ class TariffBase(ABC):
             Export price in $/kWh (may be zero).
         """
 
+    def price_table(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Tabulate buy and sell prices for every (hour, month) pair.
+
+        Returns
+        -------
+        buy, sell : ndarray, shape (24, 12)
+            Prices in $/kWh indexed by ``[hour, month - 1]``.
+
+        The default builds the table from :meth:`buy_price` and
+        :meth:`sell_price` (288 calls each); subclasses may override it
+        with a vectorised equivalent.
+        """
+        buy = np.empty((24, 12), dtype=np.float64)
+        sell = np.empty((24, 12), dtype=np.float64)
+        for hour in range(24):
+            for month in range(1, 13):
+                buy[hour, month - 1] = self.buy_price(hour, month)
+                sell[hour, month - 1] = self.sell_price(hour, month)
+        return buy, sell
+
+    def buy_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        """Vectorised :meth:`buy_price`.
+
+        Parameters
+        ----------
+        hour : array_like of int
+            Hour of day, 0 -- 23, for each time-step.
+        month : array_like of int
+            Month of year, 1 -- 12, for each time-step.
+
+        Returns
+        -------
+        ndarray
+            Import price in $/kWh for each time-step.
+
+        Raises
+        ------
+        ValueError
+            If an hour or month is out of range.
+        """
+        buy, _sell = self.price_table()
+        return buy[_table_index(hour, month)]
+
+    def sell_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        """Vectorised :meth:`sell_price`; see :meth:`buy_price_array`."""
+        _buy, sell = self.price_table()
+        return sell[_table_index(hour, month)]
+
 
 # ======================================================================
 # Flat tariff
@@ -85,6 +156,18 @@ class FlatTariff(TariffBase):
     def sell_price(self, hour: int, month: int) -> float:  # noqa: D401
         return self.sell_rate
 
+    def price_table(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        return (
+            np.full((24, 12), self.buy_rate, dtype=np.float64),
+            np.full((24, 12), self.sell_rate, dtype=np.float64),
+        )
+
+    def buy_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        return np.full(np.shape(hour), self.buy_rate, dtype=np.float64)
+
+    def sell_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        return np.full(np.shape(hour), self.sell_rate, dtype=np.float64)
+
 
 # ======================================================================
 # Time-of-Use tariff
@@ -162,30 +245,59 @@ class TOUTariff(TariffBase):
     default_sell_rate: float = 0.03
 
     def __post_init__(self) -> None:
-        # Pre-build lookup tables indexed by (hour, month) for O(1) access.
+        # Dense [hour, month - 1] tables covering every valid (hour, month),
+        # so lookups are an index instead of a dict probe.
+        self._buy_table = np.full((24, 12), self.default_buy_rate, dtype=np.float64)
+        self._sell_table = np.full((24, 12), self.default_sell_rate, dtype=np.float64)
+        # Period entries outside that grid, for out-of-range lookups.
         self._buy_lookup: Dict[tuple, float] = {}
         self._sell_lookup: Dict[tuple, float] = {}
 
         for _name, period in self.schedule.items():
             rate = period["rate"]
             sell_rate = period.get("sell_rate", 0.0)
-            hours: List[int] = period["hours"]
-            months: List[int] = period["months"]
-
-            for h in hours:
-                for m in months:
-                    key = (h, m)
-                    # Last-write-wins if periods overlap; caller is
-                    # responsible for non-overlapping definitions.
-                    self._buy_lookup[key] = rate
-                    self._sell_lookup[key] = sell_rate
+            hours = np.asarray(period["hours"], dtype=np.intp)
+            months = np.asarray(period["months"], dtype=np.intp)
+            valid_hours = (hours >= 0) & (hours < 24)
+            valid_months = (months >= 1) & (months <= 12)
+
+            # Last-write-wins if periods overlap; caller is responsible
+            # for non-overlapping definitions.
+            cells = np.ix_(hours[valid_hours], months[valid_months] - 1)
+            self._buy_table[cells] = rate
+            self._sell_table[cells] = sell_rate
+
+            if valid_hours.all() and valid_months.all():
+                continue
+            for h in hours.tolist():
+                for m in months.tolist():
+                    if not (0 <= h < 24 and 1 <= m <= 12):
+                        self._buy_lookup[h, m] = rate
+                        self._sell_lookup[h, m] = sell_rate
+
+        # Nested lists for scalar lookups (cheaper than ndarray indexing).
+        self._buy_rows: List[List[float]] = self._buy_table.tolist()
+        self._sell_rows: List[List[float]] = self._sell_table.tolist()
 
     def buy_price(self, hour: int, month: int) -> float:  # noqa: D401
+        if 0 <= hour < 24 and 1 <= month <= 12:
+            return self._buy_rows[hour][month - 1]
         return self._buy_lookup.get((hour, month), self.default_buy_rate)
 
     def sell_price(self, hour: int, month: int) -> float:  # noqa: D401
+        if 0 <= hour < 24 and 1 <= month <= 12:
+            return self._sell_rows[hour][month - 1]
         return self._sell_lookup.get((hour, month), self.default_sell_rate)
 
+    def price_table(self) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        return self._buy_table.copy(), self._sell_table.copy()
+
+    def buy_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        return self._buy_table[_table_index(hour, month)]
+
+    def sell_price_array(self, hour: ArrayLike, month: ArrayLike) -> NDArray[np.float64]:
+        return self._sell_table[_table_index(hour, month)]
+
 
 # ======================================================================
 # Demand charge
@@ -214,7 +326,7 @@ class DemandCharge(TariffBase):
                 f"rate_per_kw_month must be >= 0, got {self.rate_per_kw_month}"
             )
         # Track monthly peaks (index 0 = January, ..., 11 = December).
-        self._monthly_peaks: List[float] = [0.0] * 12
+        self._monthly_peaks: NDArray[np.float64] = np.zeros(12, dtype=np.float64)
 
     def buy_price(self, hour: int, month: int) -> float:  # noqa: D401
         """Demand charges are not per-kWh; return 0.0."""
@@ -237,6 +349,23 @@ class DemandCharge(TariffBase):
         if power_kw > self._monthly_peaks[idx]:
             self._monthly_peaks[idx] = power_kw
 
+    def record_demand_series(self, power_kw: ArrayLike, month: ArrayLike) -> None:
+        """Vectorised :meth:`record_demand` over many time-steps.
+
+        Parameters
+        ----------
+        power_kw : array_like
+            Instantaneous import power (kW) for each time-step.
+        month : array_like of int
+            Month of year, 1 -- 12, for each time-step.
+        """
+        # fmax, like record_demand, never lets a NaN replace a peak.
+        np.fmax.at(
+            self._monthly_peaks,
+            np.asarray(month, dtype=np.intp) - 1,
+            np.asarray(power_kw, dtype=np.float64),
+        )
+
     def monthly_charge(self, month: int) -> float:
         """Calculate the demand charge for a given month.
 
@@ -250,14 +379,12 @@ class DemandCharge(TariffBase):
         float
             Demand charge ($).
         """
-        return self._monthly_peaks[month - 1] * self.rate_per_kw_month
+        return float(self._monthly_peaks[month - 1]) * self.rate_per_kw_month
 
     def total_annual_charge(self) -> float:
         """Sum of demand charges across all twelve months ($)."""
-        return sum(
-            peak * self.rate_per_kw_month for peak in self._monthly_peaks
-        )
+        return sum(self._monthly_peaks.tolist()) * self.rate_per_kw_month
 
     def reset(self) -> None:
         """Clear all recorded monthly peaks."""
-        self._monthly_peaks = [0.0] * 12
+        self._monthly_peaks = np.zeros(12, dtype=np.float64)
@@ -1,5 +1,5 @@
 """Load profile generation module."""
 
-from .load_model import generate_load_profile
+from .load_model import generate_load_profile, generate_load_profiles
 
-__all__ = ["generate_load_profile"]
+__all__ = ["generate_load_profile", "generate_load_profiles"]
@@ -6,10 +6,16 @@ built-in templates, with optional noise injection and annual-energy scaling.
 
 from __future__ import annotations
 
+import functools
 from typing import Optional
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+_HOURS_PER_YEAR = 8760
+
+# Rows of noise generate_load_profiles draws at a time.
+_NOISE_BLOCK_ROWS = 64
 
 
 # ======================================================================
@@ -129,6 +135,12 @@ _DOW_MULTIPLIERS = {
     "rural_village": _DOW_MULTIPLIER_RURAL_VILLAGE,
 }
 
+# 0-based month index of every day of a non-leap year.
+_DAY_TO_MONTH = np.repeat(
+    np.arange(12, dtype=np.int64),
+    [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+)
+
 
 # ======================================================================
 # Public API
@@ -174,57 +186,106 @@ def generate_load_profile(
     if annual_kwh < 0:
         raise ValueError(f"annual_kwh must be >= 0, got {annual_kwh}")
 
-    profile_type = profile_type.lower()
-    if profile_type not in _PROFILES:
-        raise ValueError(
-            f"Unknown profile_type '{profile_type}'. "
-            f"Choose from: {sorted(_PROFILES.keys())}"
-        )
+    profile_type = _check_profile_type(profile_type)
+    rng = np.random.default_rng(seed)
 
-    hourly_shape = _PROFILES[profile_type]
-    dow_mult = _DOW_MULTIPLIERS[profile_type]
+    # Copy of the cached noise-free shape for this template.
+    profile = _base_profile(profile_type, hemisphere.lower() == "southern").copy()
+
+    # Inject optional noise (multiplicative, clipped to stay positive).
+    if noise_factor > 0:
+        noise = rng.normal(loc=1.0, scale=noise_factor, size=_HOURS_PER_YEAR)
+        np.clip(noise, 0.1, 3.0, out=noise)  # prevent negatives / extremes
+        profile *= noise
 
-    # Select seasonal pattern based on hemisphere
-    if hemisphere.lower() == "southern":
-        monthly_seasonal = _MONTHLY_SEASONAL_SOUTHERN
-    else:
-        monthly_seasonal = _MONTHLY_SEASONAL
+    # Scale to match the desired annual energy (in place: profile is ours).
+    scale_profile(profile, annual_kwh, out=profile)
 
-    rng = np.random.default_rng(seed)
+    return profile
 
-    # Build the raw 8760 profile.
-    # We iterate conceptually over 365 days, each with 24 hours.
-    # Year assumed to start on a Monday (day-of-week index 0).
-    hours_per_year = 8760
-    profile = np.empty(hours_per_year, dtype=np.float64)
 
-    hour_idx = 0
-    for day in range(365):
-        month = _day_to_month(day)
-        day_of_week = day % 7  # 0 = Monday
+def generate_load_profiles(
+    annual_kwhs: ArrayLike,
+    profile_type: str = "residential",
+    noise_factor: float = 0.1,
+    seed: Optional[int] = None,
+    hemisphere: str = "northern",
+    dtype: DTypeLike = np.float64,
+) -> NDArray[np.floating]:
+    """Create one hourly load profile per annual-energy target, in one pass.
 
-        seasonal = monthly_seasonal[month]
-        weekday = dow_mult[day_of_week]
+    Batched :func:`generate_load_profile` for scenario sweeps: every row
+    uses the same template and hemisphere and is scaled to its own
+    target.  The noise for all rows is drawn in a single call, so with a
+    *seed* row 0 equals ``generate_load_profile(annual_kwhs[0], ...,
+    seed=seed)`` and later rows continue the same random stream.
 
-        for h in range(24):
-            profile[hour_idx] = hourly_shape[h] * seasonal * weekday
-            hour_idx += 1
+    Parameters
+    ----------
+    annual_kwhs : array_like, shape (N,)
+        Total energy consumption target of each profile (kWh).
+    profile_type, noise_factor, seed, hemisphere
+        As for :func:`generate_load_profile`.
+    dtype : dtype
+        Floating-point type of the result.  ``np.float32`` halves the
+        memory of large batches; row totals are still accumulated in
+        float64.  The noise is drawn in this type, so a float32 batch
+        does not reproduce the float64 one.
 
-    # Inject optional noise (multiplicative, clipped to stay positive).
-    if noise_factor > 0:
-        noise = rng.normal(loc=1.0, scale=noise_factor, size=hours_per_year)
-        noise = np.clip(noise, 0.1, 3.0)  # prevent negatives / extremes
-        profile *= noise
+    Returns
+    -------
+    NDArray[np.floating]
+        Shape ``(N, 8760)`` array of hourly loads in kW.
+
+    Raises
+    ------
+    ValueError
+        If *profile_type* or *dtype* is not supported, or *annual_kwhs* is
+        not 1-D or has a negative entry.
+    """
+    kwhs = np.asarray(annual_kwhs, dtype=np.float64)
+    if kwhs.ndim != 1:
+        raise ValueError(f"annual_kwhs must be 1-D, got shape {kwhs.shape}")
+    if np.any(kwhs < 0):
+        raise ValueError(f"annual_kwhs must be >= 0, got {kwhs.min()}")
 
-    # Scale to match the desired annual energy.
-    profile = scale_profile(profile, annual_kwh)
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
 
-    return profile
+    profile_type = _check_profile_type(profile_type)
+    rng = np.random.default_rng(seed)
+
+    profiles = np.tile(
+        _base_profile(profile_type, hemisphere.lower() == "southern").astype(dtype),
+        (kwhs.size, 1),
+    )
+
+    if noise_factor > 0:
+        # Same draws as rng.normal(1.0, noise_factor), in the target dtype.
+        # They are generated a block of rows at a time into one reused
+        # buffer, which consumes the stream in the same order as a single
+        # (N, 8760) draw without allocating one.
+        buf = np.empty((min(_NOISE_BLOCK_ROWS, len(profiles)), _HOURS_PER_YEAR), dtype)
+        for start in range(0, len(profiles), _NOISE_BLOCK_ROWS):
+            rows = profiles[start:start + _NOISE_BLOCK_ROWS]
+            noise = buf[:len(rows)]
+            rng.standard_normal(dtype=dtype, out=noise)
+            noise *= noise_factor
+            noise += 1.0
+            np.clip(noise, 0.1, 3.0, out=noise)  # prevent negatives / extremes
+            rows *= noise
+
+    # Scale every row to its own annual energy.
+    profiles *= (kwhs / profiles.sum(axis=1, dtype=np.float64))[:, None]
+
+    return profiles
 
 
 def scale_profile(
     base_profile: NDArray[np.float64],
     target_annual_kwh: float,
+    out: Optional[NDArray[np.float64]] = None,
 ) -> NDArray[np.float64]:
     """Scale an existing hourly profile so its total matches a target.
 
@@ -234,11 +295,14 @@ def scale_profile(
         Hourly load values (kW), length 8760.
     target_annual_kwh : float
         Desired total energy over the year (kWh).
+    out : NDArray[np.float64], optional
+        Array to write the result into; pass *base_profile* itself to
+        scale in place.  By default a new array is returned.
 
     Returns
     -------
     NDArray[np.float64]
-        Scaled copy of *base_profile* with ``sum() == target_annual_kwh``
+        Scaled profile (*out* if given) with ``sum() == target_annual_kwh``
         (within floating-point precision).
 
     Raises
@@ -247,17 +311,20 @@ def scale_profile(
         If *base_profile* sums to zero (cannot be scaled) or has the
         wrong length.
     """
-    if len(base_profile) != 8760:
+    if len(base_profile) != _HOURS_PER_YEAR:
         raise ValueError(
-            f"base_profile must have 8760 elements, got {len(base_profile)}"
+            f"base_profile must have {_HOURS_PER_YEAR} elements, "
+            f"got {len(base_profile)}"
         )
 
-    current_total = base_profile.sum()
+    # Accumulate in float64 whatever the profile dtype; the scale factor
+    # is a plain float so the result keeps the dtype of *base_profile*.
+    current_total = float(base_profile.sum(dtype=np.float64))
     if current_total == 0:
         raise ValueError("Cannot scale an all-zero profile.")
 
     scale = target_annual_kwh / current_total
-    return base_profile * scale
+    return np.multiply(base_profile, scale, out=out)
 
 
 # ======================================================================
@@ -265,6 +332,38 @@ def scale_profile(
 # ======================================================================
 
 
+def _check_profile_type(profile_type: str) -> str:
+    """Normalise *profile_type* to a known template name, or raise."""
+    profile_type = profile_type.lower()
+    if profile_type not in _PROFILES:
+        raise ValueError(
+            f"Unknown profile_type '{profile_type}'. "
+            f"Choose from: {sorted(_PROFILES.keys())}"
+        )
+    return profile_type
+
+
+@functools.cache
+def _base_profile(profile_type: str, southern: bool) -> NDArray[np.float64]:
+    """Noise-free 8760 profile shape for a template, before scaling.
+
+    Depends only on the template and hemisphere, so it is built once per
+    combination and shared (read-only); callers copy it before modifying.
+    """
+    hourly_shape = _PROFILES[profile_type]
+    dow_mult = _DOW_MULTIPLIERS[profile_type]
+    monthly_seasonal = _MONTHLY_SEASONAL_SOUTHERN if southern else _MONTHLY_SEASONAL
+
+    # Build the profile as a (365 day, 24 hour) grid.
+    # Year assumed to start on a Monday (day-of-week index 0).
+    days = np.arange(365)
+    seasonal = monthly_seasonal[_DAY_TO_MONTH][:, None]
+    weekday = dow_mult[days % 7][:, None]  # 0 = Monday
+    profile = (hourly_shape[None, :] * seasonal * weekday).ravel()
+    profile.flags.writeable = False
+    return profile
+
+
 def _day_to_month(day_of_year: int) -> int:
     """Convert 0-based day-of-year (0 -- 364) to 0-based month index.
 
@@ -280,11 +379,4 @@ def _day_to_month(day_of_year: int) -> int:
     int
         Month index, 0 (January) through 11 (December).
     """
-    # Cumulative days at the *start* of each month (non-leap year).
-    _MONTH_START = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
-
-    for m in range(11, -1, -1):
-        if day_of_year >= _MONTH_START[m]:
-            return m
-
-    return 0  # pragma: no cover — unreachable
+    return int(_DAY_TO_MONTH[day_of_year])
@@ -72,32 +72,39 @@ CABLE_LIBRARY: list[CableSpec] = [
     CableSpec("Al XLPE 1×300mm² 11kV", 300, 1, "Al", "mv", "XLPE", 0.100, 0.097, 415, 15.0),
 ]
 
+# Dict form of every cable, for get_cable_library.
+_CABLE_DICTS: tuple[dict, ...] = tuple(
+    {
+        "name": c.name,
+        "size_mm2": c.size_mm2,
+        "cores": c.cores,
+        "material": c.material,
+        "voltage_class": c.voltage_class,
+        "insulation": c.insulation,
+        "r_ohm_per_km": c.r_ohm_per_km,
+        "x_ohm_per_km": c.x_ohm_per_km,
+        "ampacity_a": c.ampacity_a,
+        "max_voltage_kv": c.max_voltage_kv,
+    }
+    for c in CABLE_LIBRARY
+)
+
+# Name lookup for find_cable (built in reverse so the first entry wins).
+_CABLES_BY_NAME: dict[str, CableSpec] = {c.name: c for c in reversed(CABLE_LIBRARY)}
+
 
 def get_cable_library() -> list[dict]:
-    """Return cable library as list of dicts for API response."""
-    return [
-        {
-            "name": c.name,
-            "size_mm2": c.size_mm2,
-            "cores": c.cores,
-            "material": c.material,
-            "voltage_class": c.voltage_class,
-            "insulation": c.insulation,
-            "r_ohm_per_km": c.r_ohm_per_km,
-            "x_ohm_per_km": c.x_ohm_per_km,
-            "ampacity_a": c.ampacity_a,
-            "max_voltage_kv": c.max_voltage_kv,
-        }
-        for c in CABLE_LIBRARY
-    ]
+    """Return cable library as list of dicts for API response.
+
+    The dicts are built once and shared between calls, so callers must
+    not modify them.
+    """
+    return list(_CABLE_DICTS)
 
 
 def find_cable(name: str) -> CableSpec | None:
     """Find a cable by name."""
-    for c in CABLE_LIBRARY:
-        if c.name == name:
-            return c
-    return None
+    return _CABLES_BY_NAME.get(name)
 
 
 def filter_cables(
@@ -1626,11 +1626,15 @@ def _build_sensitivity_analysis(
 
     # Tornado chart for NPC
     if tornado:
-        sorted_vars = sorted(
-            tornado.items(),
-            key=lambda x: x[1].get("npc_spread", 0),
-            reverse=True,
+        # Widest spread first; a missing (None / NaN) spread sorts last.
+        names = list(tornado)
+        spreads = np.array(
+            [tornado[name].get("npc_spread") for name in names], dtype=float,
         )
+        order = np.argsort(
+            -np.nan_to_num(spreads, nan=-np.inf), kind="stable",
+        )
+        sorted_vars = [(names[i], tornado[names[i]]) for i in order]
         labels: list[str] = []
         low_vals: list[float] = []
         high_vals: list[float] = []
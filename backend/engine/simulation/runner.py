@@ -308,8 +308,7 @@ def _dispatch_combined(
     soc_threshold = 0.30
 
     if battery is not None:
-        state = battery.get_state()
-        soc = state["soc"]
+        soc = battery.soc
     else:
         soc = 1.0  # no battery -- behave as load following
 
@@ -799,12 +798,10 @@ class SimulationRunner:
 
             # Recompute fuel consumption from generator output.
             if generator is not None:
-                for h in range(n):
-                    if ts_generator_kw[h] > 0:
-                        ts_generator_fuel_l[h] = (
-                            generator.fuel_curve.a0 * generator.rated_power_kw
-                            + generator.fuel_curve.a1 * ts_generator_kw[h]
-                        )
+                gen_on = ts_generator_kw > 0
+                ts_generator_fuel_l[gen_on] = generator.fuel_curve.consumption_array(
+                    ts_generator_kw[gen_on], generator.rated_power_kw
+                )
 
             # Recompute grid costs from tariff.
             if grid is not None:
@@ -825,9 +822,11 @@ class SimulationRunner:
             # Report progress every ~10 % through the dispatch loop.
             progress_interval = n // 10
 
+            net_load_kw = np.subtract(self.load_kw, re_output)
+
             for h in range(n):
                 month = _hour_to_month(h)
-                net_load = self.load_kw[h] - re_output[h]
+                net_load = float(net_load_kw[h])
 
                 step_result = dispatch_fn(
                     net_load=net_load,
@@ -856,8 +855,7 @@ class SimulationRunner:
 
                 # Track battery SOC.
                 if battery is not None:
-                    state = battery.get_state()
-                    ts_battery_soc[h] = state["soc"]
+                    ts_battery_soc[h] = battery.soc
 
                 # Periodic progress update.
                 if progress_interval > 0 and h % progress_interval == 0 and h > 0:
@@ -922,7 +920,7 @@ class SimulationRunner:
                 "total_import_kwh": grid.total_import_kwh,
                 "total_export_kwh": grid.total_export_kwh,
                 "net_cost": grid.net_cost(),
-                "monthly_peaks": list(grid.monthly_peaks),
+                "monthly_peaks": grid.monthly_peaks.tolist(),
             }
 
         # ==============================================================
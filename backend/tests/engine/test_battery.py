@@ -0,0 +1,68 @@
+"""Tests for battery engine modules: soc_tracker, degradation, kibam."""
+import numpy as np
+import pytest
+
+from engine.battery.degradation import rainflow_count, wohler_degradation
+from engine.battery.kibam import KiBaMModel
+from engine.battery.soc_tracker import SOCTracker
+
+
+class TestSOCTrackerSeries:
+    def test_matches_scalar_steps(self):
+        powers = np.array([20.0, -35.0, 0.0, 80.0, -120.0, 10.0])
+        scalar = SOCTracker(capacity_kwh=100.0)
+        expected = [scalar.step(p) for p in powers]
+
+        series = SOCTracker(capacity_kwh=100.0)
+        actual, soc = series.step_series(powers)
+        np.testing.assert_allclose(actual, [e[0] for e in expected])
+        np.testing.assert_allclose(soc, [e[1] for e in expected])
+
+    def test_float32_output(self):
+        tracker = SOCTracker(capacity_kwh=100.0)
+        actual, soc = tracker.step_series(np.full(24, -5.0), dtype=np.float32)
+        assert actual.dtype == np.float32
+        assert soc.dtype == np.float32
+        assert soc[-1] < 0.5
+
+
+class TestRainflow:
+    def test_float32_matches_float64(self):
+        rng = np.random.default_rng(7)
+        soc = 0.5 + 0.4 * np.sin(np.linspace(0, 40 * np.pi, 2000)) * rng.random(2000)
+        c64 = rainflow_count(soc)
+        c32 = rainflow_count(soc, dtype=np.float32)
+        assert len(c64) == len(c32)
+        d64 = wohler_degradation(c64, cycle_life=5000)
+        d32 = wohler_degradation(c32, cycle_life=5000, dtype=np.float32)
+        assert d32 == pytest.approx(d64, rel=1e-4)
+
+    def test_single_full_cycle(self):
+        cycles = rainflow_count([0.5, 0.9, 0.5, 0.9, 0.5])
+        assert sum(count for _depth, count in cycles) >= 1.0
+
+    def test_no_cycles_no_damage(self):
+        assert wohler_degradation([], cycle_life=5000) == 0.0
+
+
+class TestKiBaM:
+    def test_steady_state_branch_is_continuous(self):
+        model = KiBaMModel(q_max=100.0, c=0.7, k=0.5)
+        # k*t straddles the steady-state cutoff of 30.
+        below = model.available_capacity(discharge_rate=1.0, duration=59.9)
+        above = model.available_capacity(discharge_rate=1.0, duration=60.1)
+        assert above == pytest.approx(below, rel=1e-2)
+
+    def test_long_discharge_limited_by_q_max(self):
+        model = KiBaMModel(q_max=100.0, c=0.7, k=0.5)
+        assert model.available_capacity(discharge_rate=50.0, duration=100.0) <= 100.0
+
+
+class TestBatterySystemSoc:
+    def test_soc_property_matches_state(self):
+        from engine.battery.battery_system import BatterySystem
+
+        battery = BatterySystem(capacity_kwh=100.0, max_charge_kw=40.0, max_discharge_kw=40.0)
+        battery.charge(30.0)
+        battery.discharge(10.0)
+        assert battery.soc == battery.get_state()["soc"]
@@ -155,6 +155,181 @@ class TestEnergyBalance:
             assert np.all(results[key] >= -0.01), f"{key} has negative values"
 
 
+# ======================================================================
+# engine.dispatch rule-based strategies
+# ======================================================================
+
+
+def _dispatch_components():
+    """Fresh battery, generator and grid objects for engine.dispatch tests."""
+    from engine.battery.battery_system import BatterySystem
+    from engine.generator.diesel_generator import DieselGenerator
+    from engine.grid.grid_connection import GridConnection
+
+    battery = BatterySystem(capacity_kwh=100.0, max_charge_kw=40.0, max_discharge_kw=40.0)
+    generator = DieselGenerator(rated_power_kw=20.0)
+    grid = GridConnection(max_import_kw=10.0, max_export_kw=10.0)
+    return battery, generator, grid
+
+
+def _dispatch_inputs() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(3)
+    hod = np.arange(HOURS_PER_YEAR) % 24
+    load = 15.0 + 10.0 * rng.random(HOURS_PER_YEAR)
+    re = np.clip(50.0 * np.sin(np.pi * (hod - 6) / 12), 0.0, None) * rng.random(HOURS_PER_YEAR)
+    return load, re
+
+
+class TestRuleBasedStrategies:
+    """Tests for engine.dispatch load-following / cycle-charging / combined."""
+
+    @pytest.mark.parametrize(
+        "name", ["dispatch_load_following", "dispatch_cycle_charging", "dispatch_combined"]
+    )
+    def test_hourly_energy_balance(self, name):
+        import engine.dispatch as dispatch
+
+        load, re = _dispatch_inputs()
+        battery, generator, grid = _dispatch_components()
+        r = getattr(dispatch, name)(load, re, battery, generator, grid)
+
+        supply = re + r["generator_output"] + r["grid_import"] + r["battery_power"] + r["unmet"]
+        demand = load + r["grid_export"] + r["excess"]
+        # Generator output forced up to its minimum load is not booked as
+        # excess, so supply may exceed demand but never fall short.
+        assert np.all(supply >= demand - 1e-9)
+
+    @pytest.mark.parametrize(
+        "name", ["dispatch_load_following", "dispatch_cycle_charging", "dispatch_combined"]
+    )
+    def test_component_accumulators_match_series(self, name):
+        import engine.dispatch as dispatch
+
+        load, re = _dispatch_inputs()
+        battery, generator, grid = _dispatch_components()
+        r = getattr(dispatch, name)(load, re, battery, generator, grid)
+
+        assert grid.total_import_kwh == pytest.approx(r["grid_import"].sum())
+        assert grid.total_export_kwh == pytest.approx(r["grid_export"].sum())
+        assert generator.running_hours == np.count_nonzero(r["generator_output"])
+        assert battery.get_state()["soc"] == r["battery_soc"][-1]
+        assert battery.get_state()["throughput_kwh"] == pytest.approx(
+            np.abs(r["battery_power"]).sum()
+        )
+
+    def test_warm_up_compiles_every_dispatch_signature(self):
+        pytest.importorskip("numba")
+        from engine.dispatch import dispatch_cycle_charging, warm_up
+        from engine.dispatch._kernel import _specialised_kernel
+
+        warm_up()
+        kernel = _specialised_kernel(True, True, True)
+        compiled = set(kernel.signatures)
+        load, re = _dispatch_inputs()
+        dispatch_cycle_charging(load, re, *_dispatch_components())
+        assert set(kernel.signatures) == compiled
+
+    def test_combined_without_battery_is_load_following(self):
+        from engine.dispatch import dispatch_combined, dispatch_load_following
+
+        load, re = _dispatch_inputs()
+        _, generator, grid = _dispatch_components()
+        combined = dispatch_combined(load, re, None, generator, grid)
+        _, generator, grid = _dispatch_components()
+        lf = dispatch_load_following(load, re, None, generator, grid)
+
+        assert not combined["dispatch_mode"].any()
+        for key, values in lf.items():
+            np.testing.assert_array_equal(combined[key], values)
+
+    def test_grid_only_limits_and_balance(self):
+        from engine.dispatch import dispatch_load_following
+
+        load, re = _dispatch_inputs()
+        _, _, grid = _dispatch_components()
+        r = dispatch_load_following(load, re, None, None, grid)
+
+        assert r["grid_import"].max() <= grid.max_import_kw
+        assert r["grid_export"].max() <= grid.max_export_kw
+        np.testing.assert_allclose(
+            re + r["grid_import"] + r["unmet"], load + r["grid_export"] + r["excess"]
+        )
+        assert grid.total_import_kwh == pytest.approx(r["grid_import"].sum())
+        assert max(grid.monthly_peaks) == r["grid_import"].max()
+
+    def test_float32_inputs_match_float64(self):
+        from engine.dispatch import dispatch_load_following
+
+        load, re = _dispatch_inputs()
+        load32, re32 = load.astype(np.float32), re.astype(np.float32)
+        r32 = dispatch_load_following(load32, re32, *_dispatch_components())
+        r64 = dispatch_load_following(
+            load32.astype(np.float64), re32.astype(np.float64), *_dispatch_components()
+        )
+        for key, values in r64.items():
+            np.testing.assert_array_equal(r32[key], values)
+
+    def test_non_finite_input_raises(self):
+        from engine.dispatch import dispatch_load_following
+
+        load, re = _dispatch_inputs()
+        load[100] = np.nan
+        with pytest.raises(ValueError, match="finite"):
+            dispatch_load_following(load, re, *_dispatch_components())
+
+    def test_combined_dispatch_mode_is_int8(self):
+        from engine.dispatch import dispatch_combined
+        from engine.dispatch.combined import _Mode
+
+        load, re = _dispatch_inputs()
+        battery, generator, grid = _dispatch_components()
+        r = dispatch_combined(load, re, battery, generator, grid)
+
+        assert r["dispatch_mode"].dtype == np.int8
+        assert set(np.unique(r["dispatch_mode"])) <= {
+            _Mode.LOAD_FOLLOWING, _Mode.CYCLE_CHARGING
+        }
+
+
+class TestBatchDispatch:
+    """Tests for the parallel ``*_batch`` dispatch helpers."""
+
+    def test_batch_matches_individual_runs(self):
+        from engine.dispatch import dispatch_combined, dispatch_combined_batch
+
+        load, re = _dispatch_inputs()
+        loads = np.stack([load, 0.5 * load, 1.5 * load])
+        battery, generator, grid = _dispatch_components()
+        batch = dispatch_combined_batch(loads, re, battery, generator, grid, max_workers=2)
+
+        assert len(batch) == 3
+        for row, scenario in zip(loads, batch):
+            b, g, r = _dispatch_components()
+            expected = dispatch_combined(row, re, b, g, r)
+            for key, values in expected.items():
+                np.testing.assert_array_equal(scenario.results[key], values)
+            assert scenario.generator.fuel_consumed_total == g.fuel_consumed_total
+            assert scenario.grid.total_import_kwh == r.total_import_kwh
+
+    def test_templates_are_not_mutated(self):
+        from engine.dispatch import dispatch_load_following_batch
+
+        load, re = _dispatch_inputs()
+        battery, generator, grid = _dispatch_components()
+        soc_before = battery.soc
+        dispatch_load_following_batch(np.stack([load, load]), re, battery, generator, grid)
+
+        assert battery.soc == soc_before
+        assert generator.running_hours == 0
+        assert grid.total_import_kwh == 0.0
+
+    def test_mismatched_shapes_raise(self):
+        from engine.dispatch import dispatch_load_following_batch
+
+        with pytest.raises(ValueError, match="cannot be broadcast"):
+            dispatch_load_following_batch(np.ones((2, 8760)), np.ones((3, 8760)))
+
+
 # ======================================================================
 # Error handling
 # ======================================================================
@@ -268,3 +443,139 @@ class TestOptimalDispatch:
         assert gen_kwh < total_load * 0.5, (
             f"Generator produced {gen_kwh:.0f} kWh — too much given RE={float(np.sum(re)):.0f}"
         )
+
+    def test_expensive_generator_still_serves_load(self):
+        """The unmet penalty scales with costs, so dear fuel never sheds load."""
+        from engine.dispatch.optimal import dispatch_optimal
+
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        re = np.zeros(HOURS_PER_YEAR)
+        gen_cfg = {"rated_power_kw": 20, "fuel_price": 50.0}
+        result = dispatch_optimal(load, re, None, gen_cfg)
+
+        assert float(np.sum(result["unmet"])) < 1e-6
+        np.testing.assert_allclose(result["generator_output"], load, atol=1e-6)
+
+    def test_reused_model_and_warm_start_match_fresh_solve(self):
+        """Cached-model re-solves and warm starts reach the same optimum."""
+        from engine.dispatch.optimal import _LP_CACHE, dispatch_optimal
+
+        hours = np.arange(HOURS_PER_YEAR) % 24
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        re = np.where((hours >= 8) & (hours < 16), 18.0, 0.0)
+        battery_cfg = {"capacity_kwh": 60, "max_charge_kw": 20, "max_discharge_kw": 20}
+
+        def solve(fuel_price, **kwargs):
+            gen_cfg = {"rated_power_kw": 15, "fuel_price": fuel_price}
+            return dispatch_optimal(load, re, battery_cfg, gen_cfg, **kwargs)
+
+        _LP_CACHE.clear()
+        first = solve(1.2, reuse_model=True)
+        reused = solve(1.5, reuse_model=True)
+        _LP_CACHE.clear()
+        fresh = solve(1.5)
+        warm = solve(1.5, warm_start_from=first)
+        greedy = solve(1.5, warm_start_from="heuristic")
+
+        expected = fresh["objective_value"][0]
+        assert reused["objective_value"][0] == pytest.approx(expected, rel=1e-9)
+        assert warm["objective_value"][0] == pytest.approx(expected, rel=1e-9)
+        assert greedy["objective_value"][0] == pytest.approx(expected, rel=1e-9)
+        assert first["objective_value"][0] < expected
+
+    def test_default_solve_does_not_depend_on_earlier_solves(self):
+        """Without reuse_model the hourly series depend only on the inputs."""
+        from engine.dispatch.optimal import _LP_CACHE, dispatch_optimal
+        from engine.grid.tariff import FlatTariff
+
+        hours = np.arange(HOURS_PER_YEAR) % 24
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        re = np.where((hours >= 8) & (hours < 16), 18.0, 0.0)
+        battery_cfg = {"capacity_kwh": 60, "max_charge_kw": 20, "max_discharge_kw": 20}
+        grid_cfg = {"max_import_kw": 30.0, "max_export_kw": 10.0,
+                    "tariff": FlatTariff(0.2, 0.05)}
+
+        def solve(load_kw, fuel_price):
+            gen_cfg = {"rated_power_kw": 15, "fuel_price": fuel_price}
+            return dispatch_optimal(load_kw, re, battery_cfg, gen_cfg, grid_cfg)
+
+        _LP_CACHE.clear()
+        before = solve(load, 1.2)
+        solve(load * 1.3, 2.5)
+        after = solve(load, 1.2)
+
+        assert len(_LP_CACHE._entries) == 0
+        for key, series in before.items():
+            np.testing.assert_array_equal(after[key], series, err_msg=key)
+
+    def test_lean_formulation_matches_full(self):
+        """The lean LP reaches the same optimum and still balances energy."""
+        from engine.dispatch.optimal import dispatch_optimal
+        from engine.grid.tariff import FlatTariff
+
+        hours = np.arange(HOURS_PER_YEAR) % 24
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        re = np.where((hours >= 8) & (hours < 16), 25.0, 0.0)
+        battery_cfg = {"capacity_kwh": 40, "max_charge_kw": 20, "max_discharge_kw": 20}
+        grid_cfg = {"max_import_kw": 8.0, "max_export_kw": 5.0, "tariff": FlatTariff(0.2, 0.05)}
+
+        full = dispatch_optimal(load, re, battery_cfg, None, grid_cfg)
+        lean = dispatch_optimal(
+            load, re, battery_cfg, None, grid_cfg, lean_formulation=True,
+        )
+
+        assert lean["objective_value"][0] == pytest.approx(full["objective_value"][0], rel=1e-9)
+        supply = re + lean["battery_discharge"] + lean["grid_import"] + lean["unmet"]
+        demand = load + lean["battery_charge"] + lean["grid_export"] + lean["excess"]
+        np.testing.assert_allclose(supply, demand, atol=1e-6)
+        assert lean["excess"].sum() > 0
+
+    def test_absent_components_have_no_columns(self):
+        """Only generator, excess and unmet columns exist for a gen-only system."""
+        from engine.dispatch.optimal import (
+            _build_lp,
+            _extract_generator_params,
+            dispatch_optimal,
+        )
+
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        gen = _extract_generator_params({"rated_power_kw": 15})
+        arrays = _build_lp(load, np.zeros(HOURS_PER_YEAR), None, gen, None)
+        assert arrays.n_vars == 3 * HOURS_PER_YEAR
+        assert arrays.n_rows == HOURS_PER_YEAR
+
+        result = dispatch_optimal(load, np.zeros(HOURS_PER_YEAR), None, gen)
+        np.testing.assert_allclose(result["generator_output"], load, atol=1e-6)
+        assert not result["battery_charge"].any()
+        assert not result["grid_import"].any()
+
+    def test_invalid_options_raise(self):
+        from engine.dispatch.optimal import dispatch_optimal
+
+        load = np.full(HOURS_PER_YEAR, 10.0)
+        with pytest.raises(ValueError, match="no_such_option"):
+            dispatch_optimal(load, load, solver_options={"no_such_option": 1})
+        with pytest.raises(ValueError, match="warm_start_from"):
+            dispatch_optimal(load, load, warm_start_from="greedy")
+
+    def test_params_dataclasses_match_config_dicts(self):
+        from engine.dispatch.optimal import (
+            BatteryParams,
+            GeneratorParams,
+            _extract_battery_params,
+            _extract_generator_params,
+        )
+
+        batt = BatteryParams(capacity_kwh=80.0, efficiency=0.81, min_soc=0.2)
+        assert batt == _extract_battery_params(
+            {"capacity_kwh": 80, "efficiency": 0.81, "min_soc": 0.2}
+        )
+        assert batt.one_way_eff == pytest.approx(0.9)
+        assert batt.min_soc_kwh == pytest.approx(16.0)
+        assert _extract_battery_params(batt) is batt
+
+        gen = GeneratorParams(rated_power_kw=20.0, fuel_price=1.5)
+        assert gen == _extract_generator_params({"rated_power_kw": 20, "fuel_price": 1.5})
+        assert gen.cost_per_kw == pytest.approx(0.0845 * 1.5 + 5.0 / 20.0 + 0.246 * 1.5)
+        with pytest.raises(AttributeError):
+            gen.fuel_price = 2.0
@@ -1,4 +1,4 @@
-"""Tests for engine.economics.metrics — NPC, LCOE, IRR, payback."""
+"""Tests for engine.economics — NPC, LCOE, IRR, payback, sensitivity."""
 
 from __future__ import annotations
 
@@ -13,10 +13,17 @@ from engine.economics.metrics import (
     _battery_replacement_cost,
     _battery_replacement_years,
     _capital_costs,
+    _compute_irr,
     _discount_factor,
+    _growing_annuity_factor,
     _om_annual,
     _annual_fuel_cost,
     compute_economics,
+    compute_npc_lcoe_batch,
+)
+from engine.economics.sensitivity import (
+    sensitivity_analysis,
+    sensitivity_analysis_stream,
 )
 
 
@@ -66,6 +73,34 @@ class TestAnnuityFactor:
         af = _annuity_factor(0.10, 1)
         assert abs(af - 1.0 / 1.10) < 1e-10
 
+    def test_matches_sum_of_discount_factors(self):
+        """Closed form equals the explicit sum, including tiny rates."""
+        for rate in (1e-9, 0.03, 0.08):
+            expected = sum(_discount_factor(rate, y) for y in range(1, 31))
+            assert _annuity_factor(rate, 30) == pytest.approx(expected, rel=1e-12)
+
+
+class TestGrowingAnnuityFactor:
+    """Tests for _growing_annuity_factor()."""
+
+    def test_matches_explicit_sum(self):
+        for rate, growth in [(0.08, 0.03), (0.05, 0.10), (0.0, 0.02), (0.06, 0.06 + 1e-12)]:
+            expected = sum(
+                (1 + growth) ** (y - 1) * _discount_factor(rate, y) for y in range(1, 26)
+            )
+            assert _growing_annuity_factor(rate, growth, 25) == pytest.approx(
+                expected, rel=1e-12
+            )
+
+    def test_growth_equal_to_rate(self):
+        """Escalation equal to the discount rate: N / (1 + r)."""
+        assert _growing_annuity_factor(0.07, 0.07, 20) == pytest.approx(20 / 1.07)
+
+    def test_no_growth_is_plain_annuity(self):
+        assert _growing_annuity_factor(0.08, 0.0, 25) == pytest.approx(
+            _annuity_factor(0.08, 25), rel=1e-14
+        )
+
 
 # ======================================================================
 # Capital costs
@@ -255,3 +290,289 @@ class TestComputeEconomics:
         components = {"solar_pv": {"capital_cost": 10_000}}
         econ = compute_economics(results, components, lifetime_years=20)
         assert len(econ["annual_costs"]) == 21  # years 0-20
+
+
+
+class TestComputeNpcLcoeBatch:
+    """Tests for compute_npc_lcoe_batch()."""
+
+    def test_matches_compute_economics(self):
+        """Each batch entry agrees with a full compute_economics() call."""
+        systems = [
+            (0.08, {"solar_pv": {"capital_cost": 50_000, "om_cost_annual": 500}}),
+            (0.0, {"solar_pv": {"capital_cost": 20_000, "lifetime_years": 30}}),
+            (0.06, {
+                "battery": {"capital_cost_per_kwh": 300, "capacity_kwh": 100,
+                            "cycle_life": 2000, "lifetime_years": 10},
+                "diesel_generator": {"capital_cost": 15_000, "om_cost_annual": 800,
+                                     "fuel_price": 1.1, "fuel_escalation": 0.03},
+            }),
+        ]
+        results = {
+            "load_kw": np.full(8760, 12.0),
+            "total_fuel_l": 4_000.0,
+            "grid_import_cost": 1_500.0,
+            "grid_export_revenue": 200.0,
+        }
+        econs = [
+            compute_economics(results, comps, lifetime_years=25, discount_rate=r)
+            for r, comps in systems
+        ]
+        breakdowns = [e["cost_breakdown"] for e in econs]
+        intervals = [(b["replacement_years"] or [0])[0] for b in breakdowns]
+        npc, lcoe = compute_npc_lcoe_batch(
+            capital=[b["capital_total"] for b in breakdowns],
+            om_annual=[sum(b["om_annual"].values()) for b in breakdowns],
+            fuel_annual=[b["fuel_annual"] for b in breakdowns],
+            grid_annual=[b["grid_annual"] for b in breakdowns],
+            annual_load_kwh=12.0 * 8760,
+            lifetime_years=25,
+            discount_rate=[r for r, _ in systems],
+            fuel_escalation=[0.0, 0.0, 0.03],
+            replacement_cost=[b["replacement_cost_each"] for b in breakdowns],
+            replacement_interval=intervals,
+            salvage=[b["salvage_value"] for b in breakdowns],
+        )
+        assert intervals[2] > 0
+        np.testing.assert_allclose(npc, [e["npc"] for e in econs], rtol=1e-12)
+        np.testing.assert_allclose(lcoe, [e["lcoe"] for e in econs], rtol=1e-12)
+
+    def test_zero_load_lcoe_zero(self):
+        npc, lcoe = compute_npc_lcoe_batch([10_000.0, 5_000.0], 0.0, 0.0, 0.0, 0.0)
+        np.testing.assert_array_equal(lcoe, [0.0, 0.0])
+        assert np.all(npc > 0)
+
+
+class TestComputeIRR:
+    """Tests for _compute_irr()."""
+
+    def test_single_period(self):
+        assert _compute_irr([-100.0, 110.0]) == pytest.approx(0.10, abs=1e-8)
+
+    def test_annuity_matches_annuity_factor(self):
+        """IRR of a level annuity is the rate whose annuity factor fits."""
+        irr = _compute_irr([-100_000.0] + [12_000.0] * 20)
+        assert 100_000.0 == pytest.approx(12_000.0 * _annuity_factor(irr, 20), rel=1e-7)
+
+    def test_no_root(self):
+        assert _compute_irr([100.0, 50.0, 20.0]) is None
+
+
+# ======================================================================
+# Sensitivity analysis
+# ======================================================================
+
+
+def _fuel_cost_run(params: dict) -> dict:
+    """Toy run_fn: NPC linear in fuel price (module-level, so picklable)."""
+    price = params["components"]["diesel_generator"]["fuel_price"]
+    npc = 1000.0 * price + float(np.sum(params["load_kw"]))
+    return {"npc": npc, "lcoe": npc / 1e4, "irr": None}
+
+
+class TestSensitivityAnalysis:
+    """Tests for sensitivity_analysis()."""
+
+    @staticmethod
+    def _base_params() -> dict:
+        return {
+            "components": {"diesel_generator": {"fuel_price": 1.2}},
+            "project": {"lifetime_years": 25, "discount_rate": 0.08},
+            "dispatch_strategy": "load_following",
+            "weather": {},
+            "load_kw": np.full(8760, 1.0),
+        }
+
+    def test_spider_and_tornado(self):
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 2.0],
+            "points": 3,
+        }]
+        out = sensitivity_analysis(self._base_params(), variables, _fuel_cost_run)
+
+        assert out["base_results"]["npc"] == pytest.approx(1200.0 + 8760.0)
+        assert [p["value"] for p in out["spider"]["Fuel Price"]] == [1.0, 1.5, 2.0]
+        tornado = out["tornado"]["Fuel Price"]
+        assert tornado["npc_spread"] == pytest.approx(1000.0)
+
+    def test_process_pool_matches_serial(self):
+        base = self._base_params()
+        variables = [
+            {
+                "name": "Fuel Price",
+                "param_path": "components.diesel_generator.fuel_price",
+                "range": [0.8, 2.0],
+                "points": 4,
+            },
+            {
+                "name": "Discount Rate",
+                "param_path": "project.discount_rate",
+                "range": [0.05, 0.10],
+                "points": 2,
+            },
+        ]
+        serial = sensitivity_analysis(base, variables, _fuel_cost_run)
+        parallel = sensitivity_analysis(base, variables, _fuel_cost_run, max_workers=2)
+        assert parallel == serial
+        assert base["components"]["diesel_generator"]["fuel_price"] == 1.2
+
+    def test_base_value_points_reuse_base_case(self):
+        calls = []
+
+        def run_fn(params: dict) -> dict:
+            calls.append(params["components"]["diesel_generator"]["fuel_price"])
+            return _fuel_cost_run(params)
+
+        variables = [
+            {
+                "name": "Fuel Price",
+                "param_path": "components.diesel_generator.fuel_price",
+                "range": [1.0, 1.4],
+                "points": 3,
+            },
+            {
+                "name": "Fuel Price (repeat)",
+                "param_path": "components.diesel_generator.fuel_price",
+                "range": [1.0, 1.4],
+                "points": 3,
+            },
+        ]
+        out = sensitivity_analysis(self._base_params(), variables, run_fn)
+
+        # Base case, then 1.0 and 1.4 once each; 1.2 is the base value.
+        assert calls == [1.2, 1.0, 1.4]
+        spider = out["spider"]["Fuel Price"]
+        assert spider[1]["value"] == pytest.approx(1.2)
+        assert spider[1]["npc"] == out["base_results"]["npc"]
+        assert out["spider"]["Fuel Price (repeat)"] == spider
+
+    def test_base_case_with_extra_keys_is_not_reused(self):
+        """Base-value points are swept like their neighbours, not reused."""
+        seen = []
+
+        def run_fn(params: dict) -> dict:
+            seen.append(params)
+            out = _fuel_cost_run(params)
+            # The extra key shifts NPC, as any caller-specific input may.
+            out["npc"] += params.get("extra", 0.0)
+            return out
+
+        base = self._base_params()
+        base["extra"] = 500.0
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 1.4],
+            "points": 3,
+        }]
+        out = sensitivity_analysis(base, variables, run_fn)
+
+        assert len(seen) == 4
+        spider = out["spider"]["Fuel Price"]
+        assert spider[1]["value"] == pytest.approx(1.2)
+        assert "extra" not in seen[2]
+        assert spider[1]["npc"] == pytest.approx(1200.0 + 8760.0)
+        assert out["base_results"]["npc"] == pytest.approx(1200.0 + 8760.0 + 500.0)
+
+    def test_cache_skips_repeat_evaluations(self):
+        calls = []
+
+        def run_fn(params: dict) -> dict:
+            calls.append(params["components"]["diesel_generator"]["fuel_price"])
+            return _fuel_cost_run(params)
+
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 2.0],
+            "points": 3,
+        }]
+        cache: dict = {}
+        first = sensitivity_analysis(self._base_params(), variables, run_fn, cache=cache)
+        assert len(calls) == 4
+
+        variables[0]["range"] = [1.5, 2.5]
+        second = sensitivity_analysis(self._base_params(), variables, run_fn, cache=cache)
+        # Only the new 2.5 point is evaluated.
+        assert calls[4:] == [2.5]
+        assert second["base_results"] == first["base_results"]
+        assert second["spider"]["Fuel Price"][0] == first["spider"]["Fuel Price"][1]
+
+    def test_sweep_points_share_unvaried_branches(self):
+        seen = []
+
+        def run_fn(params: dict) -> dict:
+            seen.append(params)
+            return _fuel_cost_run(params)
+
+        base = self._base_params()
+        base["components"]["solar_pv"] = {"capacity_kw": 10.0}
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 2.0],
+            "points": 2,
+        }]
+        sensitivity_analysis(base, variables, run_fn)
+
+        swept = seen[1]
+        assert swept["components"]["diesel_generator"]["fuel_price"] == 1.0
+        assert swept["components"]["solar_pv"] is base["components"]["solar_pv"]
+        assert swept["project"] is base["project"]
+        assert base["components"]["diesel_generator"]["fuel_price"] == 1.2
+
+    def test_stream_yields_points_in_order(self):
+        seen = []
+
+        def run_fn(params: dict) -> dict:
+            seen.append(params["components"]["diesel_generator"]["fuel_price"])
+            return _fuel_cost_run(params)
+
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 2.0],
+            "points": 3,
+        }]
+        stream = sensitivity_analysis_stream(self._base_params(), variables, run_fn)
+
+        first = next(stream)
+        assert first["event"] == "base"
+        assert first["metrics"]["npc"] == pytest.approx(1200.0 + 8760.0)
+        # Nothing beyond the base case has been evaluated yet.
+        assert seen == [1.2]
+
+        events = list(stream)
+        assert [e["event"] for e in events] == ["sweep"] * 3 + ["tornado"]
+        assert [e["value"] for e in events[:3]] == [1.0, 1.5, 2.0]
+        assert events[-1]["tornado"]["npc_spread"] == pytest.approx(1000.0)
+
+        out = sensitivity_analysis(self._base_params(), variables, _fuel_cost_run)
+        assert events[-1]["tornado"] == out["tornado"]["Fuel Price"]
+        assert [
+            {"value": e["value"], **e["metrics"]} for e in events[:3]
+        ] == out["spider"]["Fuel Price"]
+
+    def test_missing_metrics_are_nan(self):
+        def run_fn(params: dict) -> dict:
+            price = params["components"]["diesel_generator"]["fuel_price"]
+            out = _fuel_cost_run(params)
+            if price > 1.5:
+                del out["npc"]
+            return out
+
+        variables = [{
+            "name": "Fuel Price",
+            "param_path": "components.diesel_generator.fuel_price",
+            "range": [1.0, 2.0],
+            "points": 3,
+        }]
+        out = sensitivity_analysis(self._base_params(), variables, run_fn)
+
+        assert math.isnan(out["base_results"]["irr"])
+        assert math.isnan(out["base_results"]["payback_years"])
+        assert math.isnan(out["spider"]["Fuel Price"][-1]["npc"])
+        # A missing end is not mistaken for an NPC of zero.
+        assert math.isnan(out["tornado"]["Fuel Price"]["npc_spread"])
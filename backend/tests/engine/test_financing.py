@@ -1,6 +1,11 @@
 """Tests for financing module."""
 import pytest
-from engine.economics.financing import compute_wacc, loan_amortization, cashflow_projection
+from engine.economics.financing import (
+    cashflow_projection,
+    cashflow_projection_summary,
+    compute_wacc,
+    loan_amortization,
+)
 
 
 class TestComputeWACC:
@@ -120,3 +125,57 @@ class TestCashflowProjection:
         assert result["debt_amount"] == 0
         assert result["equity_amount"] == 100000
         assert result["loan_schedule"] == []
+
+    def test_yearly_entries_consistent(self):
+        cost_breakdown = {
+            "capital_total": 200000,
+            "om_annual": {"solar_pv": 1200, "battery": 800},
+            "fuel_annual": 3000,
+            "grid_annual": 500,
+            "replacement_years": [10, 20],
+            "replacement_cost_each": 25000,
+        }
+        result = cashflow_projection(
+            cost_breakdown=cost_breakdown,
+            lifetime_years=25,
+            discount_rate=0.08,
+            tax_rate=0.25,
+            annual_revenue=30000,
+        )
+        yearly = result["yearly_cashflows"]
+        assert [e["year"] for e in yearly] == list(range(26))
+        assert yearly[10]["replacement_cost"] == -25000
+        assert yearly[11]["replacement_cost"] == 0
+        assert yearly[11]["loan_payment"] == 0
+        for entry, sched in zip(yearly[1:], result["loan_schedule"]):
+            assert entry["loan_payment"] == -sched["payment"]
+            assert entry["tax_shield"] == round(sched["interest_payment"] * 0.25, 2)
+        running = 0.0
+        for entry in yearly:
+            running += entry["discounted_cashflow"]
+            assert entry["cumulative_discounted"] == pytest.approx(running, abs=0.5)
+
+    def test_summary_matches_full_projection(self):
+        cost_breakdown = {
+            "capital_total": 200000,
+            "om_annual": {"solar_pv": 1200},
+            "fuel_annual": 3000,
+            "grid_annual": 500,
+            "replacement_years": [10],
+            "replacement_cost_each": 25000,
+        }
+        kwargs = dict(
+            cost_breakdown=cost_breakdown,
+            lifetime_years=25,
+            discount_rate=0.08,
+            tax_rate=0.25,
+            annual_revenue=30000,
+        )
+        full = cashflow_projection(**kwargs)
+        summary = cashflow_projection_summary(**kwargs)
+        for key in ("wacc", "debt_amount", "equity_amount", "breakeven_year",
+                    "total_debt_service", "total_interest"):
+            assert summary[key] == full[key]
+        assert summary["npv"] == pytest.approx(
+            full["yearly_cashflows"][-1]["cumulative_discounted"], abs=0.01
+        )
@@ -0,0 +1,54 @@
+"""Tests for engine.generator — diesel generator and fuel curve."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from engine.generator.diesel_generator import DieselGenerator
+from engine.generator.fuel_curve import FuelCurve
+
+
+class TestFuelCurveArray:
+    """Tests for FuelCurve.consumption_array."""
+
+    def test_matches_scalar(self):
+        curve = FuelCurve()
+        power = np.array([0.0, 3.5, 12.0, 50.0, 50.02])
+        fuel = curve.consumption_array(power, 50.0)
+        for p, f in zip(power, fuel):
+            assert f == curve.consumption(p, 50.0)
+
+    def test_rejects_overload(self):
+        with pytest.raises(ValueError):
+            FuelCurve().consumption_array([10.0, 60.0], 50.0)
+
+
+class TestSimulateYear:
+    """Tests for DieselGenerator.simulate_year."""
+
+    @pytest.mark.parametrize("was_running", [False, True])
+    def test_matches_simulate_hour(self, was_running):
+        rng = np.random.default_rng(3)
+        request = rng.uniform(-20.0, 80.0, 500)
+        request[rng.random(500) < 0.3] = 0.0
+
+        hourly = DieselGenerator(rated_power_kw=60.0)
+        running = was_running
+        expected = []
+        for req in request:
+            out_kw, fuel_l, cost, running = hourly.simulate_hour(req, running)
+            expected.append((out_kw, fuel_l, cost, running))
+
+        batch = DieselGenerator(rated_power_kw=60.0)
+        out_kw, fuel_l, cost, is_running = batch.simulate_year(request, was_running)
+
+        exp_out, exp_fuel, exp_cost, exp_running = map(np.array, zip(*expected))
+        np.testing.assert_array_equal(out_kw, exp_out)
+        np.testing.assert_array_equal(fuel_l, exp_fuel)
+        np.testing.assert_array_equal(cost, exp_cost)
+        np.testing.assert_array_equal(is_running, exp_running)
+        assert batch.fuel_consumed_total == hourly.fuel_consumed_total
+        assert batch.running_hours == hourly.running_hours
+        assert batch.starts_count == hourly.starts_count
+        assert batch.is_running == hourly.is_running
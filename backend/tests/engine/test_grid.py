@@ -0,0 +1,164 @@
+"""Tests for engine.grid — grid connection and tariffs."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from engine.grid.grid_connection import GridConnection
+from engine.grid.tariff import DemandCharge, FlatTariff, TOUTariff
+
+
+def _tou_tariff() -> TOUTariff:
+    return TOUTariff(
+        schedule={
+            "peak": {"rate": 0.30, "sell_rate": 0.10, "hours": [17, 18, 19],
+                     "months": [1, 2, 12]},
+            "solar": {"rate": 0.05, "hours": list(range(10, 15)),
+                      "months": list(range(1, 13))},
+        }
+    )
+
+
+class TestPrecomputeTariffs:
+    """Tests for GridConnection.precompute_tariffs."""
+
+    @pytest.mark.parametrize("net_metering", [False, True])
+    @pytest.mark.parametrize("tariff", [FlatTariff(0.2, 0.07), _tou_tariff()])
+    def test_matches_scalar_prices(self, tariff, net_metering):
+        grid = GridConnection(tariff=tariff, net_metering=net_metering)
+        hours = np.tile(np.arange(24), 12)
+        months = np.repeat(np.arange(1, 13), 24)
+
+        import_price, export_price = grid.precompute_tariffs(hours, months)
+
+        for h, m, buy, sell in zip(hours, months, import_price, export_price):
+            assert buy == tariff.buy_price(h, m)
+            assert sell == (tariff.buy_price(h, m) if net_metering else tariff.sell_price(h, m))
+
+
+class TestPriceArrays:
+    """Tests for TariffBase.buy_price_array / sell_price_array."""
+
+    @pytest.mark.parametrize("tariff", [FlatTariff(0.2, 0.07), _tou_tariff()])
+    def test_matches_scalar_prices(self, tariff):
+        hours = np.tile(np.arange(24), 12)
+        months = np.repeat(np.arange(1, 13), 24)
+
+        buy = tariff.buy_price_array(hours, months)
+        sell = tariff.sell_price_array(hours, months)
+
+        assert buy.shape == sell.shape == hours.shape
+        for h, m, b, s in zip(hours, months, buy, sell):
+            assert b == tariff.buy_price(h, m)
+            assert s == tariff.sell_price(h, m)
+
+    @pytest.mark.parametrize("tariff", [_tou_tariff(), DemandCharge()])
+    @pytest.mark.parametrize("hour, month", [(0, 0), (24, 1), (-1, 6), (5, 13)])
+    def test_out_of_range_raises(self, tariff, hour, month):
+        with pytest.raises(ValueError, match="must be in"):
+            tariff.buy_price_array([0, hour], [1, month])
+        with pytest.raises(ValueError, match="must be in"):
+            tariff.sell_price_array([hour], [month])
+        grid = GridConnection(tariff=tariff)
+        with pytest.raises(ValueError, match="must be in"):
+            grid.precompute_tariffs([hour], [month])
+
+
+class TestBatchImportExport:
+    """Tests for GridConnection.import_power_batch / export_power_batch."""
+
+    @pytest.mark.parametrize("net_metering", [False, True])
+    @pytest.mark.parametrize("tariff", [FlatTariff(0.2, 0.07), _tou_tariff()])
+    def test_matches_per_hour_calls(self, tariff, net_metering):
+        rng = np.random.default_rng(5)
+        n = 2000
+        net = rng.uniform(-80.0, 80.0, n)
+        hours = np.arange(n) % 24
+        months = (np.arange(n) // 170) % 12 + 1
+
+        def make_grid() -> GridConnection:
+            return GridConnection(
+                max_import_kw=60.0, max_export_kw=40.0, tariff=tariff,
+                net_metering=net_metering, demand_charge=DemandCharge(),
+            )
+
+        hourly = make_grid()
+        expected = [
+            hourly.import_power(-x, int(h), int(m)) for x, h, m in zip(net, hours, months)
+        ]
+        expected_exp = [
+            hourly.export_power(x, int(h), int(m)) for x, h, m in zip(net, hours, months)
+        ]
+
+        batch = make_grid()
+        imported, cost = batch.import_power_batch(-net, hours, months)
+        exported, revenue = batch.export_power_batch(net, hours, months)
+
+        np.testing.assert_array_equal(imported, [e[0] for e in expected])
+        np.testing.assert_array_equal(cost, [e[1] for e in expected])
+        np.testing.assert_array_equal(exported, [e[0] for e in expected_exp])
+        np.testing.assert_array_equal(revenue, [e[1] for e in expected_exp])
+        assert batch.total_import_kwh == hourly.total_import_kwh
+        assert batch.total_export_kwh == hourly.total_export_kwh
+        # Imports and exports are interleaved hour by hour in the loop.
+        assert batch.total_cost == pytest.approx(hourly.total_cost, rel=1e-12)
+        assert list(batch.monthly_peaks) == list(hourly.monthly_peaks)
+        assert list(batch._monthly_import_kwh) == list(hourly._monthly_import_kwh)
+        assert list(batch._monthly_export_kwh) == list(hourly._monthly_export_kwh)
+        assert batch.total_demand_charges() == hourly.total_demand_charges()
+
+    def test_export_disabled(self):
+        grid = GridConnection(sell_back_enabled=False)
+        exported, revenue = grid.export_power_batch([5.0, 10.0], [0, 1], [1, 1])
+        np.testing.assert_array_equal(exported, [0.0, 0.0])
+        assert grid.total_export_kwh == 0.0
+
+
+class TestDemandCharge:
+    """Tests for DemandCharge peak tracking."""
+
+    def test_series_matches_scalar_records(self):
+        rng = np.random.default_rng(9)
+        power = rng.uniform(0.0, 50.0, 1000)
+        power[::97] = np.nan
+        months = rng.integers(1, 13, 1000)
+
+        scalar = DemandCharge(rate_per_kw_month=12.0)
+        for p, m in zip(power, months):
+            scalar.record_demand(float(p), int(m))
+        series = DemandCharge(rate_per_kw_month=12.0)
+        series.record_demand_series(power, months)
+
+        for month in range(1, 13):
+            assert series.monthly_charge(month) == scalar.monthly_charge(month)
+        assert series.total_annual_charge() == scalar.total_annual_charge()
+
+    def test_reset_clears_peaks(self):
+        charge = DemandCharge(rate_per_kw_month=10.0)
+        charge.record_demand(25.0, 3)
+        assert charge.monthly_charge(3) == 250.0
+        charge.reset()
+        assert charge.total_annual_charge() == 0.0
+
+
+class TestGridConnectionState:
+    """Tests for GridConnection equality and accumulator accessors."""
+
+    def test_equality_compares_accumulators(self):
+        assert GridConnection() == GridConnection()
+
+        a, b = GridConnection(), GridConnection()
+        a.import_power(10.0, 12, 3)
+        assert a != b
+        b.import_power(10.0, 12, 3)
+        assert a == b
+        assert GridConnection(max_import_kw=5.0) != GridConnection()
+
+    def test_net_metering_balance_is_float(self):
+        grid = GridConnection(net_metering=True)
+        grid.import_power(10.0, 12, 3)
+        grid.export_power(4.0, 13, 3)
+        balance = grid.net_metering_balance(3)
+        assert type(balance) is float
+        assert balance == pytest.approx(6.0)
@@ -7,8 +7,10 @@ import pytest
 
 from engine.load.load_model import (
     _PROFILES,
+    _base_profile,
     _day_to_month,
     generate_load_profile,
+    generate_load_profiles,
     scale_profile,
 )
 
@@ -112,6 +114,78 @@ class TestNoiseAndSeed:
         np.testing.assert_array_equal(p1, p2)
 
 
+    def test_cached_shape_is_not_modified(self):
+        """Generating profiles leaves the shared noise-free shape intact."""
+        shape = _base_profile("residential", False).copy()
+        generate_load_profile(10_000, "residential", noise_factor=0.2, seed=3)
+        generate_load_profile(10_000, "Residential", noise_factor=0.0)
+        np.testing.assert_array_equal(_base_profile("residential", False), shape)
+        assert not _base_profile("residential", False).flags.writeable
+
+
+class TestGenerateLoadProfiles:
+    """Tests for the batched generate_load_profiles()."""
+
+    def test_noise_free_rows_match_single_profiles(self):
+        """Without noise every row equals the single-profile result."""
+        targets = [10_000.0, 2_500.0, 0.0]
+        profiles = generate_load_profiles(
+            targets, "commercial", noise_factor=0.0, hemisphere="southern"
+        )
+        assert profiles.shape == (3, HOURS_PER_YEAR)
+        for row, target in zip(profiles, targets):
+            np.testing.assert_array_equal(
+                row,
+                generate_load_profile(
+                    target, "commercial", noise_factor=0.0, hemisphere="southern"
+                ),
+            )
+
+    def test_noisy_rows_hit_targets(self):
+        """Each noisy row sums to its own target; row 0 matches the seed."""
+        targets = np.array([10_000.0, 50_000.0, 1_234.0])
+        profiles = generate_load_profiles(targets, noise_factor=0.2, seed=7)
+        np.testing.assert_allclose(profiles.sum(axis=1), targets, rtol=1e-12)
+        assert np.all(profiles >= 0)
+        np.testing.assert_array_equal(
+            profiles[0], generate_load_profile(10_000.0, noise_factor=0.2, seed=7)
+        )
+        assert not np.allclose(profiles[1] / 5, profiles[0])
+
+    def test_noise_matches_single_draw(self):
+        """Blocked noise draws reproduce one (N, 8760) rng.normal draw."""
+        targets = np.full(130, 5_000.0)
+        profiles = generate_load_profiles(targets, noise_factor=0.1, seed=4)
+
+        base = generate_load_profiles([1.0], noise_factor=0.0)[0]
+        noise = np.random.default_rng(4).normal(1.0, 0.1, size=(130, HOURS_PER_YEAR))
+        expected = base * np.clip(noise, 0.1, 3.0)
+        expected *= (targets / expected.sum(axis=1))[:, None]
+        np.testing.assert_allclose(profiles, expected, rtol=1e-12)
+
+    def test_float32_batch(self):
+        """A float32 batch stays float32 and still hits each target."""
+        targets = np.array([10_000.0, 50_000.0])
+        profiles = generate_load_profiles(
+            targets, noise_factor=0.1, seed=3, dtype=np.float32
+        )
+        assert profiles.dtype == np.float32
+        np.testing.assert_allclose(
+            profiles.sum(axis=1, dtype=np.float64), targets, rtol=1e-6
+        )
+        assert np.all(profiles >= 0)
+
+    def test_invalid_inputs_raise(self):
+        with pytest.raises(ValueError, match="annual_kwhs must be >= 0"):
+            generate_load_profiles([100.0, -1.0])
+        with pytest.raises(ValueError, match="1-D"):
+            generate_load_profiles([[100.0]])
+        with pytest.raises(ValueError, match="Unknown profile_type"):
+            generate_load_profiles([100.0], "unknown_type")
+        with pytest.raises(ValueError, match="dtype must be"):
+            generate_load_profiles([100.0], dtype=np.int32)
+
+
 # ======================================================================
 # scale_profile
 # ======================================================================
@@ -133,6 +207,21 @@ class TestScaleProfile:
         scaled = scale_profile(base, target)
         assert abs(scaled.sum() - target) < 0.01
 
+    def test_out_scales_in_place(self):
+        """With out=base_profile the input itself is rescaled."""
+        base = np.random.default_rng(0).random(HOURS_PER_YEAR) + 0.1
+        expected = scale_profile(base, 15_000.0)
+        result = scale_profile(base, 15_000.0, out=base)
+        assert result is base
+        np.testing.assert_array_equal(base, expected)
+
+    def test_float32_profile_keeps_dtype(self):
+        """A float32 profile is summed in float64 and stays float32."""
+        base = (np.random.default_rng(1).random(HOURS_PER_YEAR) + 0.1).astype(np.float32)
+        scaled = scale_profile(base, 15_000.0)
+        assert scaled.dtype == np.float32
+        assert scaled.sum(dtype=np.float64) == pytest.approx(15_000.0, rel=1e-6)
+
     def test_wrong_length_raises(self):
         """Non-8760 array must raise ValueError."""
         with pytest.raises(ValueError, match="8760 elements"):
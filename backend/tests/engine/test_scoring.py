@@ -43,6 +43,17 @@ class TestNormalizeMetrics:
     def test_empty_input(self):
         assert normalize_metrics([]) == []
 
+    def test_infinite_value_treated_as_missing(self):
+        scenarios = [
+            {"payback_years": 4.0, "npc": 1.0, "simulation_id": "a"},
+            {"payback_years": float("inf"), "npc": 3.0, "simulation_id": "b"},
+            {"payback_years": 8.0, "npc": 2.0, "simulation_id": "c"},
+        ]
+        result = normalize_metrics(scenarios, ["payback_years", "npc"])
+        assert [r["payback_years"] for r in result] == pytest.approx([1.0, 0.0, 0.0])
+        assert [r["npc"] for r in result] == pytest.approx([1.0, 0.0, 0.5])
+        assert result[1]["simulation_id"] == "b"
+
 
 class TestScoreScenarios:
     def test_basic_ranking(self):
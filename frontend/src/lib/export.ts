@@ -123,7 +123,7 @@ export function exportSensitivityCSV(data: SensitivityResult, simId: string) {
   rows.push("", "tornado_variable,low_value,high_value,low_npc,high_npc,npc_spread,base_npc");
   for (const [varName, t] of Object.entries(data.tornado)) {
     rows.push(
-      `${varName},${t.low_value},${t.high_value},${t.low_npc ?? ""},${t.high_npc ?? ""},${t.npc_spread},${t.base_npc ?? ""}`
+      `${varName},${t.low_value},${t.high_value},${t.low_npc ?? ""},${t.high_npc ?? ""},${t.npc_spread ?? ""},${t.base_npc ?? ""}`
     );
   }
 
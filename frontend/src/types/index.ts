@@ -510,7 +510,7 @@ export interface SensitivityTornadoEntry {
   base_npc: number | null;
   base_lcoe: number | null;
   base_irr: number | null;
-  npc_spread: number;
+  npc_spread: number | null;
 }
 
 export interface SensitivityResult {